@@ -7,6 +7,7 @@ import os
 import requests
 import time
 from dotenv import load_dotenv
+from event_store import to_serializable
 
 # Carrega variáveis do arquivo .env
 load_dotenv()
@@ -150,7 +151,7 @@ class AIAnalyzer:
 
         messages = [
             {"role": "system", "content": "Você é um especialista em sistemas de QA."},
-            {"role": "user", "content": f"Analise as diferenças abaixo e explique o que pode estar errado ou mal preenchido:\n\n{json.dumps(differences, indent=2, ensure_ascii=False)}"}
+            {"role": "user", "content": f"Analise as diferenças abaixo e explique o que pode estar errado ou mal preenchido:\n\n{json.dumps(differences, indent=2, ensure_ascii=False, default=to_serializable)}"}
         ]
 
         try:
@@ -204,7 +205,7 @@ class AIAnalyzer:
              6. Uma conclusão sobre a qualidade geral das tags
 
              Dados de validação:
-             {json.dumps(analysis_request, indent=2, ensure_ascii=False)}
+             {json.dumps(analysis_request, indent=2, ensure_ascii=False, default=to_serializable)}
 
              Importante: Sua resposta deve ser em português. Se não houver problemas, faça uma análise positiva ressaltando a boa qualidade da implementação.
             """}
@@ -0,0 +1,332 @@
+"""
+Este arquivo contém a validação em lote de várias funcionalidades.
+Responsabilidades:
+- Localização das planilhas de um diretório e das capturas correspondentes em logs/eventos
+- Execução das validações em paralelo, em um pool de processos
+- Geração do resumo agregado do lote
+
+Cada par planilha/log é validado por TagValidator.process_files em um processo próprio,
+e os relatórios seguem a estrutura usual relatorio-validacoes/eventos/<funcionalidade>.
+Planilhas da mesma funcionalidade (e subfuncionalidade) têm os relatórios separados em
+um subdiretório com o nome de cada planilha.
+"""
+
+import argparse
+import glob
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from file_utils import FileHelper
+from tag_validator import DirectoryManager, EventComparator, FileHandler, TagValidator, get_validation_result
+
+# Timestamp no nome das capturas salvas por FileHelper.save_logs_to_directory (<nome>_AAAAMMDD_HHMMSS.csv)
+CAPTURE_TIMESTAMP = re.compile(r"_(\d{8}_\d{6})\.csv$")
+# Ícone exibido para cada resultado
+RESULT_ICONS = {"APROVADO": "✅", "REQUER ATENÇÃO": "⚠️", "REPROVADO": "❌"}
+
+
+def validate_pair(spreadsheet_path, log_path, options, report_name=None):
+    """
+    Valida um par planilha/log; executado em um processo do pool.
+
+    Args:
+        spreadsheet_path (str): Caminho da planilha CSV
+        log_path (str): Caminho do log CSV
+        options (dict): Argumentos repassados ao TagValidator
+        report_name (str): Subdiretório dos relatórios, quando outra planilha do lote
+            tem a mesma funcionalidade
+
+    Returns:
+        dict: Resumo da validação do par
+    """
+    validator = TagValidator(**options)
+    functionality, output_dir, dashboard_data, dashboard_path = validator.process_files(
+        spreadsheet_path, log_path, report_name=report_name
+    )
+    summary = dashboard_data["resumo"]
+    return {
+        "planilha": spreadsheet_path,
+        "log": log_path,
+        "funcionalidade": functionality,
+        "resultado": get_validation_result(summary),
+        "resumo": summary,
+        "diretorio": output_dir,
+        "dashboard": dashboard_path
+    }
+
+
+class BatchValidator:
+    """
+    Valida em paralelo todas as planilhas de um diretório contra as capturas salvas.
+    """
+
+    def __init__(self, logs_dir=None, max_workers=None, **options):
+        """
+        Inicializa o validador em lote.
+
+        Args:
+            logs_dir (str): Diretório de capturas (padrão: logs/eventos do projeto)
+            max_workers (int): Número máximo de processos (padrão: número de CPUs)
+            **options: Argumentos repassados ao TagValidator (one_to_one, partial_match, streaming, vectorized,
+                use_ai, use_cache, mirror_dirs, compact_reports, gzip_reports)
+        """
+        project_dir = os.path.dirname(os.path.abspath(__file__))
+        self.logs_dir = logs_dir or os.path.join(project_dir, "logs", "eventos")
+        self.summary_dir = os.path.join(project_dir, "relatorio-validacoes")
+        self.max_workers = max_workers
+        self.options = options
+
+    @staticmethod
+    def read_functionality(spreadsheet_path):
+        """
+        Lê a funcionalidade e a subfuncionalidade do primeiro evento da planilha.
+
+        Args:
+            spreadsheet_path (str): Caminho da planilha CSV
+
+        Returns:
+            tuple: (funcionalidade, subfuncionalidade), vazias se a planilha não tiver eventos
+        """
+        events = FileHandler.iter_events_from_csv(spreadsheet_path)
+        try:
+            first_event = next(events, None)
+        finally:
+            events.close()
+        if first_event is None:
+            return "", ""
+        norm_event = EventComparator.normalize_event(first_event)
+        return norm_event.get("FUNCIONALIDADE", ""), norm_event.get("SUBFUNCIONALIDADE", "")
+
+    @staticmethod
+    def _capture_time(file_path):
+        """
+        Retorna o momento da captura, lido do nome do arquivo.
+
+        A data de modificação não é confiável (empata ou muda de ordem após uma cópia ou
+        checkout); ela só é usada para arquivos sem timestamp no nome.
+
+        Args:
+            file_path (str): Caminho da captura
+
+        Returns:
+            str: Timestamp no formato AAAAMMDD_HHMMSS
+        """
+        match = CAPTURE_TIMESTAMP.search(os.path.basename(file_path))
+        if match:
+            return match.group(1)
+        return datetime.fromtimestamp(os.path.getmtime(file_path)).strftime("%Y%m%d_%H%M%S")
+
+    @staticmethod
+    def _latest_csv(directory, recursive=False):
+        """
+        Retorna o CSV mais recente de um diretório.
+
+        Args:
+            directory (str): Diretório a ser pesquisado
+            recursive (bool): Se True, inclui subdiretórios
+
+        Returns:
+            str: Caminho do arquivo mais recente ou None
+        """
+        pattern = os.path.join(directory, "**", "*.csv") if recursive else os.path.join(directory, "*.csv")
+        files = glob.glob(pattern, recursive=recursive)
+        return max(files, key=lambda path: (BatchValidator._capture_time(path), path)) if files else None
+
+    def find_log(self, spreadsheet_path):
+        """
+        Localiza a captura mais recente correspondente a uma planilha.
+
+        A pasta é montada como em FileHelper.save_logs_to_directory; se a planilha não
+        informar a funcionalidade, usa o nome do arquivo da planilha.
+
+        Args:
+            spreadsheet_path (str): Caminho da planilha CSV
+
+        Returns:
+            str: Caminho do log CSV ou None se não houver captura
+        """
+        functionality, subfunctionality = self.read_functionality(spreadsheet_path)
+        if not functionality or functionality.lower() == "undefined":
+            functionality = os.path.splitext(os.path.basename(spreadsheet_path))[0]
+        func_dir = os.path.join(self.logs_dir, FileHelper.sanitize_name(functionality))
+
+        # Prefere a pasta da subfuncionalidade; na falta dela, qualquer captura da funcionalidade
+        if subfunctionality and subfunctionality.lower() != "undefined":
+            log_path = self._latest_csv(os.path.join(func_dir, FileHelper.sanitize_name(subfunctionality)))
+            if log_path:
+                return log_path
+        return self._latest_csv(func_dir) or self._latest_csv(func_dir, recursive=True)
+
+    @staticmethod
+    def output_key(spreadsheet_path):
+        """
+        Retorna a funcionalidade e a subfuncionalidade que definem o diretório dos relatórios.
+
+        Segue os nomes usados por TagValidator.process_files e DirectoryManager.
+
+        Args:
+            spreadsheet_path (str): Caminho da planilha CSV
+
+        Returns:
+            tuple: (funcionalidade, subfuncionalidade) sanitizadas
+        """
+        functionality, subfunctionality = BatchValidator.read_functionality(spreadsheet_path)
+        subfunctionality = subfunctionality.strip()
+        return (
+            DirectoryManager.sanitize_functionality_name(functionality),
+            DirectoryManager.sanitize_functionality_name(subfunctionality) if subfunctionality else ""
+        )
+
+    def report_names(self, pairs):
+        """
+        Define o subdiretório dos relatórios de cada planilha.
+
+        Planilhas com a mesma funcionalidade e subfuncionalidade seriam validadas no mesmo
+        diretório, em paralelo, e sobrescreveriam os relatórios umas das outras; cada uma
+        recebe então um subdiretório com o nome do arquivo. As demais ficam na estrutura usual.
+
+        Args:
+            pairs (list): Pares (planilha, log)
+
+        Returns:
+            dict: Nome do subdiretório (ou None) por planilha
+        """
+        plans_by_key = {}
+        for spreadsheet_path, log_path in pairs:
+            plans_by_key.setdefault(self.output_key(spreadsheet_path), []).append(spreadsheet_path)
+
+        names = {}
+        for plans in plans_by_key.values():
+            for spreadsheet_path in plans:
+                names[spreadsheet_path] = (
+                    os.path.splitext(os.path.basename(spreadsheet_path))[0] if len(plans) > 1 else None
+                )
+        return names
+
+    def pair_files(self, plans_dir):
+        """
+        Associa cada planilha do diretório à sua captura.
+
+        Args:
+            plans_dir (str): Diretório com as planilhas CSV
+
+        Returns:
+            tuple: (lista de pares (planilha, log), lista de falhas das planilhas sem captura)
+        """
+        pairs = []
+        unpaired = []
+        for spreadsheet_path in sorted(glob.glob(os.path.join(plans_dir, "*.csv"))):
+            try:
+                log_path = self.find_log(spreadsheet_path)
+            except (OSError, ValueError) as e:
+                unpaired.append({"planilha": spreadsheet_path, "erro": str(e)})
+                continue
+            if log_path:
+                pairs.append((spreadsheet_path, log_path))
+            else:
+                unpaired.append({"planilha": spreadsheet_path, "erro": "Captura não encontrada"})
+        return pairs, unpaired
+
+    def run(self, plans_dir):
+        """
+        Valida todas as planilhas do diretório e salva o resumo agregado.
+
+        Args:
+            plans_dir (str): Diretório com as planilhas CSV
+
+        Returns:
+            dict: Resumo agregado do lote
+        """
+        pairs, failures = self.pair_files(plans_dir)
+        report_names = self.report_names(pairs)
+        total = len(pairs) + len(failures)
+        results = []
+        for failure in failures:
+            print(f"❌ {os.path.basename(failure['planilha'])}: {failure['erro']}")
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    validate_pair, spreadsheet_path, log_path, self.options, report_names[spreadsheet_path]
+                ): (spreadsheet_path, log_path)
+                for spreadsheet_path, log_path in pairs
+            }
+            for future in as_completed(futures):
+                spreadsheet_path, log_path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    failures.append({"planilha": spreadsheet_path, "log": log_path, "erro": str(e)})
+                    print(f"❌ {os.path.basename(spreadsheet_path)}: {e}")
+                    continue
+                results.append(result)
+                icon = RESULT_ICONS.get(result["resultado"], "•")
+                print(f"{icon} {os.path.basename(spreadsheet_path)} ({result['funcionalidade']}): {result['resultado']}")
+
+        # Mantém a ordem das planilhas, independente da ordem de conclusão
+        results.sort(key=lambda result: result["planilha"])
+        summary = {
+            "data": datetime.now().isoformat(timespec="seconds"),
+            "total_planilhas": total,
+            "resultados": {
+                status: sum(1 for result in results if result["resultado"] == status)
+                for status in ("APROVADO", "REQUER ATENÇÃO", "REPROVADO")
+            },
+            "eventos": {
+                field: sum(result["resumo"][field] for result in results)
+                for field in ("corretos", "ausentes", "com_erro", "total")
+            },
+            "validacoes": results,
+            "falhas": failures
+        }
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        summary_path = os.path.join(self.summary_dir, f"resumo_lote_{timestamp}.json")
+        FileHelper.ensure_directory_exists(self.summary_dir)
+        FileHandler.save_json(summary_path, summary)
+        summary["arquivo"] = summary_path
+        return summary
+
+
+def main():
+    """
+    Ponto de entrada da validação em lote pela linha de comando.
+    """
+    parser = argparse.ArgumentParser(description="Valida em paralelo as planilhas de um diretório.")
+    parser.add_argument("planilhas", help="Diretório com as planilhas CSV")
+    parser.add_argument("--logs", help="Diretório de capturas (padrão: logs/eventos)")
+    parser.add_argument("--processos", type=int, help="Número máximo de processos")
+    parser.add_argument("--sem-ia", action="store_true", help="Não consulta a IA (apenas análise básica)")
+    parser.add_argument("--parcial", action="store_true",
+                        help="Compara eventos sem correspondência exata com o log mais próximo")
+    parser.add_argument("--um-para-um", action="store_true", help="Cada log satisfaz no máximo um evento")
+    parser.add_argument("--fluxo", action="store_true", help="Lê os logs como fluxo")
+    parser.add_argument("--vetorizado", action="store_true", help="Usa o comparador pandas/NumPy")
+    parser.add_argument("--cache", action="store_true", help="Reaproveita planilhas e logs já carregados")
+    parser.add_argument("--copia", action="append", default=[], metavar="DIR",
+                        help="Outro diretório onde publicar os relatórios (pode ser repetido)")
+    parser.add_argument("--compacto", action="store_true", help="Grava os resultados em NDJSON compacto")
+    parser.add_argument("--gzip", action="store_true", help="Grava os resultados em NDJSON compacto com gzip")
+    args = parser.parse_args()
+
+    batch = BatchValidator(
+        logs_dir=args.logs,
+        max_workers=args.processos,
+        one_to_one=args.um_para_um,
+        partial_match=args.parcial,
+        streaming=args.fluxo,
+        vectorized=args.vetorizado,
+        use_ai=not args.sem_ia,
+        use_cache=args.cache,
+        mirror_dirs=args.copia,
+        compact_reports=args.compacto,
+        gzip_reports=args.gzip
+    )
+    summary = batch.run(args.planilhas)
+    print(f"Resumo do lote salvo em: {summary['arquivo']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Mede o tempo de importação (cold start) dos pontos de entrada da aplicação.
+
+Cada módulo é importado em um processo novo com `python -X importtime`, e o tempo
+acumulado do módulo é extraído da saída. O resultado é a mediana de várias execuções.
+
+Uso:
+    python benchmarks/import_time.py [diretório do projeto] [--repeticoes N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Cenários medidos: abertura da aplicação (main + interface), núcleo de validação e linha de comando
+TARGETS = {
+    "app (main+ui)": ["main", "ui_theme"],
+    "tag_validator": ["tag_validator"],
+    "cli": ["cli"]
+}
+# Módulos pesados cuja carga no início queremos evitar
+WATCHED = ["requests", "dotenv", "ai_analyzer", "devices", "webbrowser"]
+
+
+def measure(project_dir, modules, cwd):
+    """
+    Importa módulos em um processo novo e coleta o relatório do -X importtime.
+
+    Args:
+        project_dir (str): Diretório do projeto
+        modules (list): Nomes dos módulos a importar, em ordem
+        cwd (str): Diretório de trabalho do processo
+
+    Returns:
+        tuple: (tempo acumulado dos módulos em ms, conjunto de módulos importados)
+    """
+    env = dict(os.environ, PYTHONPATH=project_dir, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+    cumulative = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # Formato: "import time: <próprio us> | <acumulado us> | <módulo>"
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        imported.add(name.strip())
+        # Só soma importações de primeiro nível (sem recuo), para não contar duas vezes
+        if name[1:] in modules:
+            cumulative += int(cumulative_us) / 1000
+    return cumulative, imported
+
+
+def main():
+    """
+    Executa as medições e imprime a tabela de resultados.
+    """
+    parser = argparse.ArgumentParser(description="Mede o tempo de importação dos módulos principais.")
+    parser.add_argument("projeto", nargs="?", default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    parser.add_argument("--repeticoes", type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cwd:
+        print(f"Python {sys.version.split()[0]} - mediana de {args.repeticoes} execuções\n")
+        print(f"{'cenário':<15} {'tempo (ms)':>10}  módulos pesados carregados")
+        for label, modules in TARGETS.items():
+            times = []
+            for _ in range(args.repeticoes):
+                cumulative, imported = measure(args.projeto, modules, cwd)
+                times.append(cumulative)
+            watched = ", ".join(name for name in WATCHED if name in imported) or "-"
+            print(f"{label:<15} {statistics.median(times):>10.1f}  {watched}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Compara o filtro de linhas do monitoramento anterior com o LogLineFilter.
+
+- anterior (Android): encode/decode de toda linha + any(tag in linha for tag in [...])
+- anterior (iOS): encode/decode + lower() de toda linha + any(tag in linha for tag in [...])
+- LogLineFilter: filtro montado uma vez, aplicado à linha lida antes de qualquer cópia
+- regex: alternativa com uma única expressão regular com as mesmas palavras
+
+O corpus pode ser um dump do logcat gravado (adb logcat -v time -d > captura.txt). Sem ele,
+o script gera linhas no formato do logcat, uma a cada cem com um evento de tagueamento.
+
+Uso:
+    python benchmarks/line_filter.py [--dump captura.txt] [--linhas N]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from log_processor import DEFAULT_LOG_FILTERS, LogLineFilter  # noqa: E402
+
+NOISE_TAGS = [
+    "ActivityManager", "WindowManager", "chatty", "SurfaceFlinger", "InputDispatcher", "ConnectivityService",
+    "BluetoothAdapter", "wpa_supplicant", "OpenGLRenderer", "ReactNativeJS", "PowerManagerService", "AudioFlinger"
+]
+NOISE_WORDS = (
+    "started stopped received broadcast intent com.android.systemui window focus changed uid pid alarm "
+    "wakelock acquire release display vsync frame skipped choreographer network state wifi connected "
+    "disconnected battery level thermal throttling"
+).split()
+EVENT_LINE = (
+    'I/ReactNativeJS( 4321): [TAG_EVENTO] methodData: {{"name": "clique", "params": {{"ambiente": "prd", '
+    '"funcionalidade": "pix", "tela": "inicio", "acao": "clique", "elemento": "botao_{0}"}}}}'
+)
+
+
+def build_corpus(size):
+    """
+    Gera linhas no formato do logcat (-v time), com um evento a cada cem linhas.
+
+    Args:
+        size (int): Número de linhas
+
+    Returns:
+        list: Linhas do corpus
+    """
+    rng = random.Random(1)
+    lines = []
+    for i in range(size):
+        timestamp = f"06-01 10:{i // 60000 % 60:02d}:{i // 1000 % 60:02d}.{i % 1000:03d}"
+        if i % 100 == 0:
+            lines.append(f"{timestamp} {EVENT_LINE.format(i)}\n")
+        else:
+            message = " ".join(rng.choice(NOISE_WORDS) for _ in range(rng.randint(5, 25)))
+            lines.append(f"{timestamp} {rng.choice('VDIWE')}/{rng.choice(NOISE_TAGS)}({rng.randint(100, 9999)}): "
+                         f"{message}\n")
+    return lines
+
+
+def previous_filter(platform):
+    """
+    Reproduz o filtro anterior do monitoramento.
+
+    Args:
+        platform (str): "android" ou "ios"
+
+    Returns:
+        function: Recebe uma linha e retorna True se ela seria capturada
+    """
+    tags = DEFAULT_LOG_FILTERS[platform]["palavras"]
+    if platform == "ios":
+        return lambda line: any(tag in line.encode('utf-8', 'replace').decode('utf-8').lower() for tag in tags)
+    return lambda line: any(tag in line.encode('utf-8', 'replace').decode('utf-8') for tag in tags)
+
+
+def regex_filter(platform):
+    """
+    Filtro com uma única expressão regular de alternativas.
+
+    Args:
+        platform (str): "android" ou "ios"
+
+    Returns:
+        function: Recebe uma linha e retorna True se ela seria capturada
+    """
+    options = DEFAULT_LOG_FILTERS[platform]
+    flags = re.IGNORECASE if options["ignorar_maiusculas"] else 0
+    pattern = re.compile("|".join(map(re.escape, options["palavras"])), flags)
+    return lambda line: pattern.search(line) is not None
+
+
+def run(matches, lines, repeat):
+    """
+    Mede o melhor tempo de filtragem sobre o corpus.
+
+    Args:
+        matches: Função de filtro
+        lines (list): Linhas do corpus
+        repeat (int): Número de repetições
+
+    Returns:
+        tuple: (melhor tempo em s, linhas capturadas)
+    """
+    best = None
+    for _ in range(repeat):
+        captured = 0
+        start = time.perf_counter()
+        for line in lines:
+            if matches(line):
+                captured += 1
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, captured
+
+
+def main():
+    """
+    Executa a comparação e imprime a tabela de resultados.
+    """
+    parser = argparse.ArgumentParser(description="Compara os filtros de linhas do monitoramento.")
+    parser.add_argument("--dump", help="Arquivo com um dump do logcat gravado")
+    parser.add_argument("--linhas", type=int, default=1000000, help="Tamanho do corpus gerado")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.dump:
+        with open(args.dump, encoding="utf-8", errors="replace", newline="\n") as f:
+            lines = f.readlines()
+    else:
+        lines = build_corpus(args.linhas)
+
+    print(f"Python {sys.version.split()[0]} - {len(lines)} linhas, melhor de {args.repeticoes} execuções\n")
+    print(f"{'plataforma':<10} {'filtro':<14} {'tempo (s)':>9} {'capturadas':>11}")
+    for platform in ("android", "ios"):
+        options = DEFAULT_LOG_FILTERS[platform]
+        strategies = (
+            ("anterior", previous_filter(platform)),
+            ("regex", regex_filter(platform)),
+            ("LogLineFilter", LogLineFilter(options["palavras"], options["ignorar_maiusculas"]).matches)
+        )
+        for label, matches in strategies:
+            elapsed, captured = run(matches, lines, args.repeticoes)
+            print(f"{platform:<10} {label:<14} {elapsed:>9.3f} {captured:>11}")
+
+
+if __name__ == "__main__":
+    main()
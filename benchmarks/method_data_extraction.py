@@ -0,0 +1,149 @@
+"""
+Compara a extração do methodData por expressão regular com a extração em duas etapas.
+
+- regex: re.search(r'methodData:\\s*(\\{.*\\})') seguido de json.loads (implementação anterior)
+- find + raw_decode: log_processor.extract_method_data
+
+O corpus pode ser uma captura de logcat gravada (adb logcat -d > captura.txt). Sem ela,
+o script monta um corpus no formato do logcat a partir dos eventos gravados em
+logs/eventos, intercalados com linhas de ruído que também passam pelo filtro de captura.
+
+Uso:
+    python benchmarks/method_data_extraction.py [--corpus captura.txt] [--linhas N]
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from log_processor import extract_method_data  # noqa: E402
+
+METHOD_DATA_PATTERN = re.compile(r'methodData:\s*(\{.*\})')
+# Ordem dos parâmetros nas linhas exportadas (a 6ª coluna é sempre vazia)
+PARAM_COLUMNS = [
+    "ambiente", "produto", "funcionalidade", "subFuncionalidade", None, "categoria", "tela", "acao",
+    "elemento", "rotulo", "userId", "tipo_usuario", "opcao1", "opcao2", "opcao3", "opcao4", "opcao5", "opcao6"
+]
+NOISE_LINES = [
+    "05-31 17:18:08.101  4321  4388 D FirebaseAnalytics: Setting user property: ga_session_number\n",
+    "05-31 17:18:08.102  4321  4388 I ReactNativeJS: [analytics] fila de eventos vazia\n",
+    "05-31 17:18:08.103  4321  4390 V FA      : Activity resumed, time: 83927342\n",
+    "05-31 17:18:08.104  4321  4321 I ReactNativeJS: evento de navegação: {\"rota\": \"inicio\"}\n",
+]
+
+
+def regex_extract(line):
+    """
+    Extração anterior, baseada em expressão regular.
+
+    Args:
+        line (str): Linha de log
+
+    Returns:
+        tuple: (methodData decodificado ou None, texto do JSON inválido ou None)
+    """
+    method_data_match = METHOD_DATA_PATTERN.search(line)
+    if not method_data_match:
+        return None, None
+    try:
+        return json.loads(method_data_match.group(1)), None
+    except json.JSONDecodeError:
+        return None, method_data_match.group(1)
+
+
+def build_corpus(size):
+    """
+    Monta um corpus no formato do logcat a partir das exportações em logs/eventos.
+
+    Args:
+        size (int): Número de linhas do corpus
+
+    Returns:
+        list: Linhas de log
+    """
+    events = []
+    for path in sorted(glob.glob(os.path.join(PROJECT_DIR, "logs", "eventos", "**", "*.csv"), recursive=True)):
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                params = {name: value for name, value in zip(PARAM_COLUMNS, row[1:]) if name and value}
+                events.append({"name": row[0], "params": params})
+    if not events:
+        raise SystemExit("Nenhum evento encontrado em logs/eventos; informe --corpus.")
+
+    lines = []
+    i = 0
+    while len(lines) < size:
+        event = events[i % len(events)]
+        # Parte das linhas traz ruído após o JSON, como acontece com a ponte do React Native
+        suffix = " {origem: bridge}" if i % 4 == 0 else ""
+        lines.append(f"05-31 17:18:08.{i % 1000:03d}  4321  4388 I ReactNativeJS: [TAG_EVENTO] "
+                     f"methodData: {json.dumps(event, ensure_ascii=False)}{suffix}\n")
+        lines.extend(NOISE_LINES)
+        i += 1
+    return lines[:size]
+
+
+def run(extract, lines, repeat):
+    """
+    Mede o melhor tempo de extração sobre o corpus.
+
+    Args:
+        extract: Função de extração
+        lines (list): Linhas do corpus
+        repeat (int): Número de repetições
+
+    Returns:
+        tuple: (melhor tempo em s, decodificados, inválidos, sem methodData)
+    """
+    best = None
+    for _ in range(repeat):
+        decoded = invalid = empty = 0
+        start = time.perf_counter()
+        for line in lines:
+            method_data, invalid_json = extract(line)
+            if method_data is not None:
+                decoded += 1
+            elif invalid_json is not None:
+                invalid += 1
+            else:
+                empty += 1
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, decoded, invalid, empty
+
+
+def main():
+    """
+    Executa a comparação e imprime a tabela de resultados.
+    """
+    parser = argparse.ArgumentParser(description="Compara as estratégias de extração do methodData.")
+    parser.add_argument("--corpus", help="Arquivo com uma captura de log gravada")
+    parser.add_argument("--linhas", type=int, default=200000, help="Tamanho do corpus gerado")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+    else:
+        lines = build_corpus(args.linhas)
+
+    print(f"Python {sys.version.split()[0]} - {len(lines)} linhas, melhor de {args.repeticoes} execuções\n")
+    print(f"{'estratégia':<18} {'tempo (s)':>9} {'decodificados':>14} {'inválidos':>10} {'sem dados':>10}")
+    for label, extract in (("regex", regex_extract), ("find + raw_decode", extract_method_data)):
+        elapsed, decoded, invalid, empty = run(extract, lines, args.repeticoes)
+        print(f"{label:<18} {elapsed:>9.3f} {decoded:>14} {invalid:>10} {empty:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Mede o tempo e o pico de memória de ReportGenerator.generate_text_report.
+
+Os eventos ausentes e com propriedades erradas são montados antes da medição; o pico
+(tracemalloc) reflete apenas o que a geração do relatório aloca. Cada tamanho é medido
+em um processo novo, para que um não interfira no outro.
+
+Uso:
+    python benchmarks/text_report.py [diretório do projeto] [--discrepancias N N ...]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+FIELDS = ["AMBIENTE", "PRODUTO", "FUNCIONALIDADE", "CATEGORIA", "ACAO", "ELEMENTO", "ROTULO"]
+
+
+def build_results(size):
+    """
+    Monta resultados de validação com metade de ausentes e metade de propriedades erradas.
+
+    Args:
+        size (int): Número de discrepâncias
+
+    Returns:
+        tuple: (eventos da planilha, ausentes, propriedades erradas, corretos)
+    """
+    spreadsheet_events = []
+    missing = []
+    wrong_properties = []
+    for i in range(size):
+        event = {"ID": i + 1, "NOME DO EVENTO": f"evento_{i % 50}", "TELA": f"tela_{i % 20}"}
+        event.update({field: f"{field.lower()}_{i % 7}" for field in FIELDS})
+        spreadsheet_events.append(event)
+        if i % 2:
+            wrong_properties.append({
+                "ID": event["ID"],
+                "evento": event,
+                "diferencas": {field: {"esperado": event[field], "log": f"{event[field]}_x"} for field in FIELDS[:3]}
+            })
+        else:
+            missing.append(event)
+    return spreadsheet_events, missing, wrong_properties, []
+
+
+def measure(project_dir, size):
+    """
+    Gera o relatório de texto e mede tempo e pico de memória (executado no processo filho).
+
+    Args:
+        project_dir (str): Diretório do projeto
+        size (int): Número de discrepâncias
+
+    Returns:
+        dict: Tempo em s, pico em MB e tamanho do relatório em MB
+    """
+    sys.path.insert(0, project_dir)
+    from tag_validator import ReportGenerator
+
+    results = build_results(size)
+    with tempfile.TemporaryDirectory() as output_dir:
+        generator = ReportGenerator(output_dir)
+        tracemalloc.start()
+        start = time.perf_counter()
+        report_path = generator.generate_text_report(*results, None)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        report_size = os.path.getsize(report_path)
+    return {"tempo": elapsed, "pico_mb": peak / 1e6, "relatorio_mb": report_size / 1e6}
+
+
+def main():
+    """
+    Executa as medições e imprime a tabela de resultados.
+    """
+    parser = argparse.ArgumentParser(description="Mede a geração do relatório de texto.")
+    parser.add_argument("projeto", nargs="?", default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    parser.add_argument("--discrepancias", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--medir", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir is not None:
+        print(json.dumps(measure(args.projeto, args.medir)))
+        return
+
+    print(f"Python {sys.version.split()[0]}\n")
+    print(f"{'discrepâncias':>13} {'tempo (s)':>10} {'pico (MB)':>10} {'relatório (MB)':>15}")
+    for size in args.discrepancias:
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), args.projeto, "--medir", str(size)],
+            capture_output=True, text=True, check=True
+        )
+        measured = json.loads(result.stdout.strip().splitlines()[-1])
+        print(f"{size:>13} {measured['tempo']:>10.3f} {measured['pico_mb']:>10.1f} {measured['relatorio_mb']:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -63,12 +63,19 @@ def build_executable():
     # Python modules (excluding main.py and build_app.py)
     modules = [
         'ai_analyzer.py',
+        'batch_validator.py',
+        'capture_buffer.py',
+        'cli.py',
+        'compact_report.py',
         'devices.py',
         'dialog_utils.py',
+        'event_store.py',
         'file_utils.py',
         'log_processor.py',
+        'log_viewer.py',
         'tag_validator.py',
-        'ui_theme.py'
+        'ui_theme.py',
+        'vectorized_comparator.py'
     ]
     
     # Create a special wrapper script for macOS
@@ -0,0 +1,180 @@
+"""
+Este arquivo contém o buffer de captura usado durante o monitoramento de logs.
+Responsabilidades:
+- Gravar todas as linhas capturadas em segmentos no disco, com rotação por tamanho
+- Reler a captura completa a partir dos segmentos, para exportação, busca e navegação
+
+Com isso, uma captura longa (ex.: um teste de estabilidade de uma noite inteira) não
+faz o processo crescer em memória: o custo fica no disco, em arquivos temporários.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+
+# Tamanho aproximado (em caracteres) de cada segmento antes da rotação
+DEFAULT_SEGMENT_SIZE = 32 * 1024 * 1024
+
+
+class CaptureBuffer:
+    """
+    Buffer de linhas capturadas em segmentos rotativos em disco.
+
+    A interface exibe as linhas à medida que chegam (fila do monitoramento) e relê o
+    histórico daqui; nenhuma linha é mantida em memória.
+
+    A escrita é feita pela thread de leitura do dispositivo e a leitura pela interface,
+    por isso as operações são protegidas por uma trava.
+    """
+
+    def __init__(self, segment_size=DEFAULT_SEGMENT_SIZE, directory=None):
+        """
+        Args:
+            segment_size (int): Tamanho aproximado de cada segmento, em caracteres
+            directory (str): Diretório dos segmentos (padrão: diretório temporário criado no primeiro uso)
+        """
+        self.segment_size = segment_size
+        self.base_directory = directory
+        self.directory = None
+        self.segments = []
+        # Número da primeira linha (a partir de 0) de cada segmento
+        self.segment_starts = []
+        self.count = 0
+        self._segment = None
+        self._segment_written = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __iter__(self):
+        return self.iter_lines()
+
+    def _open_segment(self):
+        """
+        Abre o próximo segmento, criando o diretório da captura se necessário.
+        """
+        if self.directory is None:
+            if self.base_directory:
+                os.makedirs(self.base_directory, exist_ok=True)
+            self.directory = tempfile.mkdtemp(prefix="captura_", dir=self.base_directory)
+        path = os.path.join(self.directory, f"segmento_{len(self.segments) + 1:05d}.log")
+        # newline="\n": sem tradução de quebras de linha, para reler exatamente o que foi gravado
+        self._segment = open(path, "w", encoding="utf-8", errors="replace", newline="\n")
+        self._segment_written = 0
+        self.segments.append(path)
+        self.segment_starts.append(self.count)
+
+    def append(self, line):
+        """
+        Adiciona uma linha capturada.
+
+        Args:
+            line (str): Linha de log
+        """
+        # Uma linha por registro no segmento; a quebra final é garantida
+        if not line.endswith("\n"):
+            line += "\n"
+        with self._lock:
+            if self._segment is None or self._segment_written >= self.segment_size:
+                if self._segment is not None:
+                    self._segment.close()
+                self._open_segment()
+            self._segment.write(line)
+            self._segment_written += len(line)
+            self.count += 1
+
+    def iter_lines(self):
+        """
+        Percorre todas as linhas capturadas, relendo os segmentos do disco.
+
+        Returns:
+            iterator: Linhas na ordem de captura
+        """
+        with self._lock:
+            if self._segment is not None:
+                self._segment.flush()
+            segments = list(self.segments)
+            count = self.count
+
+        # Lê apenas as linhas que já existiam ao iniciar a leitura
+        for path in segments:
+            with open(path, encoding="utf-8", newline="\n") as f:
+                for line in f:
+                    if count <= 0:
+                        return
+                    count -= 1
+                    yield line
+
+    def read_lines(self, start, count):
+        """
+        Lê um trecho da captura, abrindo apenas os segmentos que o contêm.
+
+        Args:
+            start (int): Número da primeira linha (a partir de 0)
+            count (int): Número máximo de linhas
+
+        Returns:
+            list: Linhas do trecho, na ordem de captura
+        """
+        with self._lock:
+            if self._segment is not None:
+                self._segment.flush()
+            total = self.count
+            segments = list(zip(self.segments, self.segment_starts))
+
+        start = max(start, 0)
+        end = min(start + count, total)
+        lines = []
+        for index, (path, segment_start) in enumerate(segments):
+            segment_end = segments[index + 1][1] if index + 1 < len(segments) else total
+            if segment_end <= start or segment_start >= end:
+                continue
+            with open(path, encoding="utf-8", newline="\n") as f:
+                for number, line in enumerate(f, segment_start):
+                    if number >= end:
+                        break
+                    if number >= start:
+                        lines.append(line)
+        return lines
+
+    def search(self, term, max_results=1000, ignore_case=True):
+        """
+        Procura um trecho de texto em toda a captura.
+
+        Args:
+            term (str): Texto procurado
+            max_results (int): Número máximo de ocorrências retornadas
+            ignore_case (bool): Se True, ignora maiúsculas e minúsculas
+
+        Returns:
+            list: Tuplas (número da linha, linha) das ocorrências, na ordem de captura
+        """
+        if ignore_case:
+            term = term.lower()
+        results = []
+        for number, line in enumerate(self.iter_lines()):
+            if term in (line.lower() if ignore_case else line):
+                results.append((number, line))
+                if len(results) >= max_results:
+                    break
+        return results
+
+    def clear(self):
+        """
+        Descarta a captura atual e remove os segmentos do disco.
+        """
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+            if self.directory is not None:
+                shutil.rmtree(self.directory, ignore_errors=True)
+                self.directory = None
+            self.segments = []
+            self.segment_starts = []
+            self.count = 0
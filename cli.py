@@ -0,0 +1,95 @@
+"""
+Este arquivo contém o modo de linha de comando da validação de tagueamento.
+Responsabilidades:
+- Leitura dos argumentos (planilha, log e opções de comparação)
+- Execução de TagValidator.process_files sem interface gráfica
+- Código de saída conforme o resultado da validação, para uso em CI
+
+Não importa tkinter, ui_theme nem dialog_utils: roda sem display e sem interação.
+"""
+
+import argparse
+import sys
+
+from tag_validator import TagValidator, get_validation_result
+
+# Códigos de saída
+EXIT_OK = 0
+EXIT_REPROVADO = 1
+EXIT_ERRO = 2
+
+
+def build_parser():
+    """
+    Cria o parser de argumentos da linha de comando.
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado
+    """
+    parser = argparse.ArgumentParser(
+        prog="tagvalidator",
+        description="Valida uma planilha de tagueamento contra um log CSV, sem interface gráfica."
+    )
+    parser.add_argument("planilha", help="Caminho da planilha CSV")
+    parser.add_argument("log", help="Caminho do log CSV")
+    parser.add_argument("--saida", help="Diretório adicional onde salvar os relatórios")
+    parser.add_argument("--copia", action="append", default=[], metavar="DIR",
+                        help="Outro diretório onde publicar os relatórios (pode ser repetido)")
+    parser.add_argument("--compacto", action="store_true", help="Grava os resultados em NDJSON compacto")
+    parser.add_argument("--gzip", action="store_true", help="Grava os resultados em NDJSON compacto com gzip")
+    parser.add_argument("--sem-ia", action="store_true", help="Não consulta a IA (apenas análise básica)")
+    parser.add_argument("--parcial", action="store_true",
+                        help="Compara eventos sem correspondência exata com o log mais próximo")
+    parser.add_argument("--um-para-um", action="store_true", help="Cada log satisfaz no máximo um evento")
+    parser.add_argument("--fluxo", action="store_true", help="Lê o log como fluxo")
+    parser.add_argument("--vetorizado", action="store_true", help="Usa o comparador pandas/NumPy")
+    parser.add_argument("--cache", action="store_true", help="Reaproveita planilhas e logs já carregados")
+    return parser
+
+
+def main(argv=None):
+    """
+    Executa uma validação pela linha de comando.
+
+    Args:
+        argv (list): Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        int: 0 se a validação não for reprovada, 1 se for REPROVADO, 2 em caso de erro
+    """
+    args = build_parser().parse_args(argv)
+
+    try:
+        validator = TagValidator(
+            one_to_one=args.um_para_um,
+            partial_match=args.parcial,
+            streaming=args.fluxo,
+            vectorized=args.vetorizado,
+            use_ai=not args.sem_ia,
+            use_cache=args.cache,
+            mirror_dirs=args.copia,
+            compact_reports=args.compacto,
+            gzip_reports=args.gzip
+        )
+        get_output_directory = (lambda name: args.saida) if args.saida else None
+        functionality, output_dir, dashboard_data, dashboard_path = validator.process_files(
+            args.planilha, args.log, get_output_directory
+        )
+    except Exception as e:
+        # Qualquer falha (planilha vazia ou malformada, CSV inválido...) sai com EXIT_ERRO,
+        # para que a CI não a confunda com uma validação REPROVADA
+        print(f"Erro na validação: {type(e).__name__}: {e}", file=sys.stderr)
+        return EXIT_ERRO
+
+    summary = dashboard_data["resumo"]
+    result = get_validation_result(summary)
+    print(f"Funcionalidade: {functionality}")
+    print(f"Corretos: {summary['corretos']} | Ausentes: {summary['ausentes']} | "
+          f"Com erro: {summary['com_erro']} | Total: {summary['total']}")
+    print(f"Resultado: {result}")
+    print(f"Relatórios: {output_dir}")
+    return EXIT_REPROVADO if result == "REPROVADO" else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
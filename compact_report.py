@@ -0,0 +1,192 @@
+"""
+Este arquivo contém o formato compacto dos resultados da validação.
+Responsabilidades:
+- Gravação dos eventos ausentes e com propriedades erradas em NDJSON minificado
+- Tabela única de eventos: cada evento (da planilha ou do log) é gravado uma vez e referenciado
+  (EventRefs, também usada nas listas de eventos do dashboard)
+- Leitura do arquivo (com ou sem gzip) de volta para a estrutura de ausentes_log.json e
+  propriedades_erradas.json
+
+Formato (uma linha JSON por registro, na ordem):
+    {"formato": "tagvalidator-compacto", "versao": 1, "total_ausentes": N, "total_com_erro": M}
+    {"tipo": "evento", "ref": "e1", "dados": {...}}
+    {"tipo": "ausente", "evento": "e1"}
+    {"tipo": "com_erro", "ID": 5, "evento": "e2", "log": "e3", "diferencas": {...}}
+
+Um evento é sempre gravado antes do primeiro registro que o referencia, de modo que o
+arquivo pode ser lido (e escrito) em fluxo.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+
+from event_store import to_serializable
+
+COMPACT_FORMAT = "tagvalidator-compacto"
+COMPACT_VERSION = 1
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _dumps(data):
+    """
+    Serializa em JSON minificado.
+
+    Args:
+        data: Dados a serializar
+
+    Returns:
+        str: JSON sem espaços entre os separadores
+    """
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=to_serializable)
+
+
+class EventRefs:
+    """
+    Tabela de eventos distintos, numerados na ordem em que aparecem.
+
+    Cada evento é identificado pelo digest do seu JSON: a tabela guarda 16 bytes por
+    evento, e não uma segunda cópia do conteúdo.
+    """
+
+    def __init__(self):
+        self._numbers = {}
+
+    def __len__(self):
+        return len(self._numbers)
+
+    def add(self, event):
+        """
+        Registra um evento na tabela.
+
+        Args:
+            event (dict): Evento
+
+        Returns:
+            tuple: (número do evento, a partir de 1; JSON minificado do evento se ele ainda
+                não estava na tabela, ou None)
+        """
+        text = _dumps(event)
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        number = self._numbers.get(digest)
+        if number is not None:
+            return number, None
+        number = len(self._numbers) + 1
+        self._numbers[digest] = number
+        return number, text
+
+
+def write_compact_results(f, missing, wrong_properties):
+    """
+    Grava os resultados no formato compacto.
+
+    Eventos com o mesmo conteúdo (ex.: um log que corresponde a vários eventos da
+    planilha) são gravados uma única vez na tabela de eventos.
+
+    Args:
+        f: Arquivo de texto aberto para escrita
+        missing (list): Eventos ausentes
+        wrong_properties (list): Eventos com propriedades erradas
+
+    Returns:
+        int: Número de eventos distintos na tabela
+    """
+    refs = EventRefs()
+    write = f.write
+
+    def ref(event):
+        # Conteúdos iguais compartilham a referência
+        number, text = refs.add(event)
+        if text is not None:
+            write(f'{{"tipo":"evento","ref":"e{number}","dados":{text}}}\n')
+        return f"e{number}"
+
+    write(_dumps({
+        "formato": COMPACT_FORMAT,
+        "versao": COMPACT_VERSION,
+        "total_ausentes": len(missing),
+        "total_com_erro": len(wrong_properties)
+    }) + "\n")
+    for event in missing:
+        write(_dumps({"tipo": "ausente", "evento": ref(event)}) + "\n")
+    for wrong in wrong_properties:
+        record = {"tipo": "com_erro"}
+        for key, value in wrong.items():
+            record[key] = ref(value) if key in ("evento", "log") else value
+        write(_dumps(record) + "\n")
+    return len(refs)
+
+
+def save_compact_results(raw, missing, wrong_properties, use_gzip=False):
+    """
+    Grava os resultados no formato compacto em um arquivo binário já aberto.
+
+    Args:
+        raw: Arquivo binário aberto para escrita
+        missing (list): Eventos ausentes
+        wrong_properties (list): Eventos com propriedades erradas
+        use_gzip (bool): Se True, comprime com gzip
+
+    Returns:
+        int: Número de eventos distintos na tabela
+    """
+    if use_gzip:
+        # mtime=0 e sem nome no cabeçalho: a mesma validação gera o mesmo arquivo
+        raw = gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0)
+    f = io.TextIOWrapper(raw, encoding="utf-8", newline="\n")
+    try:
+        return write_compact_results(f, missing, wrong_properties)
+    finally:
+        f.flush()
+        f.detach()
+        if use_gzip:
+            raw.close()
+
+
+def load_compact_results(file_path):
+    """
+    Lê um arquivo no formato compacto (com ou sem gzip).
+
+    As referências são resolvidas: eventos compartilhados voltam como o mesmo dicionário.
+
+    Args:
+        file_path (str): Caminho do arquivo
+
+    Returns:
+        dict: {"ausentes": {"total_ausentes", "eventos"}, "propriedades_erradas": {"total_com_erro", "eventos"}},
+            na mesma estrutura de ausentes_log.json e propriedades_erradas.json
+
+    Raises:
+        ValueError: Se o arquivo não estiver no formato compacto ou tiver versão desconhecida
+    """
+    with open(file_path, "rb") as raw:
+        compressed = raw.read(2) == GZIP_MAGIC
+    opener = gzip.open if compressed else open
+    with opener(file_path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "null")
+        if not isinstance(header, dict) or header.get("formato") != COMPACT_FORMAT:
+            raise ValueError(f"{file_path} não está no formato compacto")
+        if header.get("versao") != COMPACT_VERSION:
+            raise ValueError(f"Versão do formato compacto não suportada: {header.get('versao')}")
+
+        events = {}
+        missing = []
+        wrong_properties = []
+        for line in f:
+            record = json.loads(line)
+            kind = record.pop("tipo")
+            if kind == "evento":
+                events[record["ref"]] = record["dados"]
+            elif kind == "ausente":
+                missing.append(events[record["evento"]])
+            elif kind == "com_erro":
+                for key in ("evento", "log"):
+                    if key in record:
+                        record[key] = events[record[key]]
+                wrong_properties.append(record)
+
+    return {
+        "ausentes": {"total_ausentes": header["total_ausentes"], "eventos": missing},
+        "propriedades_erradas": {"total_com_erro": header["total_com_erro"], "eventos": wrong_properties}
+    }
@@ -7,7 +7,25 @@ const DashboardApp = {
   state: {
     dados: null,
     mainChart: null,
-    dadosFiltrados: null
+    dadosFiltrados: null,
+    // Carregamento das listas de eventos, por nome da lista ({ promise, resolver })
+    carregamentos: {},
+    // Lista exibida em cada container de eventos ({ eventos, tipo, pagina }), por ID do container
+    listas: {},
+    // Eventos da página exibida, por ID do elemento (os detalhes são montados ao expandir)
+    eventosExibidos: {}
+  },
+
+  // Eventos exibidos por página nas listas de eventos
+  EVENTOS_POR_PAGINA: 50,
+
+  /**
+   * Abas de eventos: lista de dados, container e tipo de exibição de cada uma
+   */
+  ABAS_EVENTOS: {
+    'corretos': { lista: 'corretos', container: 'CORRETOS_CONTAINER', tipo: 'correto' },
+    'ausentes': { lista: 'ausentes', container: 'AUSENTES_CONTAINER', tipo: 'ausente' },
+    'com-erro': { lista: 'com_erro', container: 'COM_ERRO_CONTAINER', tipo: 'com-erro' }
   },
 
   /**
@@ -19,7 +37,9 @@ const DashboardApp = {
      */
     setup() {
       // Carregar os dados da validação
+      // (apenas o resumo; as listas de eventos são carregadas quando a aba é aberta)
       DashboardApp.state.dados = window.__DADOS_DASHBOARD__;
+      DashboardApp.state.dados.eventos = DashboardApp.state.dados.eventos || {};
       DashboardApp.state.dadosFiltrados = DashboardApp.state.dados;
 
       // Configurar timestamps
@@ -28,12 +48,17 @@ const DashboardApp = {
       // Inicializar componentes
       DashboardApp.resumo.atualizarContadores();
       DashboardApp.resumo.configurarAnaliseIA();
-      DashboardApp.eventos.preencherConteudo();
       DashboardApp.graficos.renderizar('distribuicao');
 
       // Configurar interatividade
       DashboardApp.ui.configurarAbas();
       DashboardApp.ui.configurarAbasGraficos();
+
+      // Preencher a aba de eventos aberta inicialmente
+      const abaAtiva = document.querySelector('.tab.active');
+      if (abaAtiva) {
+        DashboardApp.eventos.preencherAba(abaAtiva.getAttribute('data-tab'));
+      }
     },
 
     /**
@@ -57,6 +82,54 @@ const DashboardApp = {
     }
   },
 
+  /**
+   * Módulo para carregar as listas de eventos sob demanda
+   */
+  dados: {
+    /**
+     * Carrega uma lista de eventos a partir do seu arquivo de dados
+     * @param {string} nome - Nome da lista (corretos, ausentes, com_erro)
+     * @returns {Promise<Array>} Eventos da lista
+     */
+    carregarLista(nome) {
+      const { dados, carregamentos } = DashboardApp.state;
+
+      if (dados.eventos[nome]) {
+        return Promise.resolve(dados.eventos[nome]);
+      }
+      if (!carregamentos[nome]) {
+        const script = document.createElement('script');
+        script.src = dados.arquivos_eventos[nome];
+
+        // O arquivo chama DashboardApp.dados.receber, que resolve a Promise
+        const carregamento = new Promise((resolve, reject) => {
+          script.onerror = () => {
+            delete carregamentos[nome];
+            reject(new Error(`Falha ao carregar ${script.src}`));
+          };
+          carregamentos[nome] = { promise: null, resolver: resolve };
+        });
+        carregamentos[nome].promise = carregamento;
+        document.head.appendChild(script);
+      }
+      return carregamentos[nome].promise;
+    },
+
+    /**
+     * Recebe uma lista de eventos carregada de um arquivo de dados
+     * @param {string} nome - Nome da lista
+     * @param {Array} eventos - Eventos da lista
+     */
+    receber(nome, eventos) {
+      const { dados, carregamentos } = DashboardApp.state;
+
+      dados.eventos[nome] = eventos;
+      if (carregamentos[nome]?.resolver) {
+        carregamentos[nome].resolver(eventos);
+      }
+    }
+  },
+
   /**
    * Módulo para gerenciar o resumo de dados
    */
@@ -232,7 +305,7 @@ const DashboardApp = {
       const eventId = `evento-${tipo}-${id}`;
 
       // Construir o HTML do evento
-      let html = `
+      const html = `
         <div class="evento ${tipo}" id="${eventId}" onclick="DashboardApp.ui.toggleEventoDetalhes('${eventId}')">
           <div class="evento-info">
             ${statusBadge}
@@ -241,9 +314,25 @@ const DashboardApp = {
             <span class="evento-nome"><i class="fas fa-tag"></i> ${nomeEvento}</span>
             <span class="evento-data"><i class="far fa-clock"></i> ${dataFormatada}</span>
           </div>
-          <div class="evento-detalhes" id="${eventId}-detalhes">
+          <div class="evento-detalhes" id="${eventId}-detalhes"></div>
+        </div>
       `;
 
+      // Os detalhes são montados apenas quando o evento é expandido
+      // (o primeiro evento com o mesmo ID é o que getElementById encontra)
+      DashboardApp.state.eventosExibidos[eventId] ??= { eventoWrapper, tipo };
+      return html;
+    },
+
+    /**
+     * Gera o HTML dos detalhes de um evento
+     * @param {Object} eventoWrapper - Objeto contendo dados do evento
+     * @param {string} tipo - Tipo do evento (correto, ausente, com-erro)
+     * @returns {string} HTML das diferenças (eventos com erro) e dos detalhes completos
+     */
+    gerarDetalhes(eventoWrapper, tipo) {
+      let html = '';
+
       // Adicionar diferenças se for um evento com erro
       if (tipo === 'com-erro' && eventoWrapper.diferencas) {
         html += DashboardUtils.ui.gerarHtmlDiferencas(eventoWrapper.diferencas);
@@ -251,53 +340,132 @@ const DashboardApp = {
 
       // Adicionar detalhes completos
       html += DashboardUtils.ui.gerarHtmlDetalhesCompletos(eventoWrapper);
-
-      html += '</div></div>';
       return html;
     },
 
     /**
-     * Preenche os containers de eventos com os dados formatados
+     * Preenche o container de uma aba, carregando a lista de eventos na primeira vez
+     * @param {string} tabId - ID da aba (corretos, ausentes, com-erro)
      */
-    preencherConteudo() {
-      const { dadosFiltrados } = DashboardApp.state;
-      const ids = DashboardUtils.ELEMENT_IDS;
-
-      // Eventos corretos
-      this.preencherContainer(ids.CORRETOS_CONTAINER, dadosFiltrados.eventos.corretos, 'correto');
-
-      // Eventos ausentes
-      this.preencherContainer(ids.AUSENTES_CONTAINER, dadosFiltrados.eventos.ausentes, 'ausente');
-
-      // Eventos com erro
-      this.preencherContainer(ids.COM_ERRO_CONTAINER, dadosFiltrados.eventos.com_erro, 'com-erro');
+    preencherAba(tabId) {
+      const aba = DashboardApp.ABAS_EVENTOS[tabId];
+      if (!aba) return;
+
+      const container = document.getElementById(DashboardUtils.ELEMENT_IDS[aba.container]);
+      if (container.dataset.preenchido) return;
+      container.dataset.preenchido = 'true';
+      container.innerHTML = '<div class="sem-itens"><i class="fas fa-spinner fa-spin"></i> Carregando eventos...</div>';
+
+      DashboardApp.dados.carregarLista(aba.lista)
+        .then(eventos => this.preencherContainer(container.id, eventos, aba.tipo))
+        .catch(erro => {
+          console.warn(erro.message);
+          delete container.dataset.preenchido;
+          container.innerHTML = '<div class="sem-itens"><i class="fas fa-exclamation-triangle"></i> Não foi possível carregar os eventos.</div>';
+        });
     },
 
     /**
-     * Gera conteúdo HTML para um container de eventos
-     * @param {Array} eventos - Lista de eventos a serem exibidos
+     * Gera conteúdo HTML para uma página de um container de eventos
+     * @param {string} containerId - ID do container
+     * @param {Array} eventos - Lista de eventos do container
      * @param {string} tipo - Tipo de eventos (correto, ausente, com-erro)
+     * @param {number} pagina - Página exibida (a partir de 0)
      * @returns {string} HTML gerado para o container
      */
-    gerarConteudoContainer(eventos, tipo) {
+    gerarConteudoContainer(containerId, eventos, tipo, pagina) {
       if (!eventos || eventos.length === 0) {
         return `<div class="sem-itens"><i class="far fa-smile"></i> Nenhum evento ${tipo.replace('-', ' ')} encontrado.</div>`;
       }
-      
-      return eventos
+
+      const porPagina = DashboardApp.EVENTOS_POR_PAGINA;
+      const inicio = pagina * porPagina;
+      const html = eventos
+        .slice(inicio, inicio + porPagina)
         .map(evento => this.formatarEvento(evento, tipo))
         .join('');
+
+      return html + this.gerarPaginacao(containerId, eventos.length, pagina);
+    },
+
+    /**
+     * Gera os controles de paginação de um container (apenas quando há mais de uma página)
+     * @param {string} containerId - ID do container
+     * @param {number} total - Número de eventos do container
+     * @param {number} pagina - Página exibida (a partir de 0)
+     * @returns {string} HTML dos controles
+     */
+    gerarPaginacao(containerId, total, pagina) {
+      const porPagina = DashboardApp.EVENTOS_POR_PAGINA;
+      const totalPaginas = Math.ceil(total / porPagina);
+      if (totalPaginas <= 1) {
+        return '';
+      }
+
+      const inicio = pagina * porPagina + 1;
+      const fim = Math.min(inicio + porPagina - 1, total);
+      const irPara = (destino) => `DashboardApp.eventos.irParaPagina('${containerId}', ${destino})`;
+
+      return `
+        <div class="paginacao">
+          <button class="filter-btn paginacao-btn" onclick="${irPara(pagina - 1)}" ${pagina === 0 ? 'disabled' : ''}>
+            <i class="fas fa-chevron-left"></i> Anterior
+          </button>
+          <span class="paginacao-info">Eventos ${inicio}-${fim} de ${total} (página ${pagina + 1} de ${totalPaginas})</span>
+          <button class="filter-btn paginacao-btn" onclick="${irPara(pagina + 1)}" ${pagina === totalPaginas - 1 ? 'disabled' : ''}>
+            Próxima <i class="fas fa-chevron-right"></i>
+          </button>
+        </div>
+      `;
     },
 
     /**
-     * Preenche um container específico com eventos formatados
+     * Preenche um container específico com a primeira página de eventos formatados
      * @param {string} containerId - ID do container a ser preenchido
      * @param {Array} eventos - Lista de eventos a serem exibidos
      * @param {string} tipo - Tipo de eventos (correto, ausente, com-erro)
      */
     preencherContainer(containerId, eventos, tipo) {
+      DashboardApp.state.listas[containerId] = { eventos, tipo, pagina: 0 };
+      this.exibirPagina(containerId);
+    },
+
+    /**
+     * Exibe no container a página atual da sua lista; apenas os eventos dela ficam no DOM
+     * @param {string} containerId - ID do container
+     */
+    exibirPagina(containerId) {
+      const { listas, eventosExibidos } = DashboardApp.state;
+      const { eventos, tipo, pagina } = listas[containerId];
+
+      // Descarta os eventos da página anterior deste container
+      const prefixo = `evento-${tipo}-`;
+      Object.keys(eventosExibidos)
+        .filter(eventId => eventId.startsWith(prefixo))
+        .forEach(eventId => delete eventosExibidos[eventId]);
+
       const container = document.getElementById(containerId);
-      container.innerHTML = this.gerarConteudoContainer(eventos, tipo);
+      container.innerHTML = this.gerarConteudoContainer(containerId, eventos, tipo, pagina);
+    },
+
+    /**
+     * Navega para uma página de um container de eventos
+     * @param {string} containerId - ID do container
+     * @param {number} pagina - Página de destino (a partir de 0)
+     */
+    irParaPagina(containerId, pagina) {
+      const lista = DashboardApp.state.listas[containerId];
+      const totalPaginas = Math.ceil(lista.eventos.length / DashboardApp.EVENTOS_POR_PAGINA);
+      if (pagina < 0 || pagina >= totalPaginas) return;
+
+      lista.pagina = pagina;
+      this.exibirPagina(containerId);
+
+      // Voltar ao início da lista
+      document.getElementById(DashboardUtils.ELEMENT_IDS.EVENTOS_CARD).scrollIntoView({
+        behavior: 'smooth',
+        block: 'start'
+      });
     }
   },
 
@@ -321,6 +489,7 @@ const DashboardApp = {
           const tabId = tab.getAttribute('data-tab');
           tab.classList.add('active');
           document.getElementById(`${tabId}-content`).classList.add('active');
+          DashboardApp.eventos.preencherAba(tabId);
         });
       });
     },
@@ -353,6 +522,13 @@ const DashboardApp = {
     toggleEventoDetalhes(eventoId) {
       const detalhesEl = document.getElementById(`${eventoId}-detalhes`);
 
+      // Montar os detalhes na primeira vez que o evento é expandido
+      const exibido = DashboardApp.state.eventosExibidos[eventoId];
+      if (exibido && !detalhesEl.dataset.montado) {
+        detalhesEl.innerHTML = DashboardApp.eventos.gerarDetalhes(exibido.eventoWrapper, exibido.tipo);
+        detalhesEl.dataset.montado = 'true';
+      }
+
       if (detalhesEl.style.display === 'block') {
         // Fechando os detalhes
         DashboardUtils.ui.resetarAnimacao(detalhesEl, 'slideDown 0.3s ease reverse');
@@ -384,6 +560,7 @@ const DashboardApp = {
       
       tab.classList.add('active');
       document.getElementById(`${tabId}-content`).classList.add('active');
+      DashboardApp.eventos.preencherAba(tabId);
 
       // 3. Rolar até a seção de eventos
       document.getElementById(ids.EVENTOS_CARD).scrollIntoView({
@@ -396,6 +573,16 @@ const DashboardApp = {
 
 // Expor funções necessárias para o escopo global
 window.DashboardApp = {
+  dados: {
+    receber: function(nome, eventos) {
+      DashboardApp.dados.receber(nome, eventos);
+    }
+  },
+  eventos: {
+    irParaPagina: function(containerId, pagina) {
+      DashboardApp.eventos.irParaPagina(containerId, pagina);
+    }
+  },
   ui: {
     toggleEventoDetalhes: function(eventoId) {
       DashboardApp.ui.toggleEventoDetalhes(eventoId);
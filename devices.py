@@ -12,16 +12,25 @@ em dispositivos conectados.
 import subprocess
 import platform
 import os
+import re
 import shutil
 import time
 from tkinter import messagebox
 import threading
 
+# Especificação de filtro do logcat: TAG:PRIORIDADE (a tag pode ser *)
+LOGCAT_FILTER_SPEC = re.compile(r"^[^\s:-][^\s:]*:[VDIWEFS]$")
+# Primeiro nível de API cujo logcat aceita --regex (Android 7.0)
+LOGCAT_REGEX_MIN_SDK = 24
+
 class AdbHelper:
     """
     Utilitário para interagir com dispositivos Android via ADB.
     """
 
+    # Nível de API de cada dispositivo já consultado
+    _sdk_levels = {}
+
     @staticmethod
     def get_connected_devices():
         """
@@ -48,17 +57,69 @@ class AdbHelper:
             return []
 
     @staticmethod
-    def start_logcat(device_id):
+    def get_sdk_level(device_id):
+        """
+        Obtém o nível de API do Android do dispositivo, consultado uma vez por dispositivo.
+
+        Args:
+            device_id (str): ID do dispositivo
+
+        Returns:
+            int: Nível de API ou 0 se não for possível consultá-lo
+        """
+        if device_id not in AdbHelper._sdk_levels:
+            try:
+                result = subprocess.run(
+                    ['adb', '-s', device_id, 'shell', 'getprop', 'ro.build.version.sdk'],
+                    capture_output=True, text=True, timeout=5
+                )
+                AdbHelper._sdk_levels[device_id] = int(result.stdout.strip())
+            except (OSError, subprocess.SubprocessError, ValueError) as e:
+                print(f"Erro ao consultar a versão do Android: {str(e)}")
+                AdbHelper._sdk_levels[device_id] = 0
+        return AdbHelper._sdk_levels[device_id]
+
+    @staticmethod
+    def build_logcat_command(device_id, filter_specs=None, regex=None):
+        """
+        Monta o comando do logcat com os filtros aplicados no próprio dispositivo.
+
+        Args:
+            device_id (str): ID do dispositivo para capturar logs
+            filter_specs (list): Especificações TAG:PRIORIDADE (ex.: ["ReactNativeJS:V", "*:S"])
+            regex (str): Expressão aplicada à mensagem pelo logcat (Android 7.0 ou superior)
+
+        Returns:
+            list: Comando e argumentos
+        """
+        cmd = ['adb', '-s', device_id, 'logcat', '-v', 'time']
+        if regex:
+            if AdbHelper.get_sdk_level(device_id) >= LOGCAT_REGEX_MIN_SDK:
+                cmd.extend(['--regex', regex])
+            else:
+                print("Aviso: logcat do dispositivo não suporta --regex; filtro ignorado")
+        for spec in filter_specs or []:
+            # Valida cada especificação: um valor como "-c" seria lido como opção do logcat
+            if LOGCAT_FILTER_SPEC.match(spec):
+                cmd.append(spec)
+            else:
+                print(f"Aviso: filtro do logcat inválido ignorado: {spec}")
+        return cmd
+
+    @staticmethod
+    def start_logcat(device_id, filter_specs=None, regex=None):
         """
         Inicia a captura de logs via ADB logcat.
 
         Args:
             device_id (str): ID do dispositivo para capturar logs
+            filter_specs (list): Especificações TAG:PRIORIDADE repassadas ao logcat
+            regex (str): Expressão repassada ao logcat com --regex, se o dispositivo suportar
             
         Returns:
             subprocess.Popen: Processo do ADB em execução
         """
-        cmd = ['adb', '-s', device_id, 'logcat', '-v', 'time']
+        cmd = AdbHelper.build_logcat_command(device_id, filter_specs, regex)
         return subprocess.Popen(
             cmd, 
             stdout=subprocess.PIPE, 
@@ -283,13 +344,15 @@ class IosDeviceHelper:
             return []
 
     @staticmethod
-    def start_syslog(device_id=None):
+    def start_syslog(device_id=None, processes=None, matches=None):
         """
         Inicia a captura de logs via idevicesyslog.
 
         Args:
             device_id (str, optional): ID do dispositivo para capturar logs.
                                       Se None, usa o primeiro dispositivo disponível.
+            processes (list, optional): Processos cujas mensagens são capturadas (-p)
+            matches (list, optional): Trechos que a mensagem deve conter (-m)
             
         Returns:
             subprocess.Popen: Processo do idevicesyslog em execução
@@ -303,6 +366,11 @@ class IosDeviceHelper:
         cmd = [idevicesyslog_path]
         if device_id:
             cmd.extend(['-u', device_id])
+        # Filtros aplicados pelo próprio idevicesyslog
+        for process_name in processes or []:
+            cmd.extend(['-p', process_name])
+        for match in matches or []:
+            cmd.extend(['-m', match])
             
         return subprocess.Popen(
             cmd, 
@@ -393,18 +461,20 @@ class IosDeviceHelper:
             return False
         
     @staticmethod
-    def start_ios_logging(device_id=None):
+    def start_ios_logging(device_id=None, processes=None, matches=None):
         """
         Alias for start_syslog for backward compatibility.
         
         Args:
             device_id (str, optional): ID do dispositivo para capturar logs.
                                     Se None, usa o primeiro dispositivo disponível.
+            processes (list, optional): Processos cujas mensagens são capturadas (-p)
+            matches (list, optional): Trechos que a mensagem deve conter (-m)
             
         Returns:
             subprocess.Popen: Processo do idevicesyslog em execução
         """
-        return IosDeviceHelper.start_syslog(device_id)
+        return IosDeviceHelper.start_syslog(device_id, processes, matches)
     
     @staticmethod
     def stop_ios_logging(process=None):
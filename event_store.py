@@ -0,0 +1,404 @@
+"""
+Este arquivo contém a estrutura colunar usada para armazenar eventos carregados de CSV.
+Responsabilidades:
+- Armazenamento compacto dos eventos (uma lista por coluna, com valores internados)
+- Acesso linha a linha por meio de visões leves, sem criar um dicionário por evento
+- Normalização de colunas inteiras para comparação
+- Conversão das visões para JSON
+- Cache em disco das tabelas já carregadas e normalizadas
+
+Planilhas e capturas de log com centenas de milhares de linhas ocupam uma fração
+da memória que ocupariam como lista de dicionários.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sys
+from array import array
+from collections.abc import Mapping
+
+# Versão do formato do cache; incrementar quando a estrutura da EventTable mudar
+CACHE_VERSION = 2
+
+# Tipos de array usados para os códigos das colunas no cache, do menor para o maior
+CACHE_CODE_TYPES = ("B", "H", "I")
+
+
+class EventTable:
+    """
+    Tabela colunar de eventos, equivalente a uma lista de linhas do csv.DictReader.
+    """
+
+    def __init__(self, fieldnames):
+        """
+        Inicializa a tabela vazia com as colunas do cabeçalho.
+
+        Args:
+            fieldnames (list): Nomes das colunas, na ordem do cabeçalho do CSV
+        """
+        self.fieldnames = list(fieldnames)
+        # Assim como no DictReader, colunas repetidas ficam com o valor da última posição
+        positions = {name: i for i, name in enumerate(self.fieldnames)}
+        self.fields = list(dict.fromkeys(self.fieldnames))
+        self._positions = [positions[name] for name in self.fields]
+        self.columns = {name: [] for name in self.fields}
+        self.extras = {}
+        self.header_line = None
+        self._length = 0
+        self._normalized = {}
+
+    def append(self, values):
+        """
+        Adiciona uma linha de valores lidos pelo csv.reader.
+
+        Args:
+            values (list): Valores da linha, na ordem do cabeçalho
+        """
+        size = len(values)
+        for name, position in zip(self.fields, self._positions):
+            value = values[position] if position < size else None
+            self.columns[name].append(sys.intern(value) if value else value)
+        # Valores excedentes ficam sob a chave None, como o restkey padrão do DictReader
+        if size > len(self.fieldnames):
+            self.extras[self._length] = values[len(self.fieldnames):]
+        self._length += 1
+        self._normalized.clear()
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Índice de evento fora do intervalo")
+        return EventRow(self, index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield EventRow(self, index)
+
+    def normalized_column(self, name):
+        """
+        Retorna a coluna com valores normalizados (str().strip(), vazio para ausentes).
+
+        Args:
+            name (str): Nome da coluna
+
+        Returns:
+            list: Valores normalizados, um por linha
+        """
+        column = self._normalized.get(name)
+        if column is not None:
+            return column
+        if name == "ID":
+            column = [str(i) for i in range(1, self._length + 1)]
+        elif name in self.columns:
+            # Colunas internadas têm poucos valores distintos: normaliza cada um uma única vez
+            cache = {}
+            column = []
+            changed = False
+            for value in self.columns[name]:
+                normalized = cache.get(value)
+                if normalized is None:
+                    normalized = cache[value] = str(value).strip() if value is not None else ""
+                    changed = changed or normalized is not value
+                column.append(normalized)
+            # Coluna já normalizada: reaproveita a lista original em vez de manter uma cópia
+            if not changed:
+                column = self.columns[name]
+        else:
+            column = [""] * self._length
+        self._normalized[name] = column
+        return column
+
+    def iter_normalized(self, names):
+        """
+        Percorre as linhas como tuplas de valores normalizados.
+
+        Args:
+            names (list): Colunas que compõem cada tupla
+
+        Returns:
+            iterator: Tuplas de valores normalizados, uma por linha
+        """
+        return zip(*(self.normalized_column(name) for name in names))
+
+
+class EventRow(Mapping):
+    """
+    Visão somente leitura de uma linha da EventTable, com a interface de um dicionário.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        """
+        Args:
+            table (EventTable): Tabela de origem
+            index (int): Posição da linha na tabela
+        """
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key):
+        if key == "ID":
+            return self._index + 1
+        if key is None and self._index in self._table.extras:
+            return self._table.extras[self._index]
+        if key in self._table.columns:
+            return self._table.columns[key][self._index]
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from self._table.fields
+        if self._index in self._table.extras:
+            yield None
+        if "ID" not in self._table.columns:
+            yield "ID"
+
+    def __len__(self):
+        return (len(self._table.fields) + (self._index in self._table.extras)
+                + ("ID" not in self._table.columns))
+
+    def __repr__(self):
+        return f"EventRow({dict(self)!r})"
+
+    def normalized(self):
+        """
+        Retorna uma cópia normalizada da linha, como EventComparator.normalize_event.
+
+        Returns:
+            dict: Linha com valores convertidos para texto sem espaços nas bordas
+        """
+        return {k: str(v).strip() if v is not None else "" for k, v in self.items()}
+
+
+class EventTableCache:
+    """
+    Cache em disco de tabelas carregadas de CSV, gravado ao lado do arquivo de origem.
+
+    A tabela é guardada com as colunas já normalizadas no arquivo oculto
+    ".<nome do csv>.cache". O cache só é usado se o caminho, o tamanho, a data de
+    modificação e o hash do conteúdo do CSV forem os mesmos da gravação.
+
+    O formato é JSON: cada coluna vira a lista dos seus valores distintos e os códigos
+    (índices nessa lista) de cada linha, em um array de inteiros codificado em base64.
+    Ler um cache nunca executa código, mesmo que o arquivo tenha sido alterado por
+    terceiros (planilhas costumam ficar em pastas compartilhadas); um cache adulterado
+    só consegue fornecer dados, como o próprio CSV ao lado dele.
+    """
+
+    @staticmethod
+    def cache_path(file_path):
+        """
+        Caminho do arquivo de cache de um CSV.
+
+        Args:
+            file_path (str): Caminho do CSV
+
+        Returns:
+            str: Caminho do cache
+        """
+        directory, name = os.path.split(os.path.abspath(file_path))
+        return os.path.join(directory, f".{name}.cache")
+
+    @staticmethod
+    def signature(file_path):
+        """
+        Identifica o conteúdo atual de um CSV.
+
+        Args:
+            file_path (str): Caminho do CSV
+
+        Returns:
+            tuple: (caminho absoluto, tamanho, data de modificação em ns, hash do conteúdo)
+        """
+        stat = os.stat(file_path)
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, digest.hexdigest()
+
+    @staticmethod
+    def _encode_column(column):
+        """
+        Codifica uma coluna como valores distintos e códigos por linha.
+
+        Args:
+            column (list): Valores da coluna (str ou None)
+
+        Returns:
+            dict: {"valores": [...], "tipo": typecode do array, "codigos": base64 dos códigos}
+        """
+        codes_by_value = {}
+        codes = [codes_by_value.setdefault(value, len(codes_by_value)) for value in column]
+        # Menor inteiro sem sinal que comporta os códigos: colunas repetitivas ocupam 1 byte por linha
+        typecode = next(code for code in CACHE_CODE_TYPES if len(codes_by_value) <= 1 << (8 * array(code).itemsize))
+        codes = array(typecode, codes)
+        if sys.byteorder != "little":
+            codes.byteswap()
+        return {"valores": list(codes_by_value), "tipo": typecode,
+                "codigos": base64.b64encode(codes.tobytes()).decode("ascii")}
+
+    @staticmethod
+    def _decode_column(data, length):
+        """
+        Reconstrói uma coluna codificada por _encode_column.
+
+        Args:
+            data (dict): Coluna codificada
+            length (int): Número de linhas esperado
+
+        Returns:
+            list: Valores da coluna, com os textos internados como no carregamento do CSV
+
+        Raises:
+            ValueError: Se a coluna não tiver o formato esperado
+        """
+        values = data["valores"]
+        if not all(value is None or isinstance(value, str) for value in values):
+            raise ValueError("valores de coluna inválidos")
+        values = [sys.intern(value) if value else value for value in values]
+        if data["tipo"] not in CACHE_CODE_TYPES:
+            raise ValueError("tipo de código inválido")
+        codes = array(data["tipo"])
+        codes.frombytes(base64.b64decode(data["codigos"], validate=True))
+        if sys.byteorder != "little":
+            codes.byteswap()
+        if len(codes) != length:
+            raise ValueError("número de linhas divergente")
+        # Códigos fora da lista de valores geram IndexError
+        return list(map(values.__getitem__, codes))
+
+    @staticmethod
+    def _encode_table(table):
+        """
+        Converte a tabela em um dicionário serializável em JSON.
+
+        Args:
+            table (EventTable): Tabela carregada
+
+        Returns:
+            dict: Estado da tabela
+        """
+        encode = EventTableCache._encode_column
+        normalized = {}
+        for name, column in table._normalized.items():
+            if name == "ID":
+                continue
+            # Coluna que já estava normalizada é a própria lista original
+            normalized[name] = "original" if column is table.columns.get(name) else encode(column)
+        return {
+            "cabecalho": table.fieldnames,
+            "linha_cabecalho": table.header_line,
+            "linhas": len(table),
+            "colunas": {name: encode(column) for name, column in table.columns.items()},
+            "normalizadas": normalized,
+            "extras": [[index, values] for index, values in table.extras.items()]
+        }
+
+    @staticmethod
+    def _decode_table(data):
+        """
+        Reconstrói a tabela a partir do dicionário gravado por _encode_table.
+
+        Args:
+            data (dict): Estado da tabela
+
+        Returns:
+            EventTable: Tabela reconstruída
+
+        Raises:
+            ValueError, KeyError, TypeError, IndexError: Se o estado não tiver o formato esperado
+        """
+        decode = EventTableCache._decode_column
+        table = EventTable(data["cabecalho"])
+        length = data["linhas"]
+        if not isinstance(length, int) or set(data["colunas"]) != set(table.fields):
+            raise ValueError("estrutura da tabela inválida")
+        table.header_line = data["linha_cabecalho"]
+        table.columns = {name: decode(data["colunas"][name], length) for name in table.fields}
+        table.extras = {int(index): [str(value) for value in values] for index, values in data["extras"]}
+        table._length = length
+        for name, column in data["normalizadas"].items():
+            table._normalized[name] = table.columns[name] if column == "original" else decode(column, length)
+        return table
+
+    @staticmethod
+    def load(file_path, signature):
+        """
+        Lê a tabela do cache, se ele corresponder à versão atual do CSV.
+
+        Args:
+            file_path (str): Caminho do CSV
+            signature (tuple): Assinatura atual do CSV (EventTableCache.signature)
+
+        Returns:
+            EventTable: Tabela em cache ou None se não houver cache válido
+        """
+        try:
+            with open(EventTableCache.cache_path(file_path), encoding="utf-8") as f:
+                data = json.load(f)
+            if (not isinstance(data, dict) or data.get("versao") != CACHE_VERSION
+                    or data.get("assinatura") != list(signature)):
+                return None
+            return EventTableCache._decode_table(data["tabela"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Cache corrompido ou de outra versão da aplicação: é refeito na próxima gravação
+            print(f"Cache ignorado para {file_path}: {e}")
+            return None
+
+    @staticmethod
+    def save(file_path, signature, table, normalize=()):
+        """
+        Grava a tabela no cache, com as colunas informadas já normalizadas.
+
+        Falhas de gravação (ex.: diretório somente leitura) não interrompem a validação.
+
+        Args:
+            file_path (str): Caminho do CSV
+            signature (tuple): Assinatura do CSV lida antes do carregamento
+            table (EventTable): Tabela carregada
+            normalize (list): Colunas a normalizar antes de gravar
+        """
+        for name in normalize:
+            table.normalized_column(name)
+        cache_path = EventTableCache.cache_path(file_path)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"versao": CACHE_VERSION, "assinatura": list(signature),
+                           "tabela": EventTableCache._encode_table(table)},
+                          f, ensure_ascii=False, separators=(",", ":"))
+            # Troca atômica: leitores nunca veem um cache pela metade
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Não foi possível gravar o cache de {file_path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def to_serializable(obj):
+    """
+    Função `default` para json.dump/json.dumps que converte visões de linha em dicionários.
+
+    Args:
+        obj: Objeto que o módulo json não sabe serializar
+
+    Returns:
+        dict: Conteúdo da linha
+
+    Raises:
+        TypeError: Se o objeto não for uma visão de linha
+    """
+    if isinstance(obj, EventRow):
+        return dict(obj)
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
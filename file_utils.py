@@ -10,8 +10,11 @@ e organizar a estrutura de diretórios para armazenamento dos dados.
 """
 
 from datetime import datetime
+import csv
 import os
 
+from log_processor import CSV_HEADER
+
 class FileHelper:
     """
     Utilitário para operações com arquivos e diretórios.
@@ -120,8 +123,7 @@ class FileHelper:
                     filepath = os.path.join(func_dir, filename)
                     
                     # Formata e salva logs
-                    formatted_logs = log_processor.format_logs_for_csv(subfunc_data["logs"])
-                    FileHelper.save_csv(filepath, formatted_logs)  
+                    FileHelper.save_csv(filepath, log_processor.iter_export_rows(subfunc_data["logs"]))
                     saved_files.append(filepath)
             else:
                 # Caso sem subfuncionalidade
@@ -137,26 +139,71 @@ class FileHelper:
                 filepath = os.path.join(func_dir, filename)
                 
                 # Formata e salva logs
-                formatted_logs = log_processor.format_logs_for_csv(logs_to_save)
-                FileHelper.save_csv(filepath, formatted_logs)  
+                FileHelper.save_csv(filepath, log_processor.iter_export_rows(logs_to_save))
                 saved_files.append(filepath)
         
         return saved_files
 
+    @staticmethod
+    def export_logs_to_directory(logs, base_dir, log_processor):
+        """
+        Exporta logs em arquivos CSV por funcionalidade, em uma única passada.
+
+        Cada linha decodificada vai direto para o CSV da sua funcionalidade, aberto na
+        primeira linha dela; nada é agrupado em memória antes da gravação. Os arquivos
+        seguem os nomes de save_logs_to_directory.
+
+        Args:
+            logs (iterable): Logs capturados (ex.: CaptureBuffer)
+            base_dir (str): Diretório base onde salvar
+            log_processor: Processador de logs (LogProcessor)
+
+        Returns:
+            list: Caminhos dos arquivos salvos
+        """
+        files = {}
+        writers = {}
+        saved_files = []
+        try:
+            for functionality, row in log_processor.iter_rows_by_functionality(logs):
+                if not functionality or functionality.lower() == "undefined":
+                    functionality = "sem_funcionalidade"
+                safe_functionality = FileHelper.sanitize_name(functionality)
+
+                writer = writers.get(safe_functionality)
+                if writer is None:
+                    func_dir = os.path.join(base_dir, safe_functionality)
+                    os.makedirs(func_dir, exist_ok=True)
+
+                    # Nome do arquivo com timestamp
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    filepath = os.path.join(func_dir, f"{safe_functionality}_{timestamp}.csv")
+                    files[safe_functionality] = open(filepath, 'w', encoding='utf-8', newline='')
+                    writer = writers[safe_functionality] = csv.writer(files[safe_functionality])
+                    writer.writerow(CSV_HEADER)
+                    saved_files.append(filepath)
+
+                if row is not None:
+                    writer.writerow(row)
+        finally:
+            for f in files.values():
+                f.close()
+
+        return saved_files
+
     @staticmethod
     def save_csv(filepath, data):
         """
         Salva dados em formato CSV.
         
+        As linhas são gravadas à medida que são produzidas: um gerador de linhas
+        é exportado sem ser materializado em memória.
+        
         Args:
             filepath: Caminho do arquivo
-            data: Dados a serem salvos
+            data: Linhas a serem salvas (lista de listas ou iterador de tuplas)
         """
-        # Implementar método para salvar dados em CSV
-        # Este método precisa ser implementado também como estático
         with open(filepath, 'w', encoding='utf-8', newline='') as f:
-            if data:
-                # Assumindo que data é uma lista de listas ou similar
-                import csv
+            if data is not None:
                 writer = csv.writer(f)
-                writer.writerows(data)
\ No newline at end of file
+                writer.writerows(data)
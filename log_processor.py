@@ -2,156 +2,674 @@
 Este arquivo contém classes e funções para processamento de logs de tagueamento.
 Responsabilidades:
 - Processamento e estruturação de logs capturados
+- Decodificação única de cada linha (LogRecord), reaproveitada no agrupamento e na exportação
+- Registro de decodificadores por formato (methodData, Bundle do GA4, Firebase do iOS)
 - Conversão de logs para formato CSV
 - Agrupamento de logs por funcionalidade
-- Filtros e manipulação de dados de logs
+- Filtros e manipulação de dados de logs (LogLineFilter, configurável em filtro_logs.json)
 
 Esta classe é central para a análise e processamento dos eventos de tagueamento
 capturados de diversas fontes, incluindo dispositivos Android.
 """
 
 import json
-import re
 import csv
+import os
 from io import StringIO
 
+# Cabeçalho do CSV de logs
+CSV_HEADER = [
+    "NOME DO EVENTO", "AMBIENTE", "PRODUTO", "FUNCIONALIDADE", "SUBFUNCIONALIDADE",
+    "CATEGORIA", "TELA", "ACAO", "ELEMENTO", "ROTULO", "USER_ID", "TIPO_USUARIO",
+    "OPCAO_SELECIONADA_1", "OPCAO_SELECIONADA_2", "OPCAO_SELECIONADA_3",
+    "OPCAO_SELECIONADA_4", "OPCAO_SELECIONADA_5", "OPCAO_SELECIONADA_6"
+]
+METHOD_DATA_MARKER = "methodData:"
+_JSON_DECODER = json.JSONDecoder()
+
+# Arquivo de configuração dos filtros de captura (opcional, na pasta da aplicação)
+LOG_FILTER_CONFIG = "filtro_logs.json"
+# Filtros de captura usados quando o arquivo de configuração não define a plataforma
+DEFAULT_LOG_FILTERS = {
+    "android": {"palavras": ["TAG_EVENTO", "analytics", "Analytics", "evento"], "ignorar_maiusculas": False},
+    "ios": {"palavras": ["tag_evento", "analytics", "evento", "firebase"], "ignorar_maiusculas": True}
+}
+
+
+def extract_method_data(line):
+    """
+    Extrai o methodData de uma linha de log em duas etapas.
+
+    Primeiro localiza o marcador "methodData:" com str.find; só então decodifica o JSON
+    com raw_decode a partir da chave de abertura, ignorando o que vier depois do objeto.
+    Linhas sem o marcador não passam por expressão regular nem por tratamento de exceção.
+
+    Args:
+        line (str): Linha de log
+
+    Returns:
+        tuple: (methodData decodificado ou None, texto do JSON inválido ou None)
+    """
+    start = line.find(METHOD_DATA_MARKER)
+    while start != -1:
+        brace = start + len(METHOD_DATA_MARKER)
+        # Espaços entre o marcador e a chave são aceitos, inclusive quebras de linha
+        while brace < len(line) and line[brace].isspace():
+            brace += 1
+        if line.startswith("{", brace):
+            try:
+                return _JSON_DECODER.raw_decode(line, brace)[0], None
+            except json.JSONDecodeError:
+                # Objeto inválido: devolve o trecho até a última chave de fechamento da linha
+                line_end = line.find("\n", brace)
+                closing = line.rfind("}", brace, len(line) if line_end == -1 else line_end)
+                if closing != -1:
+                    return None, line[brace:closing + 1]
+        start = line.find(METHOD_DATA_MARKER, start + 1)
+    return None, None
+
+
+def _strip_internal_name(name):
+    """
+    Remove o nome interno do Firebase que acompanha a chave, como em "ga_screen (_sn)".
+
+    Args:
+        name (str): Nome exibido no log
+
+    Returns:
+        str: Nome sem o sufixo interno
+    """
+    name = name.strip()
+    if name.endswith(")") and "(_" in name:
+        name = name[:name.rfind("(_")]
+    return name.strip()
+
+
+def _strip_quotes(value):
+    """
+    Remove aspas que envolvem um valor textual.
+
+    Args:
+        value (str): Valor exibido no log
+
+    Returns:
+        str: Valor sem aspas
+    """
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+def decode_bundle_event(line):
+    """
+    Decodifica eventos do Firebase/GA4 impressos como Bundle no logcat.
+
+    Formatos aceitos:
+        Logging event (FE): screen_view(_vs), Bundle[{ga_event_origin(_o)=auto, tela=inicio}]
+        Logging event: origin=app,name=click,params=Bundle[{funcionalidade=inicio, acao=clique}]
+
+    Args:
+        line (str): Linha de log
+
+    Returns:
+        tuple: ({"name", "params"} ou None, sempre None: dumps incompletos são ignorados)
+    """
+    start = line.find("Bundle[{")
+    end = line.rfind("}]")
+    if start == -1 or end < start:
+        return None, None
+
+    header = line[:start]
+    name_position = header.find("name=")
+    if name_position != -1:
+        name = header[name_position + len("name="):].split(",", 1)[0]
+    else:
+        marker = header.rfind(":")
+        name = header[marker + 1:].rstrip().rstrip(",")
+
+    params = {}
+    for pair in line[start + len("Bundle[{"):end].split(", "):
+        key, separator, value = pair.partition("=")
+        if separator:
+            params[_strip_internal_name(key)] = value.strip()
+    return {"name": _strip_internal_name(name), "params": params}, None
+
+
+def decode_firebase_event(line):
+    """
+    Decodifica eventos do Firebase impressos pelo idevicesyslog (iOS).
+
+    Formato aceito (bloco de parâmetros em uma única linha; veja PayloadLineJoiner):
+        [FirebaseAnalytics][I-ACS023051] Logging event: origin, name, params: app, click, { tela = inicio; }
+
+    Args:
+        line (str): Linha de log
+
+    Returns:
+        tuple: ({"name", "params"} ou None, sempre None: blocos incompletos são ignorados)
+    """
+    marker = line.find("params:")
+    start = line.find("{", marker)
+    end = line.rfind("}")
+    if marker == -1 or start == -1 or end < start:
+        return None, None
+
+    # Antes do bloco: "<origem>, <nome>,"
+    header = [part.strip() for part in line[marker + len("params:"):start].split(",")]
+    name = header[1] if len(header) > 1 else header[0]
+
+    params = {}
+    for pair in line[start + 1:end].split(";"):
+        key, separator, value = pair.partition("=")
+        if separator:
+            params[_strip_internal_name(key)] = _strip_quotes(value)
+    return {"name": _strip_internal_name(name), "params": params}, None
+
+
+# Decodificadores de payload, na ordem de verificação: (marcador, função)
+# Cada linha vai direto ao primeiro decodificador cujo marcador ela contém.
+PAYLOAD_DECODERS = [
+    (METHOD_DATA_MARKER, extract_method_data),
+    ("Bundle[{", decode_bundle_event),
+    ("Logging event:", decode_firebase_event),
+]
+
+
+def register_decoder(marker, decoder, first=False):
+    """
+    Registra um decodificador de payload.
+
+    Args:
+        marker (str): Trecho que identifica as linhas do formato
+        decoder: Função que recebe a linha e retorna (payload ou None, texto inválido ou None);
+            o payload segue o formato do methodData: {"name": ..., "params": {...}}
+        first (bool): Se True, o decodificador é verificado antes dos existentes
+    """
+    if first:
+        PAYLOAD_DECODERS.insert(0, (marker, decoder))
+    else:
+        PAYLOAD_DECODERS.append((marker, decoder))
+
+
+def decode_payload(line):
+    """
+    Decodifica o payload de uma linha com o decodificador do seu formato.
+
+    Args:
+        line (str): Linha de log
+
+    Returns:
+        tuple: (payload decodificado ou None, texto do JSON inválido ou None)
+    """
+    for marker, decoder in PAYLOAD_DECODERS:
+        if marker in line:
+            return decoder(line)
+    return None, None
+
+
+class PayloadLineJoiner:
+    """
+    Junta em uma única linha os blocos de parâmetros que o idevicesyslog imprime em várias linhas.
+    """
+
+    def __init__(self, marker="Logging event:", max_lines=200):
+        """
+        Args:
+            marker (str): Trecho que identifica a linha inicial de um bloco
+            max_lines (int): Limite de linhas de um bloco; blocos maiores são liberados sem fechar
+        """
+        self.marker = marker
+        self.max_lines = max_lines
+        self.pending = None
+
+    def feed(self, line):
+        """
+        Recebe a próxima linha capturada.
+
+        Args:
+            line (str): Linha lida do processo
+
+        Returns:
+            str: Linha completa (já unida, se fazia parte de um bloco) ou None enquanto o bloco não fecha
+        """
+        if self.pending is not None:
+            self.pending.append(line.strip())
+            if not line.strip().startswith("}") and len(self.pending) < self.max_lines:
+                return None
+            joined = " ".join(self.pending) + "\n"
+            self.pending = None
+            return joined
+
+        # Linha inicial com bloco aberto e não fechado: aguarda as próximas
+        if self.marker in line:
+            brace = line.rfind("{")
+            if brace != -1 and "}" not in line[brace:]:
+                self.pending = [line.rstrip()]
+                return None
+        return line
+
+
+def load_filter_config(config_path=None):
+    """
+    Carrega a configuração dos filtros de captura, completada com os filtros padrão.
+
+    Args:
+        config_path (str): Caminho do JSON (padrão: filtro_logs.json na pasta da aplicação)
+
+    Returns:
+        dict: Configuração por plataforma ("android", "ios")
+    """
+    if config_path is None:
+        config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), LOG_FILTER_CONFIG)
+
+    config = {platform: dict(options) for platform, options in DEFAULT_LOG_FILTERS.items()}
+    if not os.path.exists(config_path):
+        return config
+    try:
+        with open(config_path, encoding="utf-8") as f:
+            custom = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Erro ao ler {config_path}, usando os filtros padrão: {str(e)}")
+        return config
+
+    for platform, options in custom.items():
+        if isinstance(options, dict):
+            config.setdefault(platform, {}).update(options)
+    return config
+
+
+# Letras da mais para a menos frequente em linhas de log; a mais rara de cada palavra-chave
+# é a âncora do pré-filtro sem distinção de maiúsculas
+ANCHOR_LETTER_FREQUENCY = "etaoinsrhldcumfpgwybvkxjqz"
+
+# Caracteres fora do ASCII cujo lower() contém uma letra ASCII
+ANCHOR_EXTRA_VARIANTS = {"i": "\u0130", "k": "\u212a"}
+
+
+class LogLineFilter:
+    """
+    Filtro das linhas capturadas por palavras-chave, montado uma única vez por captura.
+
+    A verificação é feita com buscas de substring (str.__contains__) sobre a linha lida,
+    antes de qualquer cópia ou conversão: no CPython isso é mais rápido que uma expressão
+    regular com alternativas, que percorre a linha caractere a caractere (com re.IGNORECASE,
+    dez vezes mais lenta).
+
+    Sem distinção de maiúsculas, a linha só é convertida com lower() se contiver, em qualquer
+    caixa, a letra mais rara de alguma palavra-chave; as demais são descartadas sem cópia.
+    """
+
+    def __init__(self, keywords, ignore_case=False):
+        """
+        Args:
+            keywords (list): Palavras-chave; a linha passa se contiver qualquer uma delas
+            ignore_case (bool): Se True, ignora maiúsculas e minúsculas
+        """
+        self.ignore_case = ignore_case
+        keywords = {keyword.lower() if ignore_case else keyword for keyword in keywords if keyword}
+        # Palavras que contêm outra palavra da lista nunca mudam o resultado
+        self.keywords = tuple(sorted(
+            (keyword for keyword in keywords
+             if not any(other != keyword and other in keyword for other in keywords)),
+            key=lambda keyword: (len(keyword), keyword)
+        ))
+        self.matches = self._compile()
+
+    @classmethod
+    def for_platform(cls, platform, config_path=None):
+        """
+        Cria o filtro configurado para uma plataforma.
+
+        Args:
+            platform (str): "android" ou "ios"
+            config_path (str): Caminho do JSON de configuração (padrão: filtro_logs.json)
+
+        Returns:
+            LogLineFilter: Filtro da plataforma
+        """
+        return cls.from_options(load_filter_config(config_path).get(platform, {}))
+
+    @classmethod
+    def from_options(cls, options):
+        """
+        Cria o filtro a partir da configuração de uma plataforma.
+
+        Args:
+            options (dict): Configuração da plataforma ("palavras", "ignorar_maiusculas")
+
+        Returns:
+            LogLineFilter: Filtro configurado
+        """
+        return cls(options.get("palavras", []), options.get("ignorar_maiusculas", False))
+
+    def _compile(self):
+        """
+        Monta a função de verificação para as palavras-chave do filtro.
+
+        Returns:
+            function: Recebe uma linha e retorna True se ela deve ser capturada
+        """
+        keywords = self.keywords
+        if not keywords:
+            # Sem palavras-chave, todas as linhas são capturadas
+            return lambda line: True
+
+        if self.ignore_case:
+            anchors = self._anchors()
+
+            def matches(line):
+                # Pré-filtro com distinção de maiúsculas: evita o lower() de linhas sem nenhuma âncora
+                for anchor in anchors:
+                    if anchor in line:
+                        break
+                else:
+                    return False
+                line = line.lower()
+                for keyword in keywords:
+                    if keyword in line:
+                        return True
+                return False
+        else:
+            def matches(line):
+                for keyword in keywords:
+                    if keyword in line:
+                        return True
+                return False
+        return matches
+
+    def _anchors(self):
+        """
+        Caracteres do pré-filtro sem distinção de maiúsculas.
+
+        Para cada palavra-chave é escolhido o caractere ASCII mais raro (caracteres sem caixa,
+        como "_" e dígitos, têm prioridade); a âncora entra com todas as formas cujo lower()
+        a contém. Toda linha que contém a palavra-chave em qualquer caixa contém uma delas.
+
+        Returns:
+            tuple: Caracteres procurados antes do lower(), dos mais aos menos prováveis
+                   (a busca para na primeira encontrada); ("",) desativa o pré-filtro
+        """
+        anchors = set()
+        for keyword in self.keywords:
+            candidates = [char for char in keyword if char.isascii()]
+            if not candidates:
+                # Palavra só com caracteres fora do ASCII: sem âncora segura, toda linha é convertida
+                return ("",)
+            anchor = max(candidates, key=lambda char: ANCHOR_LETTER_FREQUENCY.find(char)
+                         if char.isalpha() else len(ANCHOR_LETTER_FREQUENCY))
+            anchors.update({anchor, anchor.upper()}, ANCHOR_EXTRA_VARIANTS.get(anchor, ""))
+        # Minúsculas frequentes primeiro: na maioria das linhas a busca para na primeira âncora
+        return tuple(sorted(anchors, key=lambda char: (
+            0 if char.islower() else 1 if char.isupper() else 2,
+            ANCHOR_LETTER_FREQUENCY.find(char.lower()),
+            char
+        )))
+
+
+class LogFormatError(ValueError):
+    """methodData decodificado, mas sem a estrutura esperada (ex.: params que não é um objeto)"""
+
+
+class LogRecord:
+    """
+    Linha de log capturada, decodificada uma única vez e guardada junto do texto original.
+
+    Do methodData são guardados apenas a funcionalidade e os valores da linha de CSV:
+    o dicionário decodificado é descartado para manter os registros leves.
+    """
+
+    __slots__ = ("raw", "_status", "_functionality", "_row", "_error")
+
+    # Situações possíveis após a decodificação
+    SEM_DADOS = "sem_dados"
+    JSON_INVALIDO = "json_invalido"
+    ERRO = "erro"
+    OK = "ok"
+
+    def __init__(self, raw):
+        """
+        Args:
+            raw (str): Linha de log original
+        """
+        self.raw = raw
+        self._status = None
+        self._functionality = None
+        self._row = None
+        self._error = None
+
+    @classmethod
+    def of(cls, log):
+        """
+        Converte uma linha de log em registro, reaproveitando registros já existentes.
+
+        Args:
+            log (str | LogRecord): Linha de log ou registro
+
+        Returns:
+            LogRecord: Registro correspondente
+        """
+        return log if isinstance(log, cls) else cls(log)
+
+    @property
+    def status(self):
+        """
+        str: Situação da linha (SEM_DADOS, JSON_INVALIDO, ERRO ou OK), decodificada no primeiro acesso
+        """
+        if self._status is None:
+            self._status = self._decode()
+        return self._status
+
+    def _decode(self):
+        """
+        Localiza e decodifica o payload da linha (methodData, Bundle do GA4 ou evento do Firebase iOS).
+
+        Returns:
+            str: Situação resultante da decodificação
+        """
+        method_data, invalid_json = decode_payload(self.raw)
+        if invalid_json is not None:
+            print(f"Erro ao decifrar JSON: {invalid_json}")
+            return self.JSON_INVALIDO
+        if method_data is None:
+            return self.SEM_DADOS
+
+        try:
+            # Extrai os campos necessários do JSON
+            nome_evento = method_data.get("name", "")
+            params = method_data.get("params", {})
+            self._functionality = params.get("funcionalidade", "sem_funcionalidade")
+
+            # Adicionando a extração dos campos necessários
+            user_id = params.get("userId", "")
+            tipo_usuario = params.get("tipo_usuario", "")
+
+            # Monta a linha do CSV
+            self._row = (
+                nome_evento,
+                params.get("ambiente", ""),
+                params.get("produto", ""),
+                params.get("funcionalidade", ""),
+                params.get("subFuncionalidade", ""),
+                "",  # SUBFUNCIONALIDADE
+                params.get("categoria", ""),
+                params.get("tela", ""),
+                params.get("acao", ""),
+                params.get("elemento", ""),
+                params.get("rotulo", ""),
+                user_id,  # USER_ID
+                tipo_usuario,  # TIPO_USUARIO
+                params.get("opcao1", ""),  # OPCAO_SELECIONADA_1
+                params.get("opcao2", ""),  # OPCAO_SELECIONADA_2
+                params.get("opcao3", ""),  # OPCAO_SELECIONADA_3
+                params.get("opcao4", ""),  # OPCAO_SELECIONADA_4
+                params.get("opcao5", ""),  # OPCAO_SELECIONADA_5
+                params.get("opcao6", ""),  # OPCAO_SELECIONADA_6
+            )
+        except Exception as e:
+            # Guarda só a mensagem: a exceção original prenderia o traceback ao registro
+            self._error = str(e)
+            return self.ERRO
+        return self.OK
+
+    @property
+    def functionality(self):
+        """
+        Funcionalidade informada no methodData ("sem_funcionalidade" se o JSON for inválido)
+
+        Raises:
+            LogFormatError: Se o methodData não tiver a estrutura esperada
+        """
+        status = self.status
+        if status == self.ERRO:
+            raise LogFormatError(self._error)
+        if status == self.OK:
+            return self._functionality
+        return "sem_funcionalidade"
+
+    def csv_row(self):
+        """
+        Retorna os valores da linha de CSV.
+
+        Returns:
+            tuple: Valores da linha, ou None se a linha não tiver methodData válido
+
+        Raises:
+            LogFormatError: Se o methodData não tiver a estrutura esperada
+        """
+        status = self.status
+        if status == self.ERRO:
+            raise LogFormatError(self._error)
+        return self._row
+
+
 class LogProcessor:
     """
     Responsável pelo processamento e manipulação de logs de tagueamento.
     """
 
+    def iter_csv_rows(self, logs):
+        """
+        Percorre as linhas de CSV dos logs que contêm methodData válido.
+
+        Args:
+            logs (iterable): Logs capturados (strings ou LogRecord)
+
+        Returns:
+            iterator: Valores de cada linha, na ordem dos logs
+        """
+        for log in logs:
+            try:
+                row = LogRecord.of(log).csv_row()
+            except Exception as e:
+                print(f"Erro ao processar log: {str(e)}")
+                continue
+            if row is not None:
+                yield row
+
+    def iter_export_rows(self, logs):
+        """
+        Percorre as linhas do CSV de exportação (cabeçalho seguido dos eventos) sem materializá-las.
+
+        Os valores são repassados como estão; a conversão para texto fica a cargo do csv.writer.
+
+        Args:
+            logs (iterable): Logs capturados (strings ou LogRecord)
+
+        Returns:
+            iterator: Tuplas de valores, uma por linha do CSV
+        """
+        yield tuple(CSV_HEADER)
+        yield from self.iter_csv_rows(logs)
+
     def process_logs_to_csv(self, logs):
         """
         Converte logs de tagueamento para formato CSV estruturado.
 
         Args:
-            logs (list): Lista de strings contendo os logs capturados
+            logs (list): Lista de logs capturados (strings ou LogRecord)
             
         Returns:
             str: Conteúdo CSV formatado pronto para ser salvo em arquivo
         """
-        # Cabeçalho do CSV
-        header_fields = [
-            "NOME DO EVENTO", "AMBIENTE", "PRODUTO", "FUNCIONALIDADE", "SUBFUNCIONALIDADE",
-            "CATEGORIA", "TELA", "ACAO", "ELEMENTO", "ROTULO", "USER_ID", "TIPO_USUARIO",
-            "OPCAO_SELECIONADA_1", "OPCAO_SELECIONADA_2", "OPCAO_SELECIONADA_3",
-            "OPCAO_SELECIONADA_4", "OPCAO_SELECIONADA_5", "OPCAO_SELECIONADA_6"
-        ]
-
         output = StringIO()
         writer = csv.writer(output)
-        writer.writerow(header_fields)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(self.iter_csv_rows(logs))
+        return output.getvalue()
 
+    def iter_rows_by_functionality(self, logs):
+        """
+        Percorre as linhas de CSV dos logs junto com a funcionalidade de cada uma.
+
+        Cada linha é decodificada e descartada em seguida: nenhum registro é guardado, de
+        modo que a exportação de uma captura longa usa memória constante. Os grupos e as
+        linhas são os mesmos de group_logs_by_functionality seguido de iter_csv_rows.
+
+        Args:
+            logs (iterable): Logs capturados (strings ou LogRecord)
+
+        Returns:
+            iterator: Tuplas (funcionalidade, valores da linha), com valores None para linhas
+                que entram no grupo mas não geram linha no CSV (ex.: JSON inválido)
+        """
         for log in logs:
+            record = LogRecord.of(log)
+            # Linhas sem methodData não são exportadas
+            if record.status == LogRecord.SEM_DADOS:
+                continue
             try:
-                # Verifica se o log contém methodData
-                method_data_match = re.search(r'methodData:\s*(\{.*\})', log)
-                if method_data_match:
-                    method_data_str = method_data_match.group(1)
-
-                    # Tenta carregar os dados do método
-                    try:
-                        method_data = json.loads(method_data_str)
-
-                        # Extrai os campos necessários do JSON
-                        nome_evento = method_data.get("name", "")
-                        params = method_data.get("params", {})
-                        
-                        # Adicionando a extração dos campos necessários
-                        user_id = params.get("userId", "")
-                        tipo_usuario = params.get("tipo_usuario", "")
-                        
-                        # Monta a linha do CSV
-                        row = [
-                            nome_evento,
-                            params.get("ambiente", ""),
-                            params.get("produto", ""),
-                            params.get("funcionalidade", ""),
-                            params.get("subFuncionalidade", ""),
-                            "",  # SUBFUNCIONALIDADE
-                            params.get("categoria", ""),
-                            params.get("tela", ""),
-                            params.get("acao", ""),
-                            params.get("elemento", ""),
-                            params.get("rotulo", ""),
-                            user_id,  # USER_ID
-                            tipo_usuario,  # TIPO_USUARIO
-                            params.get("opcao1", ""),  # OPCAO_SELECIONADA_1
-                            params.get("opcao2", ""),  # OPCAO_SELECIONADA_2
-                            params.get("opcao3", ""),  # OPCAO_SELECIONADA_3
-                            params.get("opcao4", ""),  # OPCAO_SELECIONADA_4
-                            params.get("opcao5", ""),  # OPCAO_SELECIONADA_5
-                            params.get("opcao6", ""),  # OPCAO_SELECIONADA_6
-                        ]
-
-                        writer.writerow(row)
-
-                    except json.JSONDecodeError:
-                        print(f"Erro ao decifrar JSON: {method_data_str}")
+                # Pega a funcionalidade do próprio log (sem_funcionalidade se o JSON for inválido)
+                functionality = record.functionality
+                row = record.csv_row()
             except Exception as e:
                 print(f"Erro ao processar log: {str(e)}")
-
-        return output.getvalue()
+                # Também entra no grupo sem_funcionalidade em caso de erro, sem linha no CSV
+                functionality, row = "sem_funcionalidade", None
+            if not isinstance(functionality, str):
+                # Funcionalidade que não é texto (ex.: lista) não serve como nome de arquivo
+                functionality = "sem_funcionalidade"
+            yield functionality, row
 
     def group_logs_by_functionality(self, logs):
         """
         Agrupa logs por funcionalidade para organizar a exportação.
 
+        Cada linha é decodificada uma única vez; os registros retornados guardam o
+        methodData decodificado e são reaproveitados na exportação para CSV.
+
         Args:
-            logs (list): Lista de strings contendo os logs capturados
+            logs (list): Lista de logs capturados (strings ou LogRecord)
             
         Returns:
-            dict: Dicionário com funcionalidades como chaves e listas de logs como valores
+            dict: Dicionário com funcionalidades como chaves e listas de LogRecord como valores
         """
         logs_by_functionality = {}
 
         for log in logs:
+            record = LogRecord.of(log)
             try:
-                # Verifica se o log contém methodData
-                method_data_match = re.search(r'methodData:\s*(\{.*\})', log)
-                if method_data_match:
-                    method_data_str = method_data_match.group(1)
-                    
-                    # Tenta carregar os dados do método
-                    try:
-                        method_data = json.loads(method_data_str)
-                        params = method_data.get("params", {})
-                        
-                        # Pega a funcionalidade do próprio log
-                        functionality = params.get("funcionalidade", "sem_funcionalidade")
-                        
-                        # Adiciona o log à lista da respectiva funcionalidade
-                        if functionality not in logs_by_functionality:
-                            logs_by_functionality[functionality] = []
-                        logs_by_functionality[functionality].append(log)
-                    except json.JSONDecodeError:
-                        # Se não conseguir decodificar o JSON, coloca no grupo sem_funcionalidade
-                        if "sem_funcionalidade" not in logs_by_functionality:
-                            logs_by_functionality["sem_funcionalidade"] = []
-                        logs_by_functionality["sem_funcionalidade"].append(log)
+                # Linhas sem methodData não são exportadas
+                if record.status == LogRecord.SEM_DADOS:
+                    continue
+                # Pega a funcionalidade do próprio log (sem_funcionalidade se o JSON for inválido)
+                logs_by_functionality.setdefault(record.functionality, []).append(record)
             except Exception as e:
                 print(f"Erro ao processar log: {str(e)}")
                 # Também coloca no grupo sem_funcionalidade em caso de erro
-                if "sem_funcionalidade" not in logs_by_functionality:
-                    logs_by_functionality["sem_funcionalidade"] = []
-                logs_by_functionality["sem_funcionalidade"].append(log)
+                logs_by_functionality.setdefault("sem_funcionalidade", []).append(record)
 
         return logs_by_functionality
     
     def format_logs_for_csv(self, logs):
         """
-        Alias para process_logs_to_csv para compatibilidade com FileHelper.
+        Formata logs como linhas de CSV para o FileHelper.
         
         Args:
-            logs (list): Lista de logs para processar
+            logs (list): Lista de logs para processar (strings ou LogRecord)
             
         Returns:
-            list: Dados formatados para CSV como lista de listas
+            list: Dados formatados para CSV como lista de listas (cabeçalho na primeira linha)
         """
-        # Converte o resultado de process_logs_to_csv para o formato esperado pelo FileHelper
-        csv_string = self.process_logs_to_csv(logs)
-        
-        # Como process_logs_to_csv retorna uma string CSV, precisamos convertê-la para o formato
-        # esperado pelo método save_csv do FileHelper, que provavelmente espera uma lista de listas
-        csv_reader = csv.reader(StringIO(csv_string))
-        return list(csv_reader)  # Converte o leitor CSV para lista de listas
\ No newline at end of file
+        # Valores convertidos para texto como o csv.writer faria (None vira vazio)
+        return [["" if value is None else str(value) for value in row] for row in self.iter_export_rows(logs)]
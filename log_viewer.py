@@ -0,0 +1,187 @@
+"""
+Este arquivo contém o visualizador de logs da janela de monitoramento.
+Responsabilidades:
+- Exibição das linhas capturadas com limite de linhas no widget de texto
+- Remoção das linhas mais antigas em blocos, mantendo a inserção e a rolagem rápidas
+- Busca e navegação pela captura completa, lidas do CaptureBuffer e não do widget
+
+O widget guarda apenas o final da captura; o histórico completo fica no buffer de
+captura (segmentos em disco), consultado sob demanda.
+"""
+
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+# Linhas mantidas no widget e tamanho do bloco removido quando o limite é ultrapassado
+DEFAULT_MAX_LINES = 5000
+DEFAULT_TRIM_CHUNK = 1000
+# Linhas exibidas por página na navegação pela captura completa
+PAGE_SIZE = 500
+# Ocorrências listadas por busca
+MAX_SEARCH_RESULTS = 1000
+
+
+class LogViewer(ttk.Frame):
+    """
+    Área de logs com limite de linhas e busca sobre a captura completa.
+    """
+
+    def __init__(self, parent, store, max_lines=DEFAULT_MAX_LINES, trim_chunk=DEFAULT_TRIM_CHUNK, **kwargs):
+        """
+        Args:
+            parent: Widget pai
+            store (CaptureBuffer): Captura completa, usada na busca e na navegação
+            max_lines (int): Número de linhas mantidas no widget
+            trim_chunk (int): Linhas removidas de uma vez quando o limite é ultrapassado
+        """
+        super().__init__(parent, **kwargs)
+        self.store = store
+        self.max_lines = max_lines
+        self.trim_chunk = trim_chunk
+        self.line_count = 0
+
+        # Barra de busca
+        search_frame = ttk.Frame(self, padding=0)
+        search_frame.pack(fill="x", padx=5, pady=(5, 0))
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        search_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        search_entry.bind("<Return>", lambda event: self.search())
+        ttk.Button(search_frame, text="Buscar na captura", command=self.search).pack(side="left", padx=(0, 5))
+        ttk.Button(search_frame, text="Captura completa",
+                   command=lambda: self.open_capture_page(len(self.store))).pack(side="left")
+
+        # Área de texto para exibir logs
+        self.text = tk.Text(self, height=15, bg="#1e1e1e", fg="white")
+        self.text.pack(fill="both", expand=True, padx=5, pady=5, side="left")
+
+        # Scrollbar para a área de texto
+        scrollbar = ttk.Scrollbar(self, command=self.text.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.text.config(yscrollcommand=scrollbar.set)
+
+    def append(self, text):
+        """
+        Adiciona texto ao final do widget e rola até ele.
+
+        Quando o widget passa de max_lines + trim_chunk linhas, as mais antigas são
+        removidas de uma só vez até restarem max_lines.
+
+        Args:
+            text (str): Uma ou mais linhas de log
+        """
+        self.text.insert(tk.END, text)
+        self.line_count += text.count("\n")
+        if self.line_count > self.max_lines + self.trim_chunk:
+            excess = self.line_count - self.max_lines
+            self.text.delete("1.0", f"{excess + 1}.0")
+            self.line_count -= excess
+        self.text.see(tk.END)
+
+    def clear(self):
+        """
+        Limpa o widget.
+        """
+        self.text.delete("1.0", tk.END)
+        self.line_count = 0
+
+    def search(self):
+        """
+        Busca o texto informado em toda a captura, em segundo plano, e lista as ocorrências.
+        """
+        term = self.search_var.get().strip()
+        if not term:
+            return
+
+        def search_thread():
+            results = self.store.search(term, max_results=MAX_SEARCH_RESULTS)
+            self.after(0, lambda: self.show_search_results(term, results))
+
+        threading.Thread(target=search_thread, daemon=True).start()
+
+    def show_search_results(self, term, results):
+        """
+        Exibe as ocorrências de uma busca; um duplo clique abre a página da linha.
+
+        Args:
+            term (str): Texto procurado
+            results (list): Tuplas (número da linha, linha)
+        """
+        window = tk.Toplevel(self)
+        window.title(f"Busca: {term}")
+        window.geometry("700x400")
+
+        suffix = f" (primeiras {MAX_SEARCH_RESULTS})" if len(results) >= MAX_SEARCH_RESULTS else ""
+        ttk.Label(window, text=f"{len(results)} ocorrência(s){suffix}").pack(anchor="w", padx=10, pady=5)
+
+        listbox = tk.Listbox(window, font=("Courier", 10))
+        listbox.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        for number, line in results:
+            listbox.insert(tk.END, f"{number + 1}: {line.rstrip()[:200]}")
+
+        def open_selected(event):
+            selection = listbox.curselection()
+            if selection:
+                number = results[selection[0]][0]
+                self.open_capture_page(max(number - PAGE_SIZE // 2, 0), highlight=number, term=term)
+
+        listbox.bind("<Double-Button-1>", open_selected)
+
+    def open_capture_page(self, start, highlight=None, term=None):
+        """
+        Abre a navegação pela captura completa, uma página por vez.
+
+        Args:
+            start (int): Número da primeira linha da página (a partir de 0; limitado à última página)
+            highlight (int): Linha destacada, se houver
+            term (str): Texto destacado nas linhas da página, se houver
+        """
+        window = tk.Toplevel(self)
+        window.title("Captura completa")
+        window.geometry("800x500")
+
+        nav_frame = ttk.Frame(window, padding=5)
+        nav_frame.pack(fill="x")
+        position_label = ttk.Label(nav_frame)
+        text = tk.Text(window, bg="#1e1e1e", fg="white", wrap="none")
+        text.tag_configure("linha", background="#3a3a00")
+        text.tag_configure("termo", foreground="#ffd54f")
+
+        def show(page_start):
+            total = len(self.store)
+            page_start = max(min(page_start, total - PAGE_SIZE), 0)
+            lines = self.store.read_lines(page_start, PAGE_SIZE)
+            text.config(state="normal")
+            text.delete("1.0", tk.END)
+            text.insert(tk.END, "".join(lines))
+            if highlight is not None and page_start <= highlight < page_start + len(lines):
+                row = highlight - page_start + 1
+                text.tag_add("linha", f"{row}.0", f"{row + 1}.0")
+                text.see(f"{row}.0")
+            if term:
+                index = "1.0"
+                while True:
+                    index = text.search(term, index, stopindex=tk.END, nocase=True)
+                    if not index:
+                        break
+                    end = f"{index}+{len(term)}c"
+                    text.tag_add("termo", index, end)
+                    index = end
+            text.config(state="disabled")
+            position_label.config(text=f"Linhas {page_start + 1}-{page_start + len(lines)} de {total}")
+            nav_state["start"] = page_start
+
+        nav_state = {"start": start}
+        ttk.Button(nav_frame, text="◀ Anterior",
+                   command=lambda: show(nav_state["start"] - PAGE_SIZE)).pack(side="left", padx=5)
+        ttk.Button(nav_frame, text="Próxima ▶",
+                   command=lambda: show(nav_state["start"] + PAGE_SIZE)).pack(side="left", padx=5)
+        position_label.pack(side="left", padx=10)
+
+        scrollbar = ttk.Scrollbar(window, command=text.yview)
+        scrollbar.pack(side="right", fill="y")
+        text.config(yscrollcommand=scrollbar.set)
+        text.pack(fill="both", expand=True, padx=5, pady=5)
+
+        show(start)
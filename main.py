@@ -5,7 +5,6 @@ import sys
 import platform
 
 from tag_validator import TagValidator
-from ui_theme import ValidationApp
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +35,15 @@ else:
 
 
 def main():
+    # Com argumentos, valida pela linha de comando sem carregar a interface gráfica
+    # (o macOS pode repassar um argumento -psn_ ao abrir o app pelo Finder)
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("-psn_")]
+    if args:
+        from cli import main as cli_main
+        sys.exit(cli_main(args))
+
+    from ui_theme import ValidationApp
+
     # Inicializa e executa a aplicação
     validator = TagValidator()
 
@@ -8,8 +8,11 @@ import json
 import os
 import sys
 import shutil
-from collections import Counter
-from ai_analyzer import AIAnalyzer
+from collections import Counter, deque
+from collections.abc import Mapping
+from contextlib import contextmanager
+from compact_report import EventRefs, save_compact_results
+from event_store import EventTable, EventTableCache, to_serializable
 
 # Constantes
 API_KEY = ""  # Substitua pela sua chave da Flow AI
@@ -19,6 +22,11 @@ KEY_FIELDS = [
     "OPCAO_SELECIONADA_1", "OPCAO_SELECIONADA_2", "OPCAO_SELECIONADA_3",
     "OPCAO_SELECIONADA_4", "OPCAO_SELECIONADA_5", "OPCAO_SELECIONADA_6"
 ]
+# Campos de alta seletividade usados para agrupar candidatos na correspondência parcial
+BLOCK_FIELDS = ["NOME DO EVENTO", "TELA", "ACAO"]
+# Listas de eventos do dashboard gravadas em arquivos próprios, carregados sob demanda
+DASHBOARD_DATA_DIR = "dados"
+DASHBOARD_EVENT_LISTS = ["corretos", "ausentes", "com_erro"]
 
 # Funções utilitárias
 def get_resource_path(relative_path):
@@ -40,9 +48,88 @@ def get_resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def build_event_key(event):
+    """
+    Monta a chave de comparação de um evento a partir dos campos-chave
+    
+    Args:
+        event: Dicionário de evento (normalizado)
+        
+    Returns:
+        Tupla com os valores dos campos-chave na ordem de KEY_FIELDS
+    """
+    return tuple(event.get(field, "") for field in KEY_FIELDS)
+
+
+def get_validation_result(summary):
+    """
+    Determina o resultado da validação a partir do resumo do dashboard
+    
+    Args:
+        summary: Dicionário "resumo" com corretos, ausentes, com_erro e total
+        
+    Returns:
+        String "APROVADO", "REPROVADO" ou "REQUER ATENÇÃO"
+    """
+    if summary["corretos"] == summary["total"]:
+        return "APROVADO"
+    if summary["ausentes"] > 0:
+        return "REPROVADO"
+    return "REQUER ATENÇÃO"
+
+
 class FileHandler:
     """Manipula operações de arquivo para carregar e salvar dados"""
     
+    # Cabeçalhos já localizados, por (caminho, tamanho, data de modificação)
+    header_cache = {}
+    
+    @staticmethod
+    def _file_signature(file_path):
+        """
+        Identifica a versão atual de um arquivo em disco
+        
+        Args:
+            file_path: Caminho para o arquivo
+            
+        Returns:
+            Tupla (caminho absoluto, tamanho, data de modificação em ns)
+        """
+        stat = os.stat(file_path)
+        return os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def read_csv_header(f, header_line=None):
+        """
+        Posiciona a leitura logo após o cabeçalho de um CSV já aberto, em uma única passada
+        
+        Args:
+            f: Arquivo CSV aberto (newline='')
+            header_line: Índice já conhecido do registro de cabeçalho (opcional); se não
+                apontar para um cabeçalho válido, a detecção é refeita
+            
+        Returns:
+            Tupla (índice do cabeçalho, nomes das colunas, csv.reader posicionado após o cabeçalho)
+            
+        Raises:
+            ValueError: Se os cabeçalhos não forem encontrados
+        """
+        required = set(KEY_FIELDS)
+        if header_line is not None:
+            reader = csv.reader(f)
+            for _ in range(header_line):
+                next(reader, None)
+            line = next(reader, None)
+            if line is not None and required.issubset(line):
+                return header_line, line, reader
+            f.seek(0)
+
+        reader = csv.reader(f)
+        for idx, line in enumerate(reader):
+            if required.issubset(line):
+                return idx, line, reader
+        raise ValueError("Cabeçalho com colunas obrigatórias não encontrado.")
+
     @staticmethod
     def find_header_line(file_path):
         """
@@ -58,45 +145,134 @@ class FileHandler:
             ValueError: Se os cabeçalhos não forem encontrados
         """
         with open(file_path, newline='', encoding='utf-8') as f:
-            for idx, line in enumerate(csv.reader(f)):
-                if set(KEY_FIELDS).issubset(set(line)):
-                    return idx
-            raise ValueError("Cabeçalho com colunas obrigatórias não encontrado.")
+            return FileHandler.read_csv_header(f)[0]
+
+    @staticmethod
+    def _open_events(f, file_path, header_line):
+        """
+        Lê o cabeçalho reaproveitando o deslocamento conhecido e o memoriza para as próximas cargas
+        
+        Args:
+            f: Arquivo CSV aberto
+            file_path: Caminho para o arquivo CSV
+            header_line: Índice já conhecido do cabeçalho ou None
+            
+        Returns:
+            Tupla (índice do cabeçalho, nomes das colunas, csv.reader posicionado após o cabeçalho)
+        """
+        signature = FileHandler._file_signature(file_path)
+        if header_line is None:
+            header_line = FileHandler.header_cache.get(signature)
+        header_line, fieldnames, reader = FileHandler.read_csv_header(f, header_line)
+        FileHandler.header_cache[signature] = header_line
+        return header_line, fieldnames, reader
 
     @staticmethod
-    def load_events_from_csv(file_path):
+    def load_events_from_csv(file_path, header_line=None, use_cache=False):
         """
         Carrega eventos de um arquivo CSV
         
         Args:
             file_path: Caminho para o arquivo CSV
+            header_line: Índice já conhecido do cabeçalho (opcional), dispensa a detecção
+            use_cache: Se True, reaproveita a tabela já normalizada gravada ao lado do CSV
+                (e a grava, se ainda não existir ou estiver desatualizada)
             
         Returns:
-            Lista de dicionários contendo dados de eventos
+            EventTable com os eventos; cada linha é uma visão com a interface de dicionário
+            e o campo 'ID' igual à sua posição (a partir de 1)
         """
-        events = []
+        if use_cache:
+            signature = EventTableCache.signature(file_path)
+            events = EventTableCache.load(file_path, signature)
+            if events is not None:
+                return events
+            events = FileHandler.load_events_from_csv(file_path, header_line)
+            EventTableCache.save(file_path, signature, events, normalize=KEY_FIELDS)
+            return events
+        
         with open(file_path, newline='', encoding='utf-8') as f:
-            header_line = FileHandler.find_header_line(file_path)
-            f.seek(0)
-            for _ in range(header_line):
-                next(f)
-            reader = csv.DictReader(f)
-            for i, row in enumerate(reader, 1):
-                row['ID'] = i
-                events.append(row)
+            header_line, fieldnames, reader = FileHandler._open_events(f, file_path, header_line)
+            events = EventTable(fieldnames)
+            events.header_line = header_line
+            for row in reader:
+                # Linhas vazias são ignoradas, como no csv.DictReader
+                if row:
+                    events.append(row)
         return events
+
+    @staticmethod
+    def iter_events_from_csv(file_path, header_line=None):
+        """
+        Percorre os eventos de um arquivo CSV sem carregá-lo inteiro na memória
+        
+        Args:
+            file_path: Caminho para o arquivo CSV
+            header_line: Índice já conhecido do cabeçalho (opcional), dispensa a detecção
+            
+        Yields:
+            Dicionários no formato do csv.DictReader, com o campo 'ID' igual à posição da linha
+        """
+        with open(file_path, newline='', encoding='utf-8') as f:
+            _, fieldnames, reader = FileHandler._open_events(f, file_path, header_line)
+            size = len(fieldnames)
+            event_id = 0
+            for row in reader:
+                if not row:
+                    continue
+                event = dict(zip(fieldnames, row))
+                if len(row) > size:
+                    event[None] = row[size:]
+                elif len(row) < size:
+                    for key in fieldnames[len(row):]:
+                        event[key] = None
+                event_id += 1
+                event['ID'] = event_id
+                yield event
     
     @staticmethod
-    def save_json(file_path, data):
+    @contextmanager
+    def open_for_write(file_path, mode="w", encoding="utf-8"):
+        """
+        Abre um arquivo para escrita em um temporário ao lado dele, trocado pelo definitivo ao final.
+
+        A troca (os.replace) cria um arquivo novo em vez de reescrever o existente: cópias
+        publicadas por hardlink em outros diretórios não são alteradas, e leitores nunca
+        veem um arquivo pela metade.
+
+        Args:
+            file_path: Caminho definitivo do arquivo
+            mode: Modo de abertura ("w" ou "wb")
+            encoding: Codificação em modo texto
+
+        Returns:
+            Context manager com o arquivo aberto
+        """
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, mode, encoding=None if "b" in mode else encoding) as f:
+                yield f
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def save_json(file_path, data, compact=False):
         """
         Salva dados como JSON no caminho especificado
         
         Args:
             file_path: Caminho para salvar o arquivo JSON
             data: Dados a serem salvos como JSON
+            compact: Se True, grava o JSON minificado (sem recuo nem espaços)
         """
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with FileHandler.open_for_write(file_path) as f:
+            if compact:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"), default=to_serializable)
+            else:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=to_serializable)
     
     @staticmethod
     def save_text(file_path, text_content):
@@ -107,7 +283,7 @@ class FileHandler:
             file_path: Caminho para salvar o arquivo de texto
             text_content: Conteúdo a ser salvo
         """
-        with open(file_path, "w", encoding="utf-8") as f:
+        with FileHandler.open_for_write(file_path) as f:
             f.write(text_content)
             
     @staticmethod
@@ -130,12 +306,273 @@ class FileHandler:
             destination: Caminho do arquivo de destino
         """
         if os.path.exists(source):
-            shutil.copy2(source, destination)
+            temp_path = f"{destination}.{os.getpid()}.tmp"
+            shutil.copy2(source, temp_path)
+            os.replace(temp_path, destination)
+
+    @staticmethod
+    def publish_file(source, destination):
+        """
+        Publica um arquivo já gerado em outro diretório, sem gerá-lo novamente.
+
+        Usa um hardlink quando origem e destino estão no mesmo sistema de arquivos
+        (nenhum byte é copiado) e, se não for possível, uma única cópia. O destino é
+        substituído atomicamente.
+
+        Args:
+            source: Caminho do arquivo gerado
+            destination: Caminho do arquivo publicado
+        """
+        if os.path.exists(destination) and os.path.samefile(source, destination):
+            return
+        temp_path = f"{destination}.{os.getpid()}.tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        try:
+            os.link(source, temp_path)
+        except OSError:
+            # Outro disco, sistema de arquivos sem hardlink ou sem permissão: copia
+            shutil.copy2(source, temp_path)
+        os.replace(temp_path, destination)
+
+    @staticmethod
+    def remove_files(directory, relative_paths):
+        """
+        Remove de um diretório os arquivos informados que existirem.
+
+        Args:
+            directory: Diretório base
+            relative_paths: Caminhos dos arquivos, relativos a directory
+
+        Returns:
+            Lista de caminhos removidos
+        """
+        removed = []
+        for relative_path in relative_paths:
+            file_path = os.path.join(directory, relative_path)
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+                removed.append(file_path)
+        return removed
+
+    @staticmethod
+    def publish_files(source_dir, destination_dir, relative_paths):
+        """
+        Publica em outro diretório os arquivos gerados em source_dir.
+
+        Args:
+            source_dir: Diretório onde os arquivos foram gerados
+            destination_dir: Diretório de destino
+            relative_paths: Caminhos dos arquivos, relativos a source_dir
+
+        Returns:
+            Lista de caminhos publicados
+        """
+        published = []
+        for relative_path in relative_paths:
+            destination = os.path.join(destination_dir, relative_path)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            FileHandler.publish_file(os.path.join(source_dir, relative_path), destination)
+            published.append(destination)
+        return published
+
+class EventIndex:
+    """Índices de busca sobre eventos de log, construídos em uma única passada"""
+    
+    def __init__(self, log_events, consume=False):
+        """
+        Indexa os eventos de log por ID, pela tupla completa de campos-chave e por bloco
+        
+        Args:
+            log_events: EventTable ou lista de eventos de log
+            consume: Se True, cada log só pode ser usado por uma única correspondência
+        """
+        self.consume = consume
+        self.by_id = {}
+        self.by_key = {}
+        self.by_block = {}
+        if isinstance(log_events, EventTable):
+            # Na tabela o ID é a posição da linha e os logs normalizados são criados sob demanda
+            self._table = log_events
+            self._normalized_logs = None
+            keys = log_events.iter_normalized(KEY_FIELDS)
+        else:
+            self._table = None
+            self._normalized_logs = [EventComparator.normalize_event(e) for e in log_events]
+            keys = (build_event_key(log) for log in self._normalized_logs)
+            for position, log in enumerate(self._normalized_logs):
+                self._add(self.by_id, log.get("ID"), position)
+
+        block_fields = [KEY_FIELDS.index(field) for field in BLOCK_FIELDS]
+        size = 0
+        for position, key in enumerate(keys):
+            self._add(self.by_key, key, position)
+            block = tuple(key[i] for i in block_fields)
+            self.by_block.setdefault(block, []).append((key, position))
+            size += 1
+        self.consumed = bytearray(size)
+
+    @staticmethod
+    def _add(index, key, position):
+        """
+        Registra uma posição no índice, guardando um inteiro para chaves únicas e uma fila para repetidas
+        
+        Args:
+            index: Dicionário de índice
+            key: Chave do índice
+            position: Posição do log
+        """
+        current = index.get(key)
+        if current is None:
+            index[key] = position
+        elif isinstance(current, deque):
+            current.append(position)
+        else:
+            # Filas preservam a ordem de captura: a primeira ocorrência vem primeiro
+            index[key] = deque((current, position))
+
+    def _take(self, index, key):
+        """
+        Obtém a primeira posição ainda disponível para a chave
+        
+        Args:
+            index: Dicionário de índice
+            key: Chave buscada
+            
+        Returns:
+            Posição do log ou None
+        """
+        entry = index.get(key)
+        if entry is None:
+            return None
+        if not isinstance(entry, deque):
+            if self.consumed[entry]:
+                return None
+            return self._claim(entry)
+        # Descarta logs já consumidos por outras chaves (custo amortizado O(1))
+        while entry and self.consumed[entry[0]]:
+            entry.popleft()
+        if not entry:
+            return None
+        return self._claim(entry[0])
+
+    def _claim(self, position):
+        """
+        Marca o log como consumido quando o modo um-para-um está ativo
+        
+        Args:
+            position: Posição do log
+            
+        Returns:
+            A própria posição
+        """
+        if self.consume:
+            self.consumed[position] = 1
+        return position
+
+    def _resolve(self, position):
+        """
+        Retorna o log normalizado de uma posição
+        
+        Args:
+            position: Posição do log ou None
+            
+        Returns:
+            Evento de log normalizado ou None
+        """
+        if position is None:
+            return None
+        if self._table is not None:
+            return self._table[position].normalized()
+        return self._normalized_logs[position]
+
+    def _find_by_id(self, target_id):
+        """
+        Busca a posição do log com o ID informado
+        
+        Args:
+            target_id: ID do evento na planilha
+            
+        Returns:
+            Posição do log ou None
+        """
+        target = str(target_id)
+        if self._table is None:
+            return self._take(self.by_id, target)
+        if not target.isdigit():
+            return None
+        position = int(target) - 1
+        if position >= len(self.consumed) or str(position + 1) != target or self.consumed[position]:
+            return None
+        return self._claim(position)
+
+    def find(self, normalized_event, target_id):
+        """
+        Busca o evento de log correspondente em O(1)
+        
+        No modo um-para-um a correspondência é feita apenas pelos campos-chave: o ID da
+        planilha e a posição do log não têm relação, e casar por ID consumiria logs
+        independentemente do conteúdo.
+        
+        Args:
+            normalized_event: Evento normalizado da planilha
+            target_id: ID do evento na planilha
+            
+        Returns:
+            Evento de log correspondente ou None
+        """
+        # Tenta encontrar evento correspondente por ID
+        position = None if self.consume else self._find_by_id(target_id)
+
+        # Se não encontrar correspondência por ID, tenta corresponder por todos os campos-chave
+        if position is None:
+            position = self._take(self.by_key, build_event_key(normalized_event))
+        return self._resolve(position)
+
+    def find_closest(self, normalized_event):
+        """
+        Busca, dentro do bloco de BLOCK_FIELDS do evento, o log com menos campos divergentes
+        
+        Args:
+            normalized_event: Evento normalizado da planilha
+            
+        Returns:
+            Evento de log mais próximo ou None se o bloco estiver vazio
+        """
+        block = tuple(normalized_event.get(field, "") for field in BLOCK_FIELDS)
+        expected_key = build_event_key(normalized_event)
+        best_position = None
+        best_score = None
+        for key, position in self.by_block.get(block, ()):
+            if self.consumed[position]:
+                continue
+            score = sum(1 for expected, found in zip(expected_key, key) if expected != found)
+            # Em caso de empate, prevalece o primeiro log capturado
+            if best_score is None or score < best_score:
+                best_position, best_score = position, score
+        if best_position is None:
+            return None
+        return self._resolve(self._claim(best_position))
 
 
 class EventComparator:
     """Compara eventos entre dados de planilha e dados de log"""
     
+    def __init__(self, partial_match=False, one_to_one=False):
+        """
+        Inicializa o comparador
+        
+        Args:
+            partial_match: Se True, eventos sem correspondência por ID ou campos-chave são
+                comparados com o log mais próximo do mesmo bloco (NOME DO EVENTO, TELA, ACAO)
+                e passam de ausentes a com erro
+            one_to_one: Se True, cada linha de log satisfaz no máximo um evento da planilha,
+                de modo que eventos repetidos exigem o mesmo número de ocorrências no log
+                (a correspondência é feita pelos campos-chave, sem casar por ID)
+        """
+        self.partial_match = partial_match
+        self.one_to_one = one_to_one
+    
     @staticmethod
     def normalize_event(event):
         """
@@ -160,52 +597,195 @@ class EventComparator:
         Returns:
             Tupla contendo listas de (ausentes, propriedades_erradas, corretos)
         """
-        missing = []
-        wrong_properties = []
-        correct = []
-        normalized_logs = [self.normalize_event(e) for e in log_events]
+        index = EventIndex(log_events, consume=self.one_to_one)
+        matches = []
 
         for event in spreadsheet_events:
             normalized_event = self.normalize_event(event)
-            target_id = event.get("ID")
+            matches.append((event, normalized_event, index.find(normalized_event, event.get("ID"))))
 
-            # Tenta encontrar evento correspondente por ID
-            match = next((e for e in normalized_logs if e.get("ID") == str(target_id)), None)
+        # Sem correspondência exata, usa o log mais próximo para apontar as diferenças. Só depois
+        # de todas as correspondências exatas, para que no modo um-para-um um log mais próximo
+        # não seja consumido antes do evento de que ele é o par exato
+        if self.partial_match:
+            matches = [
+                (event, normalized_event, match or index.find_closest(normalized_event))
+                for event, normalized_event, match in matches
+            ]
 
-            # Se não encontrar correspondência por ID, tenta corresponder por todos os campos-chave
-            if not match:
-                match = next(
-                    (e for e in normalized_logs if all(
-                        normalized_event.get(field, "") == e.get(field, "") for field in KEY_FIELDS)),
-                    None
-                )
+        return self._split_results([self._classify(*match) for match in matches])
+
+    def iter_compare_stream(self, spreadsheet_events, log_events):
+        """
+        Compara eventos indexando apenas a planilha e consumindo o log como um fluxo
+        
+        O resultado de cada evento é emitido assim que fica definido: um evento casado por ID
+        é resolvido quando a linha de log com esse ID passa; os demais, ao final do fluxo.
+        A memória usada é limitada pelo tamanho da planilha, não pelo da captura.
+        
+        Args:
+            spreadsheet_events: Lista de eventos da planilha
+            log_events: Iterável de eventos do log (por exemplo, FileHandler.iter_events_from_csv)
+            
+        Yields:
+            Tuplas (posição na planilha, status, item), com status "ausente", "com_erro" ou "correto"
+            
+        Raises:
+            ValueError: Se o modo um-para-um estiver ativo (a ordem de consumo depende da planilha inteira)
+        """
+        if self.one_to_one:
+            raise ValueError("O modo um-para-um não é suportado na comparação em fluxo.")
+
+        events = []
+        pending_by_id = {}
+        expected_keys = set()
+        for position, event in enumerate(spreadsheet_events):
+            normalized_event = self.normalize_event(event)
+            events.append((event, normalized_event))
+            pending_by_id.setdefault(str(event.get("ID")), []).append(position)
+            expected_keys.add(build_event_key(normalized_event))
+
+        # Primeiro log de cada chave esperada e, por bloco, o log mais próximo de cada chave ainda sem par
+        first_by_key = {}
+        closest = {}
+        block_fields = [KEY_FIELDS.index(field) for field in BLOCK_FIELDS]
+        pending_blocks = {}
+        if self.partial_match:
+            for key in expected_keys:
+                pending_blocks.setdefault(tuple(key[i] for i in block_fields), set()).add(key)
+
+        resolved = set()
+        for log_event in log_events:
+            log = self.normalize_event(log_event)
+            key = build_event_key(log)
+
+            for position in pending_by_id.pop(log.get("ID"), ()):
+                resolved.add(position)
+                event, normalized_event = events[position]
+                yield (position,) + self._classify(event, normalized_event, log)
 
-            if not match:
-                missing.append(event)
+            if key in expected_keys and key not in first_by_key:
+                first_by_key[key] = log
+                pending_blocks.get(tuple(key[i] for i in block_fields), set()).discard(key)
+
+            for expected_key in pending_blocks.get(tuple(key[i] for i in block_fields), ()):
+                score = sum(1 for expected, found in zip(expected_key, key) if expected != found)
+                # Em caso de empate, prevalece o primeiro log capturado
+                if expected_key not in closest or score < closest[expected_key][0]:
+                    closest[expected_key] = (score, log)
+
+        for position, (event, normalized_event) in enumerate(events):
+            if position in resolved:
                 continue
+            key = build_event_key(normalized_event)
+            match = first_by_key.get(key)
+            if not match and key in closest:
+                match = closest[key][1]
+            yield (position,) + self._classify(event, normalized_event, match)
 
-            # Encontra diferenças em campos-chave
-            diffs = {}
-            for field in KEY_FIELDS:
-                expected = normalized_event.get(field, "")
-                found = match.get(field, "")
-                if expected != found:
-                    diffs[field] = {
-                        "esperado": expected if expected else "[não definido]",
-                        "log": found if found else "[não definido]"
-                    }
-
-            if diffs:
-                wrong_properties.append({
-                    "ID": event["ID"],
-                    "evento": event,
-                    "log": match,
-                    "diferencas": diffs
-                })
-            else:
-                correct.append(event)
+    def compare_stream(self, spreadsheet_events, log_events):
+        """
+        Versão em fluxo de compare, com o mesmo resultado
+        
+        Args:
+            spreadsheet_events: Lista de eventos da planilha
+            log_events: Iterável de eventos do log
+            
+        Returns:
+            Tupla contendo listas de (ausentes, propriedades_erradas, corretos)
+        """
+        results = [None] * len(spreadsheet_events)
+        for position, status, item in self.iter_compare_stream(spreadsheet_events, log_events):
+            results[position] = (status, item)
+        return self._split_results(results)
+
+    @staticmethod
+    def _classify(event, normalized_event, match):
+        """
+        Classifica um evento da planilha a partir do log correspondente
+        
+        Args:
+            event: Evento original da planilha
+            normalized_event: Evento normalizado da planilha
+            match: Evento de log normalizado correspondente ou None
+            
+        Returns:
+            Tupla (status, item), com status "ausente", "com_erro" ou "correto"
+        """
+        if not match:
+            return "ausente", event
+
+        # Encontra diferenças em campos-chave
+        diffs = {}
+        for field in KEY_FIELDS:
+            expected = normalized_event.get(field, "")
+            found = match.get(field, "")
+            if expected != found:
+                diffs[field] = {
+                    "esperado": expected if expected else "[não definido]",
+                    "log": found if found else "[não definido]"
+                }
+
+        if diffs:
+            return "com_erro", {
+                "ID": event["ID"],
+                "evento": event,
+                "log": match,
+                "diferencas": diffs
+            }
+        return "correto", event
+
+    @staticmethod
+    def _split_results(results):
+        """
+        Separa resultados classificados nas listas de saída, mantendo a ordem da planilha
+        
+        Args:
+            results: Lista de tuplas (status, item)
+            
+        Returns:
+            Tupla contendo listas de (ausentes, propriedades_erradas, corretos)
+        """
+        buckets = {"ausente": [], "com_erro": [], "correto": []}
+        for status, item in results:
+            buckets[status].append(item)
+        return buckets["ausente"], buckets["com_erro"], buckets["correto"]
+
+    def iter_event_keys(self, events):
+        """
+        Percorre as chaves normalizadas dos eventos sem copiar cada linha
+        
+        Args:
+            events: EventTable ou lista de eventos
+            
+        Returns:
+            Iterador de tuplas de campos-chave
+        """
+        if isinstance(events, EventTable):
+            return events.iter_normalized(KEY_FIELDS)
+        return (build_event_key(self.normalize_event(e)) for e in events)
 
-        return missing, wrong_properties, correct
+    def count_occurrences(self, spreadsheet_events, log_events):
+        """
+        Conta quantas vezes cada combinação de campos-chave era esperada e quantas foi registrada
+        
+        Args:
+            spreadsheet_events: Lista de eventos da planilha
+            log_events: Lista de eventos dos logs
+            
+        Returns:
+            Lista de dicionários com a chave (campos preenchidos), "esperado" e "encontrado"
+        """
+        expected = Counter(self.iter_event_keys(spreadsheet_events))
+        seen = Counter(self.iter_event_keys(log_events))
+        return [
+            {
+                "chave": {field: value for field, value in zip(KEY_FIELDS, key) if value},
+                "esperado": count,
+                "encontrado": seen.get(key, 0)
+            }
+            for key, count in expected.items()
+        ]
 
     @staticmethod
     def count_errors_by_field(wrong_properties):
@@ -227,20 +807,53 @@ class EventComparator:
 class ReportGenerator:
     """Gera relatórios em vários formatos a partir dos resultados da validação"""
     
-    def __init__(self, output_dir):
+    # Todos os artefatos que uma validação pode gerar, conforme o formato e o modo escolhidos
+    REPORT_FILES = [
+        "ausentes_log.json", "propriedades_erradas.json", "resultados.ndjson", "resultados.ndjson.gz",
+        "ocorrencias_por_chave.json", "relatorio_validacao.txt", "dashboard.html",
+        "template_dashboard.css", "dashboard-utils.js", "dashboard.js"
+    ] + [f"{DASHBOARD_DATA_DIR}/eventos_{name}.js" for name in DASHBOARD_EVENT_LISTS]
+    
+    def __init__(self, output_dir, compact=False, use_gzip=False):
         """
         Inicializa com diretório de saída
         
         Args:
             output_dir: Diretório onde os relatórios serão salvos
+            compact: Se True, ausentes e propriedades erradas vão para resultados.ndjson
+                (formato compacto, ver compact_report) e os demais JSON são minificados
+            use_gzip: Se True, o arquivo compacto é comprimido (resultados.ndjson.gz)
         """
         self.output_dir = output_dir
+        self.compact = compact or use_gzip
+        self.use_gzip = use_gzip
         self.file_handler = FileHandler()
+        # Arquivos gerados, relativos a output_dir (publicados depois em outros diretórios)
+        self.generated_files = []
+
+    def output_path(self, relative_path):
+        """
+        Retorna o caminho de um artefato no diretório de saída e o registra como gerado
+        
+        Args:
+            relative_path: Caminho do artefato relativo ao diretório de saída
+            
+        Returns:
+            Caminho completo do artefato
+        """
+        if relative_path not in self.generated_files:
+            self.generated_files.append(relative_path)
+        return os.path.join(self.output_dir, relative_path)
 
     def generate_dashboard(self, data, template_path, output_path):
         """
         Gera dashboard HTML
         
+        O HTML recebe apenas o resumo (contadores, gráficos e análise de IA). Cada lista de
+        eventos vai para um script próprio em dados/, que o dashboard carrega quando a aba
+        correspondente é aberta. Scripts, e não JSON com fetch, porque o dashboard é aberto
+        direto do disco (file://), onde o navegador bloqueia fetch.
+        
         Args:
             data: Dados para o dashboard
             template_path: Caminho para o template HTML
@@ -251,9 +864,23 @@ class ReportGenerator:
         """
         with open(template_path, encoding="utf-8") as f:
             template_content = f.read()
-            
-        # Substitui placeholder por script que define variável global
-        script_data = f"<script>window.__DADOS_DASHBOARD__ = {json.dumps(data, ensure_ascii=False)};</script>"
+        
+        # Grava as listas de eventos, um evento por vez, sem montar o JSON inteiro em memória
+        event_files = {}
+        for name in DASHBOARD_EVENT_LISTS:
+            relative_path = f"{DASHBOARD_DATA_DIR}/eventos_{name}.js"
+            event_path = self.output_path(relative_path)
+            os.makedirs(os.path.dirname(event_path), exist_ok=True)
+            self.generate_dashboard_event_list(name, data["eventos"][name], event_path)
+            event_files[name] = relative_path
+        
+        # As ocorrências por chave não são exibidas e já estão em ocorrencias_por_chave.json
+        summary = {key: value for key, value in data.items() if key not in ("eventos", "ocorrencias_por_chave")}
+        summary["arquivos_eventos"] = event_files
+        
+        # Substitui placeholder por script que define variável global ("</" escapado para não fechar a tag)
+        summary_json = json.dumps(summary, ensure_ascii=False, default=to_serializable).replace("</", "<\\/")
+        script_data = f"<script>window.__DADOS_DASHBOARD__ = {summary_json};</script>"
         html = template_content.replace("__DADOS_DASHBOARD__", script_data)
         
         # Corrige referências de assets - copia arquivos CSS e JS para o diretório de saída
@@ -262,9 +889,9 @@ class ReportGenerator:
         utils_js_source = get_resource_path("dashboard-utils.js")
         
         # Copia arquivos se existirem
-        self.file_handler.copy_file(css_source, os.path.join(self.output_dir, "template_dashboard.css"))
-        self.file_handler.copy_file(utils_js_source, os.path.join(self.output_dir, "dashboard-utils.js"))
-        self.file_handler.copy_file(js_source, os.path.join(self.output_dir, "dashboard.js"))
+        self.file_handler.copy_file(css_source, self.output_path("template_dashboard.css"))
+        self.file_handler.copy_file(utils_js_source, self.output_path("dashboard-utils.js"))
+        self.file_handler.copy_file(js_source, self.output_path("dashboard.js"))
         
         # Garante que o HTML tenha caminhos relativos, não caminhos absolutos
         html = html.replace('href="/template_dashboard.css"', 'href="template_dashboard.css"')
@@ -274,6 +901,46 @@ class ReportGenerator:
         # Escreve o HTML final
         self.file_handler.save_text(output_path, html)
 
+    def generate_dashboard_event_list(self, name, events, output_path):
+        """
+        Grava uma lista de eventos do dashboard como script que a entrega ao DashboardApp
+        
+        Como no formato compacto, os eventos da planilha e do log referenciados pelos itens
+        com erro ("evento" e "log") são gravados uma única vez (e[n] = {...}) antes do
+        primeiro item que os usa; no navegador, itens que compartilham um evento apontam
+        para o mesmo objeto.
+        
+        Args:
+            name: Nome da lista ("corretos", "ausentes" ou "com_erro")
+            events: Eventos da lista
+            output_path: Caminho do script
+            
+        Returns:
+            None
+        """
+        refs = EventRefs()
+        
+        with self.file_handler.open_for_write(output_path) as f:
+            write = f.write
+
+            def ref(event):
+                number, text = refs.add(event)
+                if text is not None:
+                    write(f"e[{number}] = {text};\n")
+                return f"e[{number}]"
+
+            write("(function () {\nvar e = [], lista = [];\n")
+            for event in events:
+                fields = []
+                for key, value in event.items():
+                    if key in ("evento", "log") and isinstance(value, Mapping):
+                        fields.append(f"{json.dumps(key)}:{ref(value)}")
+                    else:
+                        fields.append(f"{json.dumps(key, ensure_ascii=False)}:"
+                                      f"{json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=to_serializable)}")
+                write(f"lista.push({{{','.join(fields)}}});\n")
+            write(f"window.DashboardApp.dados.receber({json.dumps(name)}, lista);\n}})();\n")
+
     def generate_text_report(self, spreadsheet_events, missing, wrong_properties, correct, ai_analysis):
         """
         Gera relatório de validação detalhado e profissional
@@ -292,116 +959,118 @@ class ReportGenerator:
         current_date = datetime.now().strftime("%d/%m/%Y")
         current_time = datetime.now().strftime("%H:%M:%S")
         
-        report_path = os.path.join(self.output_dir, "relatorio_validacao.txt")
-        
-        report_content = "\n# 📊 RELATÓRIO DE VALIDAÇÃO DE EVENTOS - ANÁLISE TÉCNICA\n\n"
-        report_content += f"Data de execução: {current_date} às {current_time}\n"
-        report_content += "==================================================\n\n"
-        
-        # Sumário Executivo
-        report_content += "## 📈 SUMÁRIO EXECUTIVO\n"
-        report_content += "==================================================\n"
-        total = len(spreadsheet_events)
-        correct_percent = (len(correct) / total * 100) if total > 0 else 0
-        report_content += f"✅ Total de Eventos Corretos: {len(correct)} ({correct_percent:.1f}%)\n"
-        report_content += f"❌ Total de Eventos Ausentes: {len(missing)} ({(len(missing) / total * 100):.1f}% se aplicável)\n"
-        report_content += f"⚠️ Total com Propriedades Erradas: {len(wrong_properties)} ({(len(wrong_properties) / total * 100):.1f}% se aplicável)\n"
-        report_content += f"🧾 Total Processado: {total} eventos\n\n"
-
-        # Detalhamento dos eventos ausentes
-        report_content += "## 📉 DETALHAMENTO DOS EVENTOS AUSENTES\n"
-        report_content += "==================================================\n"
-        if missing:
-            for i, evento in enumerate(missing, 1):
-                nome_evento = evento.get('NOME DO EVENTO', '[sem nome]')
-                tela = evento.get('TELA', '[sem tela]')
-                report_content += f"### Evento Ausente #{i}\n"
-                report_content += f"- **ID:** {evento['ID']}\n"
-                report_content += f"- **Tela:** {tela}\n"
-                report_content += f"- **Evento:** {nome_evento}\n"
-                # Adicionar detalhes adicionais do evento que estava faltando
-                for key, value in evento.items():
-                    if key not in ['ID', 'TELA', 'NOME DO EVENTO']:
-                        report_content += f"- **{key}:** {value}\n"
-                report_content += "\n"
-        else:
-            report_content += "Nenhum evento ausente detectado na verificação atual."
-
-        # Detalhamento dos eventos com propriedades incorretas
-        report_content += "## ⚠️ DETALHAMENTO DOS EVENTOS COM PROPRIEDADES INCORRETAS\n"
-        report_content += "==================================================\n"
-        if wrong_properties:
-            for i, erro in enumerate(wrong_properties, 1):
-                nome_evento = erro['evento'].get('NOME DO EVENTO', '[sem nome]')
-                tela = erro['evento'].get('TELA', '[sem tela]')
-                report_content += f"### Evento #{i} com Propriedades Incorretas\n"
-                report_content += f"- **ID:** {erro['ID']}\n"
-                report_content += f"- **Tela:** {tela}\n"
-                report_content += f"- **Evento:** {nome_evento}\n"
-                report_content += "#### Discrepâncias Detectadas:\n"
-                for campo, diferenca in erro['diferencas'].items():
-                    report_content += f"{campo}:\n"
-                    report_content += f"- Esperado: {diferenca['esperado']}\n"
-                    report_content += f"+ Registrado: {diferenca['log']}\n"
-        else:
-            report_content += "```\nNenhum erro de propriedades detectado na verificação atual.\n```\n\n"
+        report_path = self.output_path("relatorio_validacao.txt")
         
-        # Análise Geral detalhada e técnica
-        report_content += "## 🔍 ANÁLISE TÉCNICA DETALHADA\n"
-        report_content += "==================================================\n"
-        if ai_analysis:
-            report_content += f"{ai_analysis}\n"
-        else:
-            # Gerar análise básica mesmo sem IA
-            report_content += "### Síntese da Validação\n"
+        # As seções são gravadas à medida que são montadas, sem acumular o relatório em memória
+        with self.file_handler.open_for_write(report_path) as f:
+            write = f.write
+            write("\n# 📊 RELATÓRIO DE VALIDAÇÃO DE EVENTOS - ANÁLISE TÉCNICA\n\n")
+            write(f"Data de execução: {current_date} às {current_time}\n")
+            write("==================================================\n\n")
+            
+            # Sumário Executivo
+            write("## 📈 SUMÁRIO EXECUTIVO\n")
+            write("==================================================\n")
+            total = len(spreadsheet_events)
+            correct_percent = (len(correct) / total * 100) if total > 0 else 0
+            write(f"✅ Total de Eventos Corretos: {len(correct)} ({correct_percent:.1f}%)\n")
+            write(f"❌ Total de Eventos Ausentes: {len(missing)} ({(len(missing) / total * 100):.1f}% se aplicável)\n")
+            write(f"⚠️ Total com Propriedades Erradas: {len(wrong_properties)} ({(len(wrong_properties) / total * 100):.1f}% se aplicável)\n")
+            write(f"🧾 Total Processado: {total} eventos\n\n")
+
+            # Detalhamento dos eventos ausentes
+            write("## 📉 DETALHAMENTO DOS EVENTOS AUSENTES\n")
+            write("==================================================\n")
+            if missing:
+                for i, evento in enumerate(missing, 1):
+                    nome_evento = evento.get('NOME DO EVENTO', '[sem nome]')
+                    tela = evento.get('TELA', '[sem tela]')
+                    write(f"### Evento Ausente #{i}\n")
+                    write(f"- **ID:** {evento['ID']}\n")
+                    write(f"- **Tela:** {tela}\n")
+                    write(f"- **Evento:** {nome_evento}\n")
+                    # Adicionar detalhes adicionais do evento que estava faltando
+                    for key, value in evento.items():
+                        if key not in ['ID', 'TELA', 'NOME DO EVENTO']:
+                            write(f"- **{key}:** {value}\n")
+                    write("\n")
+            else:
+                write("Nenhum evento ausente detectado na verificação atual.")
+
+            # Detalhamento dos eventos com propriedades incorretas
+            write("## ⚠️ DETALHAMENTO DOS EVENTOS COM PROPRIEDADES INCORRETAS\n")
+            write("==================================================\n")
+            if wrong_properties:
+                for i, erro in enumerate(wrong_properties, 1):
+                    nome_evento = erro['evento'].get('NOME DO EVENTO', '[sem nome]')
+                    tela = erro['evento'].get('TELA', '[sem tela]')
+                    write(f"### Evento #{i} com Propriedades Incorretas\n")
+                    write(f"- **ID:** {erro['ID']}\n")
+                    write(f"- **Tela:** {tela}\n")
+                    write(f"- **Evento:** {nome_evento}\n")
+                    write("#### Discrepâncias Detectadas:\n")
+                    for campo, diferenca in erro['diferencas'].items():
+                        write(f"{campo}:\n")
+                        write(f"- Esperado: {diferenca['esperado']}\n")
+                        write(f"+ Registrado: {diferenca['log']}\n")
+            else:
+                write("```\nNenhum erro de propriedades detectado na verificação atual.\n```\n\n")
+            
+            # Análise Geral detalhada e técnica
+            write("## 🔍 ANÁLISE TÉCNICA DETALHADA\n")
+            write("==================================================\n")
+            if ai_analysis:
+                write(f"{ai_analysis}\n")
+            else:
+                # Gerar análise básica mesmo sem IA
+                write("### Síntese da Validação\n")
+                if len(correct) == total:
+                    write("✅ **Resultado da Validação:** APROVADO\n\n")
+                    write("Todos os eventos foram implementados corretamente conforme as especificações.\n")
+                else:
+                    if len(missing) > 0 and len(wrong_properties) > 0:
+                        write("❌ **Resultado da Validação:** REPROVADO\n\n")
+                        write(f"Foram encontrados {len(missing)} eventos ausentes e {len(wrong_properties)} eventos com propriedades incorretas.\n")
+                    elif len(missing) > 0:
+                        write("❌ **Resultado da Validação:** REPROVADO\n\n" )
+                        write(f"Foram encontrados {len(missing)} eventos ausentes.\n")
+                    elif len(wrong_properties) > 0:
+                        write("⚠️ **Resultado da Validação:** REQUER ATENÇÃO\n\n")
+                        write(f"Foram encontrados {len(wrong_properties)} eventos com propriedades incorretas.\n")
+            
+                write("\n### Recomendações Técnicas\n")
+                if len(missing) > 0:
+                    write("1. **Para eventos ausentes:**\n")
+                    write("   - Verificar se os elementos existem no DOM da página\n")
+                    write("   - Confirmar a implementação dos gatilhos de eventos\n")
+                    write("   - Revisar as condições que ativam o disparo dos eventos\n")
+                if len(wrong_properties) > 0:
+                    write("2. **Para propriedades incorretas:**\n")
+                    write("   - Padronizar a nomenclatura dos campos conforme especificação\n")
+                    write("   - Revisar o mapeamento de dados entre a interface e o rastreamento\n")
+                    write("   - Implementar validações de formato nos campos críticos\n")
+
+            # Conclusão do relatório
+            write("\n## 📋 CONCLUSÃO\n")
+            write("==================================================\n")
             if len(correct) == total:
-                report_content += "✅ **Resultado da Validação:** APROVADO\n\n"
-                report_content += "Todos os eventos foram implementados corretamente conforme as especificações.\n"
+                write("✅ **VALIDAÇÃO APROVADA**\n\n")
+                write("O processo de validação foi concluído com sucesso. Todos os eventos estão implementados corretamente.\n")
+            elif len(correct) / total >= 0.9:
+                write("⚠️ **VALIDAÇÃO COM RESSALVAS**\n\n")
+                write(f"O processo de validação identificou {len(missing) + len(wrong_properties)} problemas que precisam de atenção, mas a implementação está majoritariamente correta ({correct_percent:.1f}%).\n")
             else:
-                if len(missing) > 0 and len(wrong_properties) > 0:
-                    report_content += "❌ **Resultado da Validação:** REPROVADO\n\n"
-                    report_content += f"Foram encontrados {len(missing)} eventos ausentes e {len(wrong_properties)} eventos com propriedades incorretas.\n"
-                elif len(missing) > 0:
-                    report_content += "❌ **Resultado da Validação:** REPROVADO\n\n" 
-                    report_content += f"Foram encontrados {len(missing)} eventos ausentes.\n"
-                elif len(wrong_properties) > 0:
-                    report_content += "⚠️ **Resultado da Validação:** REQUER ATENÇÃO\n\n"
-                    report_content += f"Foram encontrados {len(wrong_properties)} eventos com propriedades incorretas.\n"
-            
-            report_content += "\n### Recomendações Técnicas\n"
-            if len(missing) > 0:
-                report_content += "1. **Para eventos ausentes:**\n"
-                report_content += "   - Verificar se os elementos existem no DOM da página\n"
-                report_content += "   - Confirmar a implementação dos gatilhos de eventos\n"
-                report_content += "   - Revisar as condições que ativam o disparo dos eventos\n"
-            if len(wrong_properties) > 0:
-                report_content += "2. **Para propriedades incorretas:**\n"
-                report_content += "   - Padronizar a nomenclatura dos campos conforme especificação\n"
-                report_content += "   - Revisar o mapeamento de dados entre a interface e o rastreamento\n"
-                report_content += "   - Implementar validações de formato nos campos críticos\n"
-
-        # Conclusão do relatório
-        report_content += "\n## 📋 CONCLUSÃO\n"
-        report_content += "==================================================\n"
-        if len(correct) == total:
-            report_content += "✅ **VALIDAÇÃO APROVADA**\n\n"
-            report_content += "O processo de validação foi concluído com sucesso. Todos os eventos estão implementados corretamente.\n"
-        elif len(correct) / total >= 0.9:
-            report_content += "⚠️ **VALIDAÇÃO COM RESSALVAS**\n\n"
-            report_content += f"O processo de validação identificou {len(missing) + len(wrong_properties)} problemas que precisam de atenção, mas a implementação está majoritariamente correta ({correct_percent:.1f}%).\n"
-        else:
-            report_content += "❌ **VALIDAÇÃO REPROVADA**\n\n"
-            report_content += f"Foram identificados problemas significativos na implementação. Apenas {correct_percent:.1f}% dos eventos estão corretos.\n"
-        
-        # Assinatura e metadados
-        report_content += "\n==================================================\n"
-        report_content += "Relatório gerado automaticamente pelo Sistema de Validação de Eventos\n"
-        report_content += f"Versão: 1.0.2 | Data: {current_date} | Hora: {current_time}\n"
-        
-        self.file_handler.save_text(report_path, report_content)
+                write("❌ **VALIDAÇÃO REPROVADA**\n\n")
+                write(f"Foram identificados problemas significativos na implementação. Apenas {correct_percent:.1f}% dos eventos estão corretos.\n")
+            
+            # Assinatura e metadados
+            write("\n==================================================\n")
+            write("Relatório gerado automaticamente pelo Sistema de Validação de Eventos\n")
+            write(f"Versão: 1.0.2 | Data: {current_date} | Hora: {current_time}\n")
         return report_path
 
-    def generate_all_reports(self, spreadsheet_events, missing, wrong_properties, correct, ai_analysis):
+    def generate_all_reports(self, spreadsheet_events, missing, wrong_properties, correct, ai_analysis,
+                             occurrences=None):
         """
         Gera todos os relatórios (JSON, texto, dados do dashboard)
         
@@ -411,20 +1080,34 @@ class ReportGenerator:
             wrong_properties: Lista de eventos com propriedades erradas
             correct: Lista de eventos corretos
             ai_analysis: Análise gerada pela IA
+            occurrences: Contagem de ocorrências esperadas/encontradas por chave (opcional)
             
         Returns:
             Dicionário com dados do dashboard
         """
         # Cria relatórios JSON
-        self.file_handler.save_json(
-            os.path.join(self.output_dir, "ausentes_log.json"),
-            {"total_ausentes": len(missing), "eventos": missing}
-        )
+        if self.compact:
+            # Um único arquivo, com cada evento gravado uma vez (leitura: compact_report.load_compact_results)
+            results_name = "resultados.ndjson.gz" if self.use_gzip else "resultados.ndjson"
+            with self.file_handler.open_for_write(self.output_path(results_name), mode="wb") as f:
+                save_compact_results(f, missing, wrong_properties, use_gzip=self.use_gzip)
+        else:
+            self.file_handler.save_json(
+                self.output_path("ausentes_log.json"),
+                {"total_ausentes": len(missing), "eventos": missing}
+            )
 
-        self.file_handler.save_json(
-            os.path.join(self.output_dir, "propriedades_erradas.json"),
-            {"total_com_erro": len(wrong_properties), "eventos": wrong_properties}
-        )
+            self.file_handler.save_json(
+                self.output_path("propriedades_erradas.json"),
+                {"total_com_erro": len(wrong_properties), "eventos": wrong_properties}
+            )
+
+        if occurrences is not None:
+            self.file_handler.save_json(
+                self.output_path("ocorrencias_por_chave.json"),
+                {"total_chaves": len(occurrences), "chaves": occurrences},
+                compact=self.compact
+            )
 
         # Cria relatório de texto
         self.generate_text_report(spreadsheet_events, missing, wrong_properties, correct, ai_analysis)
@@ -447,7 +1130,7 @@ class ReportGenerator:
             })
 
         # Retorna dados do dashboard
-        return {
+        dashboard_data = {
             "resumo": {
                 "corretos": len(correct),
                 "ausentes": len(missing),
@@ -463,6 +1146,9 @@ class ReportGenerator:
             },
             "analise_ia": ai_analysis
         }
+        if occurrences is not None:
+            dashboard_data["ocorrencias_por_chave"] = occurrences
+        return dashboard_data
 
 
 class DirectoryManager:
@@ -472,7 +1158,8 @@ class DirectoryManager:
         """Inicializa com diretório do projeto"""
         self.project_dir = os.path.dirname(get_resource_path(__file__))
         
-    def create_output_directory(self, base_dir, functionality, subfunctionality=None, use_prefix=True):
+    def create_output_directory(self, base_dir, functionality, subfunctionality=None, use_prefix=True,
+                                report_name=None):
         """
         Cria um diretório de saída organizado por funcionalidade e subfuncionalidade
         
@@ -481,6 +1168,8 @@ class DirectoryManager:
             functionality: Nome da funcionalidade
             subfunctionality: Nome da subfuncionalidade, se disponível
             use_prefix: Se True, adiciona "relatorio-validacoes/eventos" ao caminho
+            report_name: Subdiretório adicional (ex.: nome da planilha), para separar
+                validações da mesma funcionalidade
             
         Returns:
             Caminho para o diretório de saída criado
@@ -507,6 +1196,9 @@ class DirectoryManager:
                 output_dir = os.path.join(base_dir, prefix_path, functionality_name)
             else:
                 output_dir = os.path.join(base_dir, functionality_name)
+        
+        if report_name:
+            output_dir = os.path.join(output_dir, self.sanitize_functionality_name(report_name))
             
         FileHandler.create_directory(output_dir)
         return output_dir
@@ -532,14 +1224,60 @@ class DirectoryManager:
 class TagValidator:
     """Classe principal para validação de tags entre dados de planilha e de log"""
     
-    def __init__(self):
-        """Inicializa componentes"""
+    def __init__(self, one_to_one=False, streaming=False, vectorized=False, use_ai=True, use_cache=False,
+                 mirror_dirs=None, compact_reports=False, gzip_reports=False, partial_match=False):
+        """
+        Inicializa componentes
+        
+        Args:
+            one_to_one: Se True, cada linha de log satisfaz no máximo um evento da planilha
+            streaming: Se True, o log é lido como fluxo e apenas a planilha fica em memória,
+                permitindo validar capturas maiores que a memória disponível
+            vectorized: Se True, usa o comparador vetorizado com pandas/NumPy
+            use_ai: Se False, não consulta a IA e o relatório traz apenas a análise básica
+            use_cache: Se True, planilhas e logs já carregados são lidos do cache em disco
+            mirror_dirs: Diretórios base adicionais onde os relatórios são publicados
+                (na estrutura funcionalidade[/subfuncionalidade], sem gerá-los novamente)
+            compact_reports: Se True, grava os resultados no formato compacto (resultados.ndjson)
+            gzip_reports: Se True, grava os resultados no formato compacto comprimido (resultados.ndjson.gz)
+            partial_match: Se True, eventos sem correspondência exata são comparados com o log mais
+                próximo e contados como com erro em vez de ausentes (o que pode mudar o resultado)
+            
+        Raises:
+            ValueError: Se os modos um-para-um e fluxo forem combinados
+        """
+        if one_to_one and streaming:
+            raise ValueError("O modo um-para-um não é suportado na validação em fluxo.")
+        self.streaming = streaming
+        self.use_cache = use_cache
+        self.mirror_dirs = list(mirror_dirs or [])
+        self.compact_reports = compact_reports
+        self.gzip_reports = gzip_reports
         self.directory_manager = DirectoryManager()
         self.file_handler = FileHandler()
-        self.comparator = EventComparator()
-        self.ai_analyzer = AIAnalyzer(api_key=API_KEY)
+        if vectorized:
+            # Importado sob demanda: o backend vetorizado depende deste módulo
+            from vectorized_comparator import VectorizedEventComparator
+            self.comparator = VectorizedEventComparator(partial_match=partial_match, one_to_one=one_to_one)
+        else:
+            self.comparator = EventComparator(partial_match=partial_match, one_to_one=one_to_one)
+        self.use_ai = use_ai
+        self._ai_analyzer = None
         
-    def process_files(self, spreadsheet_path, log_path, get_output_directory_func=None):
+    @property
+    def ai_analyzer(self):
+        """
+        Analisador de IA, criado no primeiro uso (None se a IA estiver desativada)
+        
+        O módulo ai_analyzer carrega requests e dotenv; importá-lo apenas aqui evita
+        esse custo na abertura da aplicação e em execuções sem IA.
+        """
+        if self._ai_analyzer is None and self.use_ai:
+            from ai_analyzer import AIAnalyzer
+            self._ai_analyzer = AIAnalyzer(api_key=API_KEY)
+        return self._ai_analyzer
+        
+    def process_files(self, spreadsheet_path, log_path, get_output_directory_func=None, report_name=None):
         """
         Processa arquivos CSV e gera relatórios
         
@@ -547,13 +1285,14 @@ class TagValidator:
             spreadsheet_path: Caminho para planilha CSV
             log_path: Caminho para log CSV
             get_output_directory_func: Função de callback para obter diretório de saída (opcional)
+            report_name: Subdiretório adicional dentro do diretório da funcionalidade (opcional),
+                para que validações da mesma funcionalidade não sobrescrevam os relatórios umas das outras
                 
         Returns:
             Tupla contendo (funcionalidade, output_dir, dashboard_data, dashboard_path)
         """
         # Carrega eventos
-        spreadsheet_events = self.file_handler.load_events_from_csv(spreadsheet_path)
-        log_events = self.file_handler.load_events_from_csv(log_path)
+        spreadsheet_events = self.file_handler.load_events_from_csv(spreadsheet_path, use_cache=self.use_cache)
         
         # Extrai nome da funcionalidade e subfuncionalidade para nomear pasta
         functionality = "default_funcionalidade"
@@ -565,34 +1304,60 @@ class TagValidator:
             subfunctionality = norm_event.get("SUBFUNCIONALIDADE", "")
             
         # Compara eventos
-        missing, wrong_properties, correct = self.comparator.compare(spreadsheet_events, log_events)
+        occurrences = None
+        if self.streaming:
+            # Apenas a planilha é indexada; o log é consumido linha a linha
+            log_events = self.file_handler.iter_events_from_csv(log_path)
+            missing, wrong_properties, correct = self.comparator.compare_stream(spreadsheet_events, log_events)
+        else:
+            log_events = self.file_handler.load_events_from_csv(log_path, use_cache=self.use_cache)
+            missing, wrong_properties, correct = self.comparator.compare(spreadsheet_events, log_events)
+            
+            # No modo um-para-um, registra ocorrências esperadas x encontradas por chave
+            if self.comparator.one_to_one:
+                occurrences = self.comparator.count_occurrences(spreadsheet_events, log_events)
         
         # Obtém análise abrangente da IA
-        ai_analysis = self.ai_analyzer.generate_comprehensive_analysis(
-            missing, 
-            wrong_properties, 
-            correct,
-            len(spreadsheet_events)
-        )
+        ai_analysis = None
+        if self.ai_analyzer is not None:
+            ai_analysis = self.ai_analyzer.generate_comprehensive_analysis(
+                missing, 
+                wrong_properties, 
+                correct,
+                len(spreadsheet_events)
+            )
         
         # Salva no diretório do projeto (com prefixo padrão)
         project_output_dir = self.directory_manager.create_output_directory(
             self.directory_manager.project_dir, 
             functionality,
             subfunctionality,
-            use_prefix=True  # use o prefixo padrão para o diretório do projeto
+            use_prefix=True,  # use o prefixo padrão para o diretório do projeto
+            report_name=report_name
         )
         
-        # Sempre gera relatórios no diretório do projeto
-        project_dashboard_data = self._generate_reports_in_directory(
+        # Os relatórios são gerados uma única vez, no diretório do projeto;
+        # os demais destinos recebem os mesmos arquivos publicados
+        project_dashboard_data, generated_files = self._generate_reports_in_directory(
             project_output_dir, 
             spreadsheet_events, 
             missing, 
             wrong_properties, 
             correct, 
-            ai_analysis
+            ai_analysis,
+            occurrences
         )
         
+        # Publica nos diretórios adicionais (ex.: arquivo, pasta compartilhada)
+        for mirror_dir in self.mirror_dirs:
+            try:
+                mirror_output_dir = self.directory_manager.create_output_directory(
+                    mirror_dir, functionality, subfunctionality, use_prefix=False, report_name=report_name
+                )
+                self._publish_reports(project_output_dir, mirror_output_dir, generated_files)
+            except OSError as e:
+                print(f"Erro ao publicar os relatórios em {mirror_dir}: {str(e)}")
+        
         # Determina o nome do diretório para exibição ao usuário
         display_directory_name = f"{functionality}/{subfunctionality}" if subfunctionality else functionality
         
@@ -611,21 +1376,15 @@ class TagValidator:
                     user_base_dir, 
                     functionality,
                     subfunctionality,
-                    use_prefix=False  # não use o prefixo para o diretório escolhido pelo usuário
+                    use_prefix=False,  # não use o prefixo para o diretório escolhido pelo usuário
+                    report_name=report_name
                 )
                 
-                # Gera relatórios no diretório do usuário
-                user_dashboard_data = self._generate_reports_in_directory(
-                    user_output_dir, 
-                    spreadsheet_events, 
-                    missing, 
-                    wrong_properties, 
-                    correct, 
-                    ai_analysis
-                )
+                # Publica no diretório do usuário os relatórios já gerados
+                self._publish_reports(project_output_dir, user_output_dir, generated_files)
                 
                 # Retorna valores para o diretório do usuário
-                return display_directory_name, user_output_dir, user_dashboard_data, os.path.join(user_output_dir, "dashboard.html")
+                return display_directory_name, user_output_dir, project_dashboard_data, os.path.join(user_output_dir, "dashboard.html")
             
             except Exception as e:
                 print(f"Erro ao salvar no diretório do usuário: {str(e)}")
@@ -636,7 +1395,8 @@ class TagValidator:
         # retorna apenas os dados do diretório do projeto
         return display_directory_name, project_output_dir, project_dashboard_data, os.path.join(project_output_dir, "dashboard.html")
         
-    def _generate_reports_in_directory(self, output_dir, spreadsheet_events, missing, wrong_properties, correct, ai_analysis):
+    def _generate_reports_in_directory(self, output_dir, spreadsheet_events, missing, wrong_properties, correct, ai_analysis,
+                                       occurrences=None):
         """
         Gera todos os relatórios em um diretório específico
         
@@ -647,22 +1407,52 @@ class TagValidator:
             wrong_properties: Lista de eventos com propriedades erradas
             correct: Lista de eventos corretos
             ai_analysis: Análise gerada pela IA
+            occurrences: Contagem de ocorrências por chave (opcional)
             
         Returns:
-            Dicionário com dados do dashboard
+            Tupla (dados do dashboard, arquivos gerados relativos a output_dir)
         """
         # Cria o diretório se não existir
         os.makedirs(output_dir, exist_ok=True)
         
         # Gera relatórios
-        report_generator = ReportGenerator(output_dir)
+        report_generator = ReportGenerator(output_dir, compact=self.compact_reports, use_gzip=self.gzip_reports)
         dashboard_data = report_generator.generate_all_reports(
-            spreadsheet_events, missing, wrong_properties, correct, ai_analysis
+            spreadsheet_events, missing, wrong_properties, correct, ai_analysis, occurrences
         )
         
         # Gera dashboard
         template_dashboard = get_resource_path("template_dashboard.html")
-        dashboard_output = os.path.join(output_dir, "dashboard.html")
+        dashboard_output = report_generator.output_path("dashboard.html")
         report_generator.generate_dashboard(dashboard_data, template_dashboard, dashboard_output)
         
-        return dashboard_data
\ No newline at end of file
+        # O diretório é reaproveitado entre validações: remove o que esta não gerou
+        # (ex.: ausentes_log.json de uma validação anterior sem o formato compacto)
+        self.file_handler.remove_files(output_dir, self._stale_reports(report_generator.generated_files))
+        
+        return dashboard_data, report_generator.generated_files
+
+    @staticmethod
+    def _stale_reports(generated_files):
+        """
+        Lista os artefatos de relatório que a validação atual não gerou
+        
+        Args:
+            generated_files: Arquivos gerados, relativos ao diretório de saída
+            
+        Returns:
+            Lista de caminhos relativos de ReportGenerator.REPORT_FILES ausentes de generated_files
+        """
+        return [path for path in ReportGenerator.REPORT_FILES if path not in generated_files]
+
+    def _publish_reports(self, source_dir, destination_dir, generated_files):
+        """
+        Publica os relatórios gerados em outro diretório e remove dele os de validações anteriores
+        
+        Args:
+            source_dir: Diretório onde os relatórios foram gerados
+            destination_dir: Diretório de destino
+            generated_files: Arquivos gerados, relativos a source_dir
+        """
+        self.file_handler.publish_files(source_dir, destination_dir, generated_files)
+        self.file_handler.remove_files(destination_dir, self._stale_reports(generated_files))
\ No newline at end of file
@@ -15,46 +15,67 @@ from multiprocessing import process
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
+import queue
 import threading
-import webbrowser
 import time
 import subprocess
 from datetime import datetime
 
 # Importando os módulos auxiliares
-from devices import AdbHelper, DeviceManager, IosDeviceHelper
-from log_processor import LogProcessor
+# (a camada de dispositivos é importada sob demanda, ao abrir o monitor de logs)
+from log_processor import LogLineFilter, LogProcessor, PayloadLineJoiner, load_filter_config
+from capture_buffer import CaptureBuffer
+from log_viewer import LogViewer
 from file_utils import FileHelper
 from dialog_utils import DialogHelper
 
+# Intervalo entre as atualizações do widget de logs e limite de linhas exibidas por atualização
+LOG_PUMP_INTERVAL_MS = 50
+LOG_PUMP_MAX_LINES = 500
+
 class ValidationApp:
     """
     Aplicação principal para validação de tagueamento.
     """
 
-    def __init__(self, validator):
+    def __init__(self, validator, capture_options=None):
         """
         Inicializa a aplicação com um validador.
         
         Args:
             validator: Objeto responsável pela validação de tagueamento
+            capture_options (dict): Argumentos do CaptureBuffer (segment_size, directory)
         """
         self.validator = validator
         self.root = None
         self.monitoring_thread = None
         self.is_monitoring = False
         self.is_paused = False
-        self.collected_logs = []
+        # Linhas capturadas, em segmentos no disco (o widget de logs guarda apenas o final)
+        self.collected_logs = CaptureBuffer(**(capture_options or {}))
+        # Linhas a exibir, produzidas pela thread de leitura e consumidas pela interface
+        self.log_queue = queue.Queue()
+        self.log_pump_job = None
         self.adb_process = None
         self.ios_process = None
         self.device_data = []
         
         # Inicialização dos helpers
         self.log_processor = LogProcessor()
-        self.adb_helper = AdbHelper()
+        self._adb_helper = None
         self.file_helper = FileHelper()
         self.dialog_helper = DialogHelper()
 
+    @property
+    def adb_helper(self):
+        """
+        Helper do ADB, criado no primeiro uso.
+        """
+        if self._adb_helper is None:
+            from devices import AdbHelper
+            self._adb_helper = AdbHelper()
+        return self._adb_helper
+
     def run(self):
         """
         Inicializa e executa a aplicação principal.
@@ -72,7 +93,11 @@ class ValidationApp:
         
         self.configure_style()
         self.setup_main_menu()
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            # Remove os segmentos temporários da última captura
+            self.collected_logs.clear()
 
     def configure_style(self):
         """
@@ -271,6 +296,7 @@ class ValidationApp:
                 if messagebox.askyesno("Concluído", 
                                       f"Validação concluída com sucesso! Relatórios salvos em:\n{output_dir}\n\n"
                                       f"Deseja abrir o dashboard de resultados?"):
+                    import webbrowser
                     webbrowser.open(f"file://{dashboard_path}")
             except Exception as e:
                 self.root.after(0, lambda: messagebox.showerror("Erro", f"Erro durante a validação: {str(e)}"))
@@ -314,14 +340,9 @@ class ValidationApp:
         log_frame = ttk.LabelFrame(monitor_frame, text="Logs")
         log_frame.pack(fill="both", expand=True, pady=10)
         
-        # Área de texto para exibir logs
-        self.log_text = tk.Text(log_frame, height=15, bg="#1e1e1e", fg="white")
-        self.log_text.pack(fill="both", expand=True, padx=5, pady=5, side="left")
-        
-        # Scrollbar para a área de texto
-        scrollbar = ttk.Scrollbar(log_frame, command=self.log_text.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.log_text.config(yscrollcommand=scrollbar.set)
+        # Área de logs: mantém só o final da captura; busca e histórico vêm do buffer de captura
+        self.log_viewer = LogViewer(log_frame, self.collected_logs, padding=0)
+        self.log_viewer.pack(fill="both", expand=True)
         
         # Botões de controle
         control_frame = ttk.Frame(monitor_frame)
@@ -347,14 +368,20 @@ class ValidationApp:
         self.start_btn.pack(side="right", padx=5)
         
         # Inicializa valores
-        self.collected_logs = []
+        self.collected_logs.clear()
         self.is_monitoring = False
         self.is_paused = False
         
+        # Inicia a atualização periódica do widget de logs
+        if self.log_pump_job is None:
+            self.log_pump_job = self.root.after(LOG_PUMP_INTERVAL_MS, self.pump_log_queue)
+        
     def check_devices(self):
         """
         Verifica e lista os dispositivos Android e iOS conectados.
         """
+        from devices import DeviceManager, IosDeviceHelper
+
         try:
             # Usar o DeviceManager para verificar ambos os tipos de dispositivos
             all_devices = DeviceManager.get_all_connected_devices()
@@ -409,8 +436,9 @@ class ValidationApp:
         
         self.is_monitoring = True
         self.is_paused = False
-        self.log_text.delete(1.0, tk.END)
-        self.collected_logs = []
+        self.log_viewer.clear()
+        self.discard_log_queue()
+        self.collected_logs.clear()
         
         # Atualiza estado dos botões
         self.start_btn.config(text="Finalizar", command=self.stop_monitoring)
@@ -430,8 +458,7 @@ class ValidationApp:
             # Retomar monitoramento
             self.is_paused = False
             self.pause_btn.config(text="Pausar")
-            self.log_text.insert(tk.END, "\n[Monitoramento retomado]\n")
-            self.log_text.see(tk.END)
+            self.update_log_text("\n[Monitoramento retomado]\n")
             
             # Verifica qual plataforma está sendo usada
             selected_device_display = self.device_var.get()
@@ -458,8 +485,7 @@ class ValidationApp:
             # Pausar monitoramento
             self.is_paused = True
             self.pause_btn.config(text="Retomar")
-            self.log_text.insert(tk.END, "\n[Monitoramento pausado]\n")
-            self.log_text.see(tk.END)
+            self.update_log_text("\n[Monitoramento pausado]\n")
             
             # Verifica qual plataforma está sendo usada
             selected_device_display = self.device_var.get()
@@ -475,6 +501,7 @@ class ValidationApp:
                 self.adb_helper.stop_logcat(self.adb_process)
                 self.adb_process = None
             elif selected_platform == "ios" and self.ios_process and self.ios_process.poll() is None:
+                from devices import DeviceManager
                 DeviceManager.stop_logging(process, 'ios')
                 self.ios_process = None
 
@@ -499,6 +526,7 @@ class ValidationApp:
             self.adb_helper.stop_logcat(self.adb_process)
             self.adb_process = None
         elif selected_platform == "ios" and self.ios_process and self.ios_process.poll() is None:
+            from devices import IosDeviceHelper
             IosDeviceHelper.stop_ios_logging(self.ios_process)
             self.ios_process = None
         
@@ -514,13 +542,14 @@ class ValidationApp:
         if self.collected_logs:
             self.save_btn.config(state="normal")
         
-        self.log_text.insert(tk.END, "\n[Monitoramento finalizado]\n")
-        self.log_text.see(tk.END)
+        self.update_log_text("\n[Monitoramento finalizado]\n")
 
     def monitor_logs(self):
         """
         Thread que monitora logs do dispositivo selecionado e filtra eventos de tagueamento.
         """
+        from devices import IosDeviceHelper
+
         try:
             # Encontra o dispositivo selecionado
             selected_device_display = self.device_var.get()
@@ -542,15 +571,24 @@ class ValidationApp:
             
             # Log inicial informando o início do monitoramento
             start_message = f"\n[Iniciando monitoramento de logs para {platform.upper()}: {device_name} ({device_id})]\n"
-            self.root.after(0, lambda msg=start_message: self.update_log_text(msg))
+            self.update_log_text(start_message)
+            
+            # Filtros da plataforma: no dispositivo (opcionais) e nas linhas lidas, montados uma vez por captura
+            filter_options = load_filter_config().get(platform, {})
+            device_filter = filter_options.get("dispositivo", {})
+            line_filter = LogLineFilter.from_options(filter_options)
             
             if platform == "android":
                 # Para dispositivos Android, usamos ADB logcat
-                self.adb_process = self.adb_helper.start_logcat(device_id)
+                self.adb_process = self.adb_helper.start_logcat(
+                    device_id,
+                    filter_specs=device_filter.get("filtros"),
+                    regex=device_filter.get("regex")
+                )
                 
                 if not self.adb_process:
                     error_msg = "[Erro ao iniciar ADB logcat]\n"
-                    self.root.after(0, lambda msg=error_msg: self.update_log_text(msg))
+                    self.update_log_text(error_msg)
                     return
                 
                 # Lê e exibe as linhas em tempo real
@@ -564,17 +602,18 @@ class ValidationApp:
                         time.sleep(0.1)
                         continue
                     
+                    # Filtra antes de qualquer cópia: a maior parte do logcat é descartada aqui
+                    if not line_filter.matches(line):
+                        continue
+                    
                     # Trata caracteres inválidos na linha
                     try:
                         # Limpa a linha de caracteres problemáticos
                         clean_line = line.encode('utf-8', 'replace').decode('utf-8')
+                        self.collected_logs.append(clean_line)
                         
-                        # Filtra e processa a linha de log
-                        if any(tag in clean_line for tag in ['TAG_EVENTO', 'analytics', 'Analytics', 'evento']):
-                            self.collected_logs.append(clean_line)
-                            
-                            # Atualiza a interface em thread segura
-                            self.root.after(0, lambda l=clean_line: self.update_log_text(l))
+                        # Enfileira para exibição; a interface é atualizada em lotes
+                        self.update_log_text(clean_line)
                         
                     except UnicodeError:
                         # Caso ainda haja erro, ignora a linha problemática
@@ -582,13 +621,20 @@ class ValidationApp:
             
             elif platform == "ios":
                 # Para dispositivos iOS, usamos libimobiledevice
-                self.ios_process = IosDeviceHelper.start_ios_logging(device_id)
+                self.ios_process = IosDeviceHelper.start_ios_logging(
+                    device_id,
+                    processes=device_filter.get("processos"),
+                    matches=device_filter.get("filtros")
+                )
                 
                 if not self.ios_process:
                     error_msg = "[Erro ao iniciar monitoramento de logs iOS]\n"
-                    self.root.after(0, lambda msg=error_msg: self.update_log_text(msg))
+                    self.update_log_text(error_msg)
                     return
                 
+                # Eventos do Firebase trazem os parâmetros em várias linhas: junta antes de filtrar
+                joiner = PayloadLineJoiner()
+                
                 # Lê e exibe as linhas em tempo real
                 for line in iter(self.ios_process.stdout.readline, ''):
                     if not self.is_monitoring:
@@ -600,19 +646,24 @@ class ValidationApp:
                         time.sleep(0.1)
                         continue
                     
+                    line = joiner.feed(line)
+                    if line is None:
+                        continue
+                    
+                    # Filtra antes de qualquer cópia (palavras-chave configuráveis em filtro_logs.json)
+                    if not line_filter.matches(line):
+                        continue
+                    
                     # Trata caracteres inválidos na linha
                     try:
                         # Limpa a linha de caracteres problemáticos
                         clean_line = line.encode('utf-8', 'replace').decode('utf-8')
+                        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+                        formatted_line = f"{timestamp} [{platform.upper()}] {clean_line}"
+                        self.collected_logs.append(formatted_line)
                         
-                        # Filtra e processa a linha de log - ajuste os tags conforme necessário para iOS
-                        if any(tag in clean_line.lower() for tag in ['tag_evento', 'analytics', 'evento', 'firebase']):
-                            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-                            formatted_line = f"{timestamp} [{platform.upper()}] {clean_line}"
-                            self.collected_logs.append(formatted_line)
-                            
-                            # Atualiza a interface em thread segura
-                            self.root.after(0, lambda l=formatted_line: self.update_log_text(l))
+                        # Enfileira para exibição; a interface é atualizada em lotes
+                        self.update_log_text(formatted_line)
                     
                     except UnicodeError:
                         # Caso ainda haja erro, ignora a linha problemática
@@ -626,7 +677,7 @@ class ValidationApp:
             
         except Exception as e:
             error_msg = f"\n[Erro ao monitorar logs: {str(e)}]\n"
-            self.root.after(0, lambda msg=error_msg: self.update_log_text(msg))
+            self.update_log_text(error_msg)
             self.is_monitoring = False
             self.adb_process = None
             self.ios_process = None
@@ -634,13 +685,50 @@ class ValidationApp:
 
     def update_log_text(self, line):
         """
-        Atualiza o widget de texto com uma nova linha de log.
+        Enfileira uma linha para exibição no widget de logs.
+        
+        Pode ser chamado de qualquer thread: o widget só é alterado por pump_log_queue,
+        na thread da interface.
         
         Args:
             line (str): Linha de log a ser adicionada ao widget de texto
         """
-        self.log_text.insert(tk.END, line)
-        self.log_text.see(tk.END)
+        self.log_queue.put(line)
+
+    def discard_log_queue(self):
+        """
+        Descarta as linhas ainda não exibidas.
+        """
+        try:
+            while True:
+                self.log_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def pump_log_queue(self):
+        """
+        Exibe as linhas enfileiradas no visualizador de logs, uma inserção por lote.
+        
+        No máximo LOG_PUMP_MAX_LINES linhas são exibidas por vez; o restante fica para as
+        próximas execuções, que são agendadas enquanto a janela de monitoramento existir.
+        """
+        if not self.log_viewer.winfo_exists():
+            # A janela de monitoramento foi fechada
+            self.log_pump_job = None
+            self.discard_log_queue()
+            return
+
+        lines = []
+        try:
+            while len(lines) < LOG_PUMP_MAX_LINES:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if lines:
+            self.log_viewer.append("".join(lines))
+
+        self.log_pump_job = self.root.after(LOG_PUMP_INTERVAL_MS, self.pump_log_queue)
 
     def save_logs(self):
         """
@@ -652,13 +740,13 @@ class ValidationApp:
             self.dialog_helper.show_empty_logs_dialog(self.root)
             return
         
-        # Agrupa logs por funcionalidade e subfuncionalidade
-        logs_by_functionality = self.log_processor.group_logs_by_functionality(self.collected_logs)
+        # Cada exportação relê a captura dos segmentos e grava as linhas à medida que
+        # são decodificadas, sem agrupá-las em memória
         
         # 1. Salvar no diretório padrão do projeto (sem informar ao usuário)
         try:
             logs_base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs", "eventos")
-            self.file_helper.save_logs_to_directory(logs_by_functionality, logs_base_dir, self.log_processor)
+            self.file_helper.export_logs_to_directory(self.collected_logs, logs_base_dir, self.log_processor)
         except Exception as e:
             print(f"Erro ao salvar no diretório do projeto: {str(e)}")
         
@@ -671,8 +759,8 @@ class ValidationApp:
             
             if custom_dir:
                 custom_logs_dir = os.path.join(custom_dir, "logs", "eventos")
-                files_saved = self.file_helper.save_logs_to_directory(
-                    logs_by_functionality, 
+                files_saved = self.file_helper.export_logs_to_directory(
+                    self.collected_logs,
                     custom_logs_dir,
                     self.log_processor
                 )
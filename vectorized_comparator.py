@@ -0,0 +1,286 @@
+"""
+Este arquivo contém o backend vetorizado de comparação de eventos, baseado em pandas/NumPy.
+Responsabilidades:
+- Normalização em lote das colunas de KEY_FIELDS
+- Junção entre planilha e log por ID ou pela tupla de campos-chave
+- Cálculo das diferenças por campo como uma única matriz booleana
+
+O resultado é idêntico ao do EventComparator, que continua sendo a implementação de referência.
+pandas é opcional: só é importado quando este backend é usado.
+"""
+
+from tag_validator import BLOCK_FIELDS, KEY_FIELDS, EventComparator
+from event_store import EventTable
+
+
+class VectorizedEventComparator(EventComparator):
+    """
+    Comparador de eventos que processa as colunas em bloco com pandas/NumPy.
+    """
+
+    @staticmethod
+    def _import_backend():
+        """
+        Importa pandas e NumPy sob demanda.
+
+        Returns:
+            tuple: Módulos (pandas, numpy)
+
+        Raises:
+            ImportError: Se pandas ou NumPy não estiverem instalados
+        """
+        try:
+            import numpy as np
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("O backend vetorizado requer pandas e numpy instalados.") from e
+        return pd, np
+
+    @staticmethod
+    def _raw_column(events, field):
+        """
+        Obtém os valores brutos de uma coluna de KEY_FIELDS.
+
+        Args:
+            events: EventTable ou lista de eventos
+            field: Nome do campo
+
+        Returns:
+            list: Valores da coluna (None para ausentes)
+        """
+        if isinstance(events, EventTable):
+            return events.columns.get(field, [None] * len(events))
+        return [event.get(field) for event in events]
+
+    @staticmethod
+    def _encode(pd, np, plan_events, log_events):
+        """
+        Normaliza as colunas de KEY_FIELDS em lote e as codifica como inteiros.
+
+        Cada coluna da planilha e do log é fatorada em conjunto; o .str.strip() é aplicado
+        apenas aos valores distintos, e valores que ficam iguais após a normalização
+        recebem o mesmo código.
+
+        Args:
+            pd: Módulo pandas
+            np: Módulo numpy
+            plan_events: Lista de eventos da planilha
+            log_events: EventTable ou lista de eventos do log
+
+        Returns:
+            tuple: (códigos da planilha, códigos do log, valores normalizados por campo)
+        """
+        size = len(plan_events)
+        plan_codes = []
+        log_codes = []
+        labels = []
+        for field in KEY_FIELDS:
+            raw = pd.Series(
+                VectorizedEventComparator._raw_column(plan_events, field)
+                + list(VectorizedEventComparator._raw_column(log_events, field)),
+                dtype=object
+            ).fillna("")
+            codes, uniques = pd.factorize(raw)
+            stripped = pd.Series(uniques, dtype=object).astype(str).str.strip()
+            unique_codes, field_labels = pd.factorize(stripped)
+            codes = unique_codes[codes]
+            plan_codes.append(codes[:size])
+            log_codes.append(codes[size:])
+            labels.append(np.asarray(field_labels, dtype=object))
+        return np.column_stack(plan_codes), np.column_stack(log_codes), labels
+
+    @staticmethod
+    def _log_ids(log_events):
+        """
+        Obtém os IDs normalizados dos eventos de log.
+
+        Args:
+            log_events: EventTable ou lista de eventos do log
+
+        Returns:
+            list: IDs como texto (None quando o evento não tem ID)
+        """
+        if isinstance(log_events, EventTable):
+            return [str(i) for i in range(1, len(log_events) + 1)]
+        return [str(e["ID"]).strip() if e.get("ID") is not None else ("" if "ID" in e else None)
+                for e in log_events]
+
+    @staticmethod
+    def _first_positions(np, log_index, plan_index):
+        """
+        Localiza, para cada chave da planilha, a posição do primeiro log com a mesma chave.
+
+        Args:
+            np: Módulo numpy
+            log_index: pandas.Index com as chaves do log
+            plan_index: pandas.Index com as chaves da planilha
+
+        Returns:
+            numpy.ndarray: Posições no log, ou -1 quando não há correspondência
+        """
+        first = ~log_index.duplicated(keep="first")
+        positions = np.flatnonzero(first)
+        if not len(positions):
+            return np.full(len(plan_index), -1)
+        found = log_index[first].get_indexer(plan_index)
+        return np.where(found >= 0, positions[found], -1)
+
+    @staticmethod
+    def _row_ids(pd, np, codes):
+        """
+        Atribui o mesmo identificador inteiro a linhas com a mesma combinação de códigos.
+
+        Args:
+            pd: Módulo pandas
+            np: Módulo numpy
+            codes: Matriz de códigos (uma linha por evento)
+
+        Returns:
+            numpy.ndarray: Identificador de cada linha
+        """
+        rows = np.zeros(len(codes), dtype=np.int64)
+        for column in codes.T:
+            # Refatora a cada coluna para manter os identificadores pequenos (sem estouro)
+            rows, _ = pd.factorize(rows * (int(column.max(initial=0)) + 1) + column)
+        return rows
+
+    @staticmethod
+    def _first_key_positions(pd, np, plan_codes, log_codes):
+        """
+        Localiza, para cada evento da planilha, o primeiro log com a mesma tupla de campos-chave.
+
+        Args:
+            pd: Módulo pandas
+            np: Módulo numpy
+            plan_codes: Matriz de códigos da planilha
+            log_codes: Matriz de códigos do log
+
+        Returns:
+            numpy.ndarray: Posições no log, ou -1 quando não há correspondência
+        """
+        if not len(log_codes) or not len(plan_codes):
+            return np.full(len(plan_codes), -1)
+        rows = VectorizedEventComparator._row_ids(pd, np, np.vstack([plan_codes, log_codes]))
+        plan_rows, log_rows = rows[:len(plan_codes)], rows[len(plan_codes):]
+        first = np.full(rows.max() + 1, -1)
+        keys, first_positions = np.unique(log_rows, return_index=True)
+        first[keys] = first_positions
+        return first[plan_rows]
+
+    @staticmethod
+    def _closest_positions(pd, np, plan_codes, log_codes, rows):
+        """
+        Busca, para os eventos informados, o log do mesmo bloco com menos campos divergentes.
+
+        Args:
+            pd: Módulo pandas
+            np: Módulo numpy
+            plan_codes: Matriz de códigos da planilha
+            log_codes: Matriz de códigos do log
+            rows: Posições dos eventos da planilha sem correspondência exata
+
+        Returns:
+            numpy.ndarray: Posições no log, ou -1 quando o bloco está vazio
+        """
+        closest = np.full(len(rows), -1)
+        if not len(rows) or not len(log_codes):
+            return closest
+        block_columns = [KEY_FIELDS.index(field) for field in BLOCK_FIELDS]
+        blocks = VectorizedEventComparator._row_ids(
+            pd, np, np.vstack([plan_codes[:, block_columns], log_codes[:, block_columns]])
+        )
+        plan_blocks, log_blocks = blocks[:len(plan_codes)], blocks[len(plan_codes):]
+        # Ordenação estável: dentro de cada bloco os logs seguem a ordem de captura
+        order = np.argsort(log_blocks, kind="stable")
+        sorted_blocks = log_blocks[order]
+        for i, row in enumerate(rows):
+            start = np.searchsorted(sorted_blocks, plan_blocks[row], side="left")
+            end = np.searchsorted(sorted_blocks, plan_blocks[row], side="right")
+            if start == end:
+                continue
+            candidates = order[start:end]
+            scores = (log_codes[candidates] != plan_codes[row]).sum(axis=1)
+            # argmin devolve o primeiro mínimo: em caso de empate, prevalece o primeiro log capturado
+            closest[i] = candidates[scores.argmin()]
+        return closest
+
+    def compare(self, spreadsheet_events, log_events):
+        """
+        Compara eventos entre planilha e log usando operações vetorizadas
+
+        Args:
+            spreadsheet_events: Lista de eventos da planilha
+            log_events: Lista de eventos dos logs
+
+        Returns:
+            Tupla contendo listas de (ausentes, propriedades_erradas, corretos)
+        """
+        # O consumo um-para-um depende da ordem de processamento: usa a referência
+        if self.one_to_one:
+            return super().compare(spreadsheet_events, log_events)
+
+        pd, np = self._import_backend()
+        events = list(spreadsheet_events)
+        plan_codes, log_codes, labels = self._encode(pd, np, events, log_events)
+
+        # Correspondência por ID e, na falta dela, pela tupla completa de campos-chave
+        plan_ids = pd.Index([str(event.get("ID")) for event in events], dtype=object)
+        by_id = self._first_positions(np, pd.Index(self._log_ids(log_events), dtype=object), plan_ids)
+        by_key = self._first_key_positions(pd, np, plan_codes, log_codes)
+        match_positions = np.where(by_id >= 0, by_id, by_key)
+
+        # Sem correspondência exata, usa o log mais próximo do mesmo bloco
+        if self.partial_match:
+            unmatched = np.flatnonzero(match_positions < 0)
+            match_positions[unmatched] = self._closest_positions(pd, np, plan_codes, log_codes, unmatched)
+
+        # Matriz de diferenças: uma linha por evento da planilha, uma coluna por campo-chave
+        matched = match_positions >= 0
+        diff_mask = plan_codes[matched] != log_codes[match_positions[matched]]
+
+        results = []
+        matched_row = 0
+        for position, event in enumerate(events):
+            if not matched[position]:
+                results.append(("ausente", event))
+                continue
+
+            row_mask = diff_mask[matched_row]
+            log_position = match_positions[position]
+            matched_row += 1
+            if not row_mask.any():
+                results.append(("correto", event))
+                continue
+
+            diffs = {}
+            for column in row_mask.nonzero()[0]:
+                expected = labels[column][plan_codes[position, column]]
+                found = labels[column][log_codes[log_position, column]]
+                diffs[KEY_FIELDS[column]] = {
+                    "esperado": expected if expected else "[não definido]",
+                    "log": found if found else "[não definido]"
+                }
+            results.append(("com_erro", {
+                "ID": event["ID"],
+                "evento": event,
+                "log": self._normalized_log(log_events, log_position),
+                "diferencas": diffs
+            }))
+
+        return self._split_results(results)
+
+    def _normalized_log(self, log_events, position):
+        """
+        Retorna o log normalizado de uma posição, no mesmo formato do comparador de referência.
+
+        Args:
+            log_events: EventTable ou lista de eventos do log
+            position: Posição do log
+
+        Returns:
+            dict: Evento de log normalizado
+        """
+        log_event = log_events[int(position)]
+        if isinstance(log_events, EventTable):
+            return log_event.normalized()
+        return self.normalize_event(log_event)